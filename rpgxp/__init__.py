@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 import functools as ft
-import importlib.resources
+import os
 from pathlib import Path
 from typing import TypedDict, Self
 
@@ -9,8 +9,9 @@ class ConfigError(Exception):
 
 @ft.cache
 def _package_root() -> Path:
-	with importlib.resources.path('rpgxp') as result:
-		return result
+	# importlib.resources would take longer to import than the rest of the
+	# package put together
+	return Path(__file__).resolve().parent
 
 @ft.cache
 def _project_root() -> Path:
@@ -18,6 +19,12 @@ def _project_root() -> Path:
 
 @ft.cache
 def _settings_path() -> Path:
+	# used by the benchmark suite to point everything at a synthetic game
+	override = os.environ.get('RPGXP_SETTINGS')
+
+	if override:
+		return Path(override)
+
 	return _project_root() / 'settings.ini'
 
 _SettingsDict = TypedDict('_SettingsDict', {
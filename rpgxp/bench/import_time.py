@@ -0,0 +1,135 @@
+"""Benchmark for how long the modules behind the quicker commands take to
+import, which is most of the time it takes for those commands to start.
+
+Run with `python -m rpgxp.bench.import_time`. Each module is imported in a
+fresh interpreter with `-X importtime`, a few times over, and the fastest
+import is reported, together with the modules it imported which took the
+most time themselves (which are the first places to look when a module gets
+slower to import). Modules which can't be imported, e.g. because
+ruby_marshal_parser isn't installed, are reported as failed."""
+
+from dataclasses import dataclass
+import re
+import subprocess
+import sys
+import time
+
+MODULES = (
+    'rpgxp',
+    'rpgxp.db',
+    'rpgxp.parse',
+    'rpgxp.lazy',
+    'rpgxp.site.common',
+    'rpgxp.route.routes',
+    'rpgxp.site.serve_dynamic',
+    'rpgxp.site.generate',
+    'rpgxp.script.run',
+)
+"""The modules which are imported by default. (rpgxp.script.db_shell isn't
+one of them, since it starts the shell when it's imported; it imports
+apsw.shell and rpgxp.db.)"""
+
+IMPORT_TIME_LINE = re.compile(
+    r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$'
+)
+
+@dataclass
+class Import:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+@dataclass
+class Measurement:
+    module: str
+    wall_seconds: float
+    """The time the interpreter took to run, from start to exit."""
+    imports: list[Import]
+
+    @property
+    def cumulative_us(self) -> int:
+        for imp in self.imports:
+            if imp.module == self.module and imp.depth == 0:
+                return imp.cumulative_us
+
+        return 0
+
+def measure(module: str) -> Measurement:
+    start = time.perf_counter()
+
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True
+    )
+
+    wall_seconds = time.perf_counter() - start
+
+    if completed.returncode:
+        stderr_lines = completed.stderr.strip().splitlines()
+        raise RuntimeError(stderr_lines[-1] if stderr_lines else module)
+
+    imports = []
+
+    for line in completed.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+
+        if match is not None:
+            self_us, cumulative_us, indent, name = match.groups()
+
+            imports.append(Import(
+                name, int(self_us), int(cumulative_us), len(indent) // 2
+            ))
+
+    return Measurement(module, wall_seconds, imports)
+
+def run(modules: list[str], repeat: int, top: int) -> None:
+    print(f'{"module":>26} {"import":>10} {"process":>10}')
+
+    for module in modules:
+        try:
+            measurements = [measure(module) for _ in range(repeat)]
+        except RuntimeError as e:
+            print(f'{module:>26} {"failed":>10} {e}')
+            continue
+
+        fastest = min(measurements, key=lambda m: m.cumulative_us)
+
+        print(
+            f'{module:>26} {fastest.cumulative_us / 1000:>8.1f}ms '
+            f'{min(m.wall_seconds for m in measurements) * 1000:>8.1f}ms'
+        )
+
+        slowest_imports = sorted(
+            fastest.imports, key=lambda imp: imp.self_us, reverse=True
+        )
+
+        for imp in slowest_imports[:top]:
+            print(f'{"":>26} {imp.self_us / 1000:>8.1f}ms   {imp.module}')
+
+if __name__ == '__main__':
+    import argparse
+
+    arg_parser = argparse.ArgumentParser()
+
+    arg_parser.add_argument('modules', nargs='*', help=(
+        'modules to import (by default, the ones behind the quicker '
+        'commands)'
+    ))
+
+    arg_parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='number of times to import each module'
+    )
+
+    arg_parser.add_argument('--top', type=int, default=0, help=(
+        'also list this many of the imported modules which took the most '
+        'time themselves'
+    ))
+
+    parsed_args = arg_parser.parse_args()
+
+    run(
+        parsed_args.modules or list(MODULES), parsed_args.repeat,
+        parsed_args.top
+    )
@@ -0,0 +1,116 @@
+"""Benchmark for the materialization of the material_best_file view.
+
+Run with `python -m rpgxp.bench.material_best_file`. For each material count,
+a database is filled with synthetic material files, and the time taken to
+materialize the view is measured, both with the window-function query used by
+`material.MATERIALIZED_VIEWS` and with the correlated subquery it replaced."""
+
+import random
+import time
+import apsw
+from rpgxp import material
+
+CORRELATED_QUERY = '''DELETE FROM material_best_file__materialized;
+INSERT INTO material_best_file__materialized (
+    type, subtype, name, source, extension, full_name
+) SELECT
+    m.type, m.subtype, m.name, m.source, m.extension, m.name || m.extension
+FROM material_file m
+JOIN material_source s on s.name = m.source
+WHERE NOT EXISTS (
+    SELECT * FROM material_file m2
+    JOIN material_source s2 on s2.name = m2.source
+    WHERE m2.type = m.type AND m2.subtype = m.subtype AND m2.name = m.name
+    AND (
+        s2.priority > s.priority
+        OR (s2.priority = s.priority AND m2.extension < m.extension)
+    )
+);
+'''
+
+EXTENSIONS = ('.png', '.jpg', '.bmp', '.ogg', '.mid', '.wav')
+
+def synthetic_db(material_count: int, seed: int=0) -> apsw.Connection:
+    """Create an in-memory database with `material_count` materials, each of
+    which has between one and four files spread over the two sources."""
+
+    rng = random.Random(seed)
+    dbh = apsw.Connection(':memory:')
+    dbh.execute(material.SCHEMA)
+    subtypes = dbh.execute('SELECT type, name FROM material_subtype').fetchall()
+    material_rows = []
+    file_rows = []
+
+    for i in range(material_count):
+        type_, subtype = rng.choice(subtypes)
+        name = f'material{i}'
+        material_rows.append((type_, subtype, name))
+        sources = rng.choice((['game'], ['rtp'], ['game', 'rtp']))
+
+        for source in sources:
+            for extension in rng.sample(EXTENSIONS, rng.randint(1, 2)):
+                file_rows.append((type_, subtype, name, source, extension))
+
+    with dbh:
+        dbh.executemany(
+            'INSERT INTO material (type, subtype, name) VALUES (?, ?, ?)',
+            material_rows
+        )
+
+        dbh.executemany(
+            'INSERT INTO material_file '
+            '(type, subtype, name, source, extension) VALUES (?, ?, ?, ?, ?)',
+            file_rows
+        )
+
+    return dbh
+
+def time_query(dbh: apsw.Connection, query: str) -> float:
+    start = time.perf_counter()
+
+    with dbh:
+        dbh.execute(query)
+
+    return time.perf_counter() - start
+
+def best_files(dbh: apsw.Connection) -> list[tuple]:
+    return dbh.execute(
+        'SELECT * FROM material_best_file__materialized ORDER BY 1, 2, 3'
+    ).fetchall()
+
+def run(material_counts: list[int], *, correlated: bool=True) -> None:
+    print(f'{"materials":>10} {"files":>10} {"window":>10} {"correlated":>12}')
+
+    for material_count in material_counts:
+        dbh = synthetic_db(material_count)
+        file_count = dbh.execute('SELECT count(*) FROM material_file').get
+        window_seconds = time_query(dbh, material.MATERIALIZED_VIEWS)
+        correlated_column = ''
+
+        if correlated:
+            expected = best_files(dbh)
+            correlated_seconds = time_query(dbh, CORRELATED_QUERY)
+            assert best_files(dbh) == expected
+            correlated_column = f'{correlated_seconds:>11.3f}s'
+
+        print(
+            f'{material_count:>10} {file_count:>10} {window_seconds:>9.3f}s '
+            f'{correlated_column}'
+        )
+
+if __name__ == '__main__':
+    import argparse
+
+    arg_parser = argparse.ArgumentParser()
+
+    arg_parser.add_argument(
+        'material_counts', nargs='*', type=int,
+        default=[1000, 10000, 100000], help='material counts to benchmark'
+    )
+
+    arg_parser.add_argument('--no-correlated', action='store_true', help=(
+        "don't time the correlated subquery (which is slow for large counts)"
+    ))
+
+    parsed_args = arg_parser.parse_args()
+    run(parsed_args.material_counts, correlated=not parsed_args.no_correlated)
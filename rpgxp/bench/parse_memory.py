@@ -0,0 +1,148 @@
+"""Benchmark for the memory used by parsed data, with and without slots on the
+generated classes.
+
+Run with `python -m rpgxp.bench.parse_memory`. Each variant of the generated
+classes is measured in a separate process, so that the peak RSS of one
+doesn't affect the other. By default, each process builds a synthetic object
+graph of event commands, move commands and audio files (which make up most
+of the objects in a parsed game); with --data-root, it parses every data file
+in the given directory instead (which needs ruby_marshal_parser)."""
+
+import dataclasses
+import json
+from pathlib import Path
+import re
+import resource
+import subprocess
+import sys
+import time
+import types
+from typing import Any
+from rpgxp.generate_classes import generate_module
+
+SYNTHETIC_CLASS_NAME = re.compile(
+    r'^(?:EventCommand_|MoveCommand_|AudioFile$)'
+)
+
+def install_generated_module(*, slots: bool) -> types.ModuleType:
+    """Generate the classes and install them as rpgxp.generated.schema, in
+    place of the module on disk."""
+
+    module = types.ModuleType('rpgxp.generated.schema')
+    sys.modules[module.__name__] = module
+    code = compile(generate_module(slots=slots), module.__name__, 'exec')
+    exec(code, vars(module))
+    return module
+
+def synthetic_objects(module: types.ModuleType, count: int) -> list:
+    classes: list[type[Any]] = [
+        value for name, value in vars(module).items()
+        if SYNTHETIC_CLASS_NAME.match(name)
+        and isinstance(value, type)
+        and dataclasses.is_dataclass(value)
+        and not value.__subclasses__()
+    ]
+
+    arg_counts = [len(dataclasses.fields(cls)) for cls in classes]
+
+    # the field values are all the same small integer, so that the memory
+    # measured is just that of the objects themselves
+    return [
+        classes[i % len(classes)](*[0] * arg_counts[i % len(classes)])
+        for i in range(count)
+    ]
+
+def parsed_files(data_root: Path) -> list:
+    # imported here so that it picks up the installed generated module
+    from rpgxp import parse
+
+    return [
+        parse.parse_filename(path.name, data_root, use_cache=False)
+        for path in sorted(data_root.iterdir())
+        if path.suffix == '.rxdata'
+    ]
+
+def peak_rss_kib() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def measure(*, slots: bool, count: int, data_root: Path | None) -> dict:
+    module = install_generated_module(slots=slots)
+    rss_before = peak_rss_kib()
+    start = time.perf_counter()
+
+    if data_root is None:
+        result = synthetic_objects(module, count)
+    else:
+        result = parsed_files(data_root)
+
+    seconds = time.perf_counter() - start
+    rss_after = peak_rss_kib()
+    del result
+
+    return {
+        'slots': slots,
+        'seconds': seconds,
+        'peak_rss_kib': rss_after,
+        'peak_rss_growth_kib': rss_after - rss_before,
+    }
+
+def run(count: int, data_root: Path | None) -> None:
+    print(f'{"variant":>10} {"time":>10} {"peak RSS":>12} {"growth":>12}')
+
+    for slots in (False, True):
+        args = [
+            sys.executable, '-m', 'rpgxp.bench.parse_memory', '--child',
+            '--count', str(count)
+        ]
+
+        if slots:
+            args.append('--slots')
+
+        if data_root is not None:
+            args.extend(['--data-root', str(data_root)])
+
+        output = subprocess.run(
+            args, check=True, capture_output=True, text=True
+        ).stdout
+
+        result = json.loads(output.splitlines()[-1])
+        variant = 'slots' if slots else 'dict'
+
+        print(
+            f'{variant:>10} {result["seconds"]:>9.3f}s '
+            f'{result["peak_rss_kib"] / 1024:>9.1f}MiB '
+            f'{result["peak_rss_growth_kib"] / 1024:>9.1f}MiB'
+        )
+
+if __name__ == '__main__':
+    import argparse
+
+    arg_parser = argparse.ArgumentParser()
+
+    arg_parser.add_argument(
+        '--count', type=int, default=2_000_000,
+        help='number of synthetic objects to create'
+    )
+
+    arg_parser.add_argument('--data-root', type=Path, help=(
+        'parse the data files in this directory instead of creating '
+        'synthetic objects'
+    ))
+
+    arg_parser.add_argument('--child', action='store_true', help=(
+        'measure one variant in this process, and print the result as JSON'
+    ))
+
+    arg_parser.add_argument('--slots', action='store_true', help=(
+        'with --child, use the classes with slots'
+    ))
+
+    parsed_args = arg_parser.parse_args()
+
+    if parsed_args.child:
+        print(json.dumps(measure(
+            slots=parsed_args.slots, count=parsed_args.count,
+            data_root=parsed_args.data_root
+        )))
+    else:
+        run(parsed_args.count, parsed_args.data_root)
@@ -0,0 +1,365 @@
+"""The benchmark suite, which times each stage of the pipeline on a synthetic
+game and saves the results as JSON.
+
+Run with `python -m rpgxp.bench.suite`. A synthetic game (see
+rpgxp.bench.synthetic) is written to the working directory, together with a
+settings file which points the game, database and site roots into the working
+directory as well, so that the real settings aren't used. Each benchmark runs
+in its own process, with RPGXP_SETTINGS set to that settings file, so that
+the peak RSS of one benchmark doesn't affect the others. The game is kept in
+the working directory and reused for as long as the scale stays the same.
+
+The benchmarks later in the list use what the earlier ones leave behind (the
+data benchmark needs the schema to have been created, the page benchmarks
+need the data, and so on), so a benchmark is skipped if one it depends on
+was run and didn't succeed. Benchmarks which need ruby_marshal_parser are
+skipped if it isn't installed."""
+
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+import json
+import os
+from pathlib import Path
+import platform
+import subprocess
+import sys
+import tempfile
+from typing import Any
+from rpgxp import instrument
+from rpgxp.bench import synthetic
+
+SAMPLE_PAGES_PER_ROUTE = 20
+"""The number of pages of each route which are rendered in the dynamic page
+benchmark."""
+
+HUES = (60, 120, 180, 240, 300)
+
+def data_paths() -> list[Path]:
+    from rpgxp import settings
+
+    return sorted(
+        path for path in settings.game_data_root.iterdir()
+        if path.suffix == '.rxdata'
+    )
+
+def bench_marshal(scale: synthetic.Scale) -> None:
+    import ruby_marshal_parser as marshal
+
+    for path in data_paths():
+        marshal.parse_file(path)
+
+def bench_parse(scale: synthetic.Scale) -> None:
+    from rpgxp import parse
+
+    for path in data_paths():
+        parse.parse_filename(path.name, path.parent, use_cache=False)
+
+def bench_schema(scale: synthetic.Scale) -> None:
+    from rpgxp import generate_db_schema
+    generate_db_schema.run()
+
+def bench_data(scale: synthetic.Scale) -> None:
+    from rpgxp import generate_db_data
+    generate_db_data.run()
+
+def bench_xref(scale: synthetic.Scale) -> None:
+    from rpgxp import xref
+    xref.run()
+
+def bench_search(scale: synthetic.Scale) -> None:
+    from rpgxp import search
+    search.run()
+
+def bench_views(scale: synthetic.Scale) -> None:
+    from rpgxp import views
+    views.run()
+
+def bench_static_pages(scale: synthetic.Scale) -> None:
+    from rpgxp.site import generate
+    generate.run(force=True)
+
+def bench_dynamic_pages(scale: synthetic.Scale) -> None:
+    from rpgxp import db
+    from rpgxp.site import generate, serve_dynamic
+    from rpgxp.route.routes import routes
+
+    dbh = db.connect()
+
+    for route in routes():
+        if route.query_params:
+            continue
+
+        url_args_list = generate.possible_url_args(route, dbh)
+
+        with instrument.timed(route.url_pattern):
+            for url_args in url_args_list[:SAMPLE_PAGES_PER_ROUTE]:
+                url = route.url(**url_args)
+                response = serve_dynamic.respond_dynamic(url)
+
+                if not response.status.startswith('200'):
+                    raise RuntimeError(f'{url}: {response.status}')
+
+def golden_map_input() -> Path:
+    from rpgxp import settings
+
+    return (
+        settings.project_root
+        / 'golden-data/test_map_image_from_data/rejuv432/input'
+    )
+
+def bench_map_image(scale: synthetic.Scale) -> None:
+    import numpy as np
+    from PIL import Image as image
+    from rpgxp.tile import map_image_from_data
+
+    input_root = golden_map_input()
+    tileset = image.open(input_root / 'tileset.png')
+
+    autotiles = {
+        int(p.stem): image.open(p)
+        for p in (input_root / 'autotiles').iterdir()
+    }
+
+    map_data = synthetic.map_data(
+        np.random.default_rng(scale.seed), scale.map_width, scale.map_height
+    )
+
+    map_image_from_data(map_data, tileset, autotiles)
+
+def bench_hue(scale: synthetic.Scale) -> None:
+    from PIL import Image as image
+    from rpgxp.image import adjust_hue
+
+    tileset = image.open(golden_map_input() / 'tileset.png').convert('RGBA')
+
+    for hue in HUES:
+        adjust_hue(tileset, hue)
+
+@dataclass
+class Benchmark:
+    name: str
+    function: Callable[[synthetic.Scale], None]
+    needs: tuple[str, ...]=()
+    """The benchmarks whose results this one uses."""
+
+PAGE_NEEDS = ('xref', 'search', 'views')
+
+BENCHMARKS = [
+    Benchmark('marshal', bench_marshal),
+    Benchmark('parse', bench_parse),
+    Benchmark('schema', bench_schema),
+    Benchmark('data', bench_data, ('schema',)),
+    Benchmark('xref', bench_xref, ('data',)),
+    Benchmark('search', bench_search, ('data',)),
+    Benchmark('views', bench_views, ('data',)),
+    Benchmark('static_pages', bench_static_pages, PAGE_NEEDS),
+    Benchmark('dynamic_pages', bench_dynamic_pages, PAGE_NEEDS),
+    Benchmark('map_image', bench_map_image),
+    Benchmark('hue', bench_hue),
+]
+
+BENCHMARKS_BY_NAME = {benchmark.name: benchmark for benchmark in BENCHMARKS}
+
+def default_workspace() -> Path:
+    return Path(tempfile.gettempdir()) / 'rpgxp-bench'
+
+def prepare(workspace: Path, scale: synthetic.Scale) -> dict[str, Any]:
+    """Write the synthetic game and the settings file, unless the game is
+    already there at the same scale. Return the result for the generation of
+    the game."""
+
+    scale_path = workspace / 'scale.json'
+    scale_json = json.dumps(asdict(scale), sort_keys=True)
+    game_root = workspace / 'game'
+
+    for subdir in ('rtp', 'db', 'site'):
+        (workspace / subdir).mkdir(parents=True, exist_ok=True)
+
+    (workspace / 'settings.ini').write_text(
+        'game_name = Synthetic\n'
+        f'game_root = {game_root}\n'
+        f'rtp_root = {workspace / "rtp"}\n'
+        f'db_root = {workspace / "db"}\n'
+        f'site_root = {workspace / "site"}\n',
+        encoding='utf-8'
+    )
+
+    try:
+        up_to_date = scale_path.read_text(encoding='utf-8') == scale_json
+    except FileNotFoundError:
+        up_to_date = False
+
+    if up_to_date:
+        return {'name': 'synthetic', 'status': 'reused'}
+
+    print(f'Writing synthetic game to {game_root}...')
+    scale_path.unlink(missing_ok=True)
+
+    with instrument.timed('synthetic') as timing:
+        synthetic.write_game(game_root, scale)
+
+    scale_path.write_text(scale_json, encoding='utf-8')
+    return {'status': 'ok', **timing.to_json()}
+
+def run_child(name: str, scale: synthetic.Scale) -> dict[str, Any]:
+    benchmark = BENCHMARKS_BY_NAME[name]
+
+    try:
+        with instrument.timed(name) as timing:
+            benchmark.function(scale)
+    except ModuleNotFoundError as e:
+        return {'name': name, 'status': 'skipped', 'reason': str(e)}
+
+    return {'status': 'ok', **timing.to_json()}
+
+def run_benchmark(
+    benchmark: Benchmark, workspace: Path, results: dict[str, dict[str, Any]]
+) -> dict[str, Any]:
+
+    for need in benchmark.needs:
+        if need in results and results[need]['status'] != 'ok':
+            return {
+                'name': benchmark.name, 'status': 'skipped',
+                'reason': f'{need} was {results[need]["status"]}',
+            }
+
+    env = {
+        **os.environ, 'RPGXP_SETTINGS': str(workspace / 'settings.ini')
+    }
+
+    completed = subprocess.run(
+        [
+            sys.executable, '-m', 'rpgxp.bench.suite', '--child',
+            benchmark.name, '--workspace', str(workspace)
+        ],
+        env=env, capture_output=True, text=True
+    )
+
+    if completed.returncode:
+        stderr_lines = completed.stderr.strip().splitlines()
+
+        return {
+            'name': benchmark.name, 'status': 'failed',
+            'reason': stderr_lines[-1] if stderr_lines else '',
+        }
+
+    return json.loads(completed.stdout.splitlines()[-1])
+
+def print_result(result: dict[str, Any]) -> None:
+    if 'wall_seconds' in result:
+        print(
+            f'{result["name"]:>14} {result["status"]:>8} '
+            f'{result["wall_seconds"]:>9.3f}s {result["cpu_seconds"]:>9.3f}s '
+            f'{result["peak_rss_kib"] / 1024:>9.1f}MiB'
+        )
+    else:
+        print(
+            f'{result["name"]:>14} {result["status"]:>8} '
+            f'{result.get("reason", "")}'
+        )
+
+def run(
+    workspace: Path, scale: synthetic.Scale, names: list[str], output: Path
+) -> None:
+    unrecognized_names = set(names) - BENCHMARKS_BY_NAME.keys()
+
+    if unrecognized_names:
+        raise ValueError(
+            f'unrecognized benchmarks: {", ".join(unrecognized_names)}'
+        )
+
+    synthetic_result = prepare(workspace, scale)
+
+    print(
+        f'{"benchmark":>14} {"status":>8} {"wall":>10} {"CPU":>10} '
+        f'{"peak RSS":>12}'
+    )
+
+    print_result(synthetic_result)
+    results: dict[str, dict[str, Any]] = {}
+
+    for benchmark in BENCHMARKS:
+        if names and benchmark.name not in names:
+            continue
+
+        result = run_benchmark(benchmark, workspace, results)
+        results[benchmark.name] = result
+        print_result(result)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    with output.open('w', encoding='utf-8') as f:
+        json.dump({
+            'scale': asdict(scale),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'synthetic': synthetic_result,
+            'benchmarks': list(results.values()),
+        }, f, indent=2)
+
+    print(f'Results saved to {output}')
+
+if __name__ == '__main__':
+    import argparse
+
+    arg_parser = argparse.ArgumentParser()
+
+    arg_parser.add_argument('benchmarks', nargs='*', help=(
+        f'benchmarks to run, out of {", ".join(BENCHMARKS_BY_NAME)} (by '
+        'default, all of them)'
+    ))
+
+    arg_parser.add_argument(
+        '--workspace', type=Path, default=default_workspace(),
+        help='directory for the synthetic game, database and site'
+    )
+
+    arg_parser.add_argument('--output', type=Path, help=(
+        'where to save the results (by default, results.json in the '
+        'workspace)'
+    ))
+
+    arg_parser.add_argument('--maps', type=int, default=synthetic.Scale.maps)
+
+    arg_parser.add_argument(
+        '--map-size', type=int, nargs=2, metavar=('WIDTH', 'HEIGHT'),
+        default=(synthetic.Scale.map_width, synthetic.Scale.map_height)
+    )
+
+    arg_parser.add_argument(
+        '--events', type=int, default=synthetic.Scale.events
+    )
+
+    arg_parser.add_argument(
+        '--commands', type=int, default=synthetic.Scale.commands
+    )
+
+    arg_parser.add_argument(
+        '--records', type=int, default=synthetic.Scale.records
+    )
+
+    arg_parser.add_argument('--child', metavar='BENCHMARK', help=(
+        'run one benchmark in this process, with the scale saved in the '
+        'workspace, and print the result as JSON'
+    ))
+
+    parsed_args = arg_parser.parse_args()
+
+    if parsed_args.child:
+        scale_path = parsed_args.workspace / 'scale.json'
+        scale = synthetic.Scale(**json.loads(scale_path.read_text()))
+        print(json.dumps(run_child(parsed_args.child, scale)))
+    else:
+        run(
+            parsed_args.workspace,
+            synthetic.Scale(
+                maps=parsed_args.maps,
+                map_width=parsed_args.map_size[0],
+                map_height=parsed_args.map_size[1],
+                events=parsed_args.events,
+                commands=parsed_args.commands,
+                records=parsed_args.records,
+            ),
+            parsed_args.benchmarks,
+            parsed_args.output or parsed_args.workspace / 'results.json'
+        )
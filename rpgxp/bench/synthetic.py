@@ -0,0 +1,570 @@
+"""Synthetic RPG Maker XP games, so that the benchmarks can be run without a
+real game.
+
+Run with `python -m rpgxp.bench.synthetic GAME_ROOT` to write the data files
+of a synthetic game to GAME_ROOT/Data. The files are in Marshal format
+(version 4.8, as written by the Ruby 1.8 interpreter in RPG Maker XP), and
+every value in them is generated from the schema in rpgxp.schema.rpgxp_schema,
+so they parse in the same way as the files of a real game. The size of the
+game is set by a Scale; e.g. `--maps 999 --map-size 200 200 --events 500`
+gives a game bigger than any real one. Graphics and audio files aren't
+generated, so all the material references are blank."""
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+import random
+import struct
+from typing import Any
+import zlib
+import numpy as np
+from rpgxp.schema import Schema as schema, rpgxp_schema
+
+REGULAR_TILE_COUNT = 8 * 256
+"""The number of regular tiles in each synthetic tileset (that is, 256 rows
+of tiles in the tileset image)."""
+
+MAX_MAPS = 999
+"""The map files are named with a three-digit map ID (see MAPS_SCHEMA)."""
+
+WORDS = (
+    'the a of to and in is it you that he was for on are with as his they at '
+    'be this from have or by one had not but what all were when we there can '
+    'an your which their said if do will each about how up out them then she '
+    'many some so these would other into has more her two like him see time'
+).split()
+
+COMMAND_TABLE_NAMES = (
+    'event_page_command', 'common_event_command', 'troop_page_command'
+)
+
+@dataclass
+class Scale:
+    maps: int=20
+    """The number of maps."""
+
+    map_width: int=50
+    """The width of each map, in tiles."""
+
+    map_height: int=50
+    """The height of each map, in tiles."""
+
+    events: int=20
+    """The number of events on each map."""
+
+    pages: int=2
+    """The number of pages on each event."""
+
+    commands: int=20
+    """The number of commands on each page of an event, common event or
+    troop."""
+
+    records: int=50
+    """The number of actors, items, etc., and also of switches, variables
+    and elements."""
+
+    items: int=3
+    """The length of every other list (e.g. the move commands in a move
+    route, or the members of a troop)."""
+
+    seed: int=0
+
+def map_data(
+    rng: np.random.Generator, width: int, height: int
+) -> np.ndarray:
+    """Return random tile data for a map. The bottom layer is filled with an
+    even mixture of autotiles and regular tiles, and about a fifth of the
+    upper layers with regular tiles."""
+
+    shape = (width, height, 3)
+
+    # each autotile has 48 IDs, the first 47 of which are its configurations
+    autotiles = 48 * rng.integers(1, 8, shape) + rng.integers(0, 47, shape)
+    regular_tiles = rng.integers(384, 384 + REGULAR_TILE_COUNT, shape)
+    result = np.where(rng.random(shape) < 0.5, autotiles, regular_tiles)
+
+    result[:, :, 1:] = np.where(
+        rng.random((width, height, 2)) < 0.2, regular_tiles[:, :, 1:], 0
+    )
+
+    return result.astype('<i2')
+
+class MarshalWriter:
+    """Writes values in Marshal format. Only the parts of the format which
+    appear in RPG Maker XP data files are supported, and objects are never
+    written as links to earlier objects (though symbols are)."""
+
+    __slots__ = ('_out', '_symbols')
+
+    _out: bytearray
+    _symbols: dict[str, int]
+
+    def __init__(self) -> None:
+        self._out = bytearray(b'\x04\x08')
+        self._symbols = {}
+
+    def getvalue(self) -> bytes:
+        return bytes(self._out)
+
+    def long(self, value: int) -> None:
+        out = self._out
+
+        if value == 0:
+            out.append(0)
+        elif 0 < value < 123:
+            out.append(value + 5)
+        elif -124 < value < 0:
+            out.append((value - 5) & 0xff)
+        else:
+            data = bytearray()
+
+            while True:
+                data.append(value & 0xff)
+                value >>= 8
+
+                if value == 0:
+                    out.append(len(data))
+                    break
+
+                if value == -1:
+                    out.append(-len(data) & 0xff)
+                    break
+
+            out.extend(data)
+
+    def bytes_(self, data: bytes) -> None:
+        self.long(len(data))
+        self._out.extend(data)
+
+    def symbol(self, name: str) -> None:
+        try:
+            index = self._symbols[name]
+        except KeyError:
+            self._symbols[name] = len(self._symbols)
+            self._out.append(ord(':'))
+            self.bytes_(name.encode('utf-8'))
+        else:
+            self._out.append(ord(';'))
+            self.long(index)
+
+    def nil(self) -> None:
+        self._out.append(ord('0'))
+
+    def bool(self, value: bool) -> None:
+        self._out.append(ord('T' if value else 'F'))
+
+    def fixnum(self, value: int) -> None:
+        # Ruby 1.8 writes anything outside this range as a Bignum
+        assert -2 ** 30 <= value < 2 ** 30, value
+        self._out.append(ord('i'))
+        self.long(value)
+
+    def string(self, data: bytes) -> None:
+        self._out.append(ord('"'))
+        self.bytes_(data)
+
+    def array(self, length: int) -> None:
+        """Start an array; the items should be written next."""
+
+        self._out.append(ord('['))
+        self.long(length)
+
+    def hash(self, length: int) -> None:
+        """Start a hash; the keys and values should be written next, in
+        alternation."""
+
+        self._out.append(ord('{'))
+        self.long(length)
+
+    def object(self, class_name: str, ivar_count: int) -> None:
+        """Start an object; the names of its instance variables (as symbols)
+        and their values should be written next, in alternation."""
+
+        self._out.append(ord('o'))
+        self.symbol(class_name)
+        self.long(ivar_count)
+
+    def user_data(self, class_name: str, data: bytes) -> None:
+        self._out.append(ord('u'))
+        self.symbol(class_name)
+        self.bytes_(data)
+
+def table_data(array: np.ndarray) -> bytes:
+    """The inverse of rpgxp.parse.parse_array_from_table_data."""
+
+    dims = array.shape + (1,) * (3 - array.ndim)
+
+    return (
+        struct.pack('<5i', array.ndim, *dims, array.size)
+        + array.astype('<i2').tobytes(order='F')
+    )
+
+type Given = Any | Callable[[], None]
+"""A given value for a field: either a value of the type the field is parsed
+as, or a function which writes the field's value itself."""
+
+class Synthesizer:
+    """Writes the data files of a synthetic game."""
+
+    scale: Scale
+    rng: random.Random
+    np_rng: np.random.Generator
+    writer: MarshalWriter
+
+    def __init__(self, scale: Scale) -> None:
+        self.scale = scale
+        self.rng = random.Random(scale.seed)
+        self.np_rng = np.random.default_rng(scale.seed)
+        self.writer = MarshalWriter()
+
+    def text(self, max_words: int=8) -> str:
+        return ' '.join(self.rng.choices(WORDS, k=self.rng.randint(
+            1, max_words
+        )))
+
+    def list_length(self, list_schema: schema.ListSchema) -> int:
+        table_name = list_schema.table_name.template
+
+        if table_name in COMMAND_TABLE_NAMES:
+            length = self.scale.commands
+        elif table_name == 'event_page':
+            length = self.scale.pages
+        elif table_name in ('element', 'switch', 'variable'):
+            length = self.scale.records
+        else:
+            length = self.scale.items
+
+        lb = list_schema.length_schema.lb
+        ub = list_schema.length_schema.ub
+
+        if lb is not None:
+            length = max(length, lb)
+
+        if ub is not None:
+            length = min(length, ub)
+
+        return length
+
+    def given(self, data_schema: schema.DataSchema, value: Given) -> None:
+        """Write a given value in the way it would appear for the schema."""
+
+        w = self.writer
+
+        if callable(value):
+            value()
+            return
+
+        match data_schema:
+            case schema.BoolSchema():
+                w.bool(value)
+            case schema.IntBoolSchema() | schema.IntSchema():
+                w.fixnum(int(value))
+            case schema.StrSchema() | schema.MaterialRefSchema():
+                w.string(value.encode('utf-8'))
+            case schema.ZlibSchema(encoding):
+                w.string(zlib.compress(value.encode(encoding)))
+            case schema.NDArraySchema(dims):
+                assert value.ndim == dims
+                w.user_data('Table', table_data(value))
+            case schema.EnumSchema():
+                assert isinstance(value, Enum)
+
+                if isinstance(value.value, str):
+                    w.string(value.value.encode('utf-8'))
+                else:
+                    w.fixnum(value.value)
+            case schema.FKSchema(foreign_schema_thunk, _):
+                self.given(foreign_schema_thunk().pk_schema(), value)
+            case _:
+                assert False, type(data_schema)
+
+    def value(self, data_schema: schema.DataSchema) -> None:
+        """Write a random value matching the schema."""
+
+        w = self.writer
+        rng = self.rng
+
+        match data_schema:
+            case schema.BoolSchema() | schema.IntBoolSchema():
+                self.given(data_schema, rng.random() < 0.5)
+            case schema.IntSchema(lb, ub):
+                lo = 0 if lb is None else lb
+                hi = lo + 99 if ub is None else ub
+                w.fixnum(rng.randint(min(lo, hi), hi))
+            case schema.StrSchema():
+                w.string(self.text().encode('utf-8'))
+            case schema.MaterialRefSchema():
+                w.string(b'')
+            case schema.ZlibSchema():
+                lines = (self.text() for _ in range(self.scale.items * 10))
+                self.given(data_schema, '\n'.join(lines))
+            case schema.NDArraySchema(dims):
+                shape = ((self.scale.records + 1,), (8, 8), (8, 8, 3))[dims - 1]
+                self.given(data_schema, self.np_rng.integers(0, 100, shape))
+            case schema.EnumSchema(enum_class):
+                self.given(data_schema, rng.choice(list(enum_class)))
+            case schema.FKSchema(_, nullable):
+                # every list of records has an item 1 (and there's always a
+                # map 1); 0 stands for null
+                self.given(data_schema, rng.randint(0, 1) if nullable else 1)
+            case schema.ColorSchema() | schema.ToneSchema():
+                w.user_data(data_schema.class_name, struct.pack(
+                    '<4d', *(float(rng.randint(0, 255)) for _ in range(4))
+                ))
+            case (
+                schema.ArrayObjSchema() | schema.RPGObjSchema()
+                | schema.RPGSingletonObjSchema()
+            ):
+                self.obj(data_schema)
+            case schema.RPGVariantObjSchema():
+                self.variant_obj(data_schema)
+            case schema.ListSchema():
+                self.list_(data_schema, self.list_length(data_schema))
+            case schema.SetSchema(_, item_schema):
+                w.array(1)
+                self.given(item_schema, 1)
+            case schema.DictSchema():
+                self.dict_(data_schema, range(1, self.scale.items + 1))
+            case _:
+                assert False, type(data_schema)
+
+    def field(self, field: schema.FieldBase, given: dict[str, Given]) -> None:
+        try:
+            value = given[field.name]
+        except KeyError:
+            self.value(field.schema)
+        else:
+            self.given(field.schema, value)
+
+    def obj(self, obj_schema: schema.ObjSchema, **given: Given) -> None:
+        """Write an object with random field values, apart from those given
+        (by field name)."""
+
+        w = self.writer
+
+        match obj_schema:
+            case schema.ArrayObjSchema(_, fields):
+                w.array(len(fields))
+
+                for field in fields:
+                    self.field(field, given)
+            case (
+                schema.RPGObjSchema(_, rpg_class_name, fields)
+                | schema.RPGSingletonObjSchema(_, _, rpg_class_name, fields)
+            ):
+                w.object(rpg_class_name, len(fields))
+
+                for rpg_field in fields:
+                    w.symbol('@' + rpg_field.rpg_name)
+                    self.field(rpg_field, given)
+            case _:
+                assert False, type(obj_schema)
+
+    def variant_obj(self, obj_schema: schema.RPGVariantObjSchema) -> None:
+        w = self.writer
+        variants = [self.rng.choice(obj_schema.variants)]
+
+        while isinstance(variants[-1], schema.ComplexVariant):
+            variants.append(self.rng.choice(variants[-1].variants))
+
+        w.object(obj_schema.rpg_class_name, len(obj_schema.fields) + 1)
+
+        for rpg_field in obj_schema.fields:
+            w.symbol('@' + rpg_field.rpg_name)
+
+            self.field(rpg_field, {
+                obj_schema.discriminant_name: variants[0].discriminant_value
+            })
+
+        w.symbol('@parameters')
+        w.array(sum(len(variant.fields) for variant in variants))
+
+        for variant, subvariant in zip(variants, variants[1:] + [None]):
+            given = {}
+
+            if isinstance(variant, schema.ComplexVariant):
+                assert subvariant is not None
+                given[variant.subdiscriminant_name] \
+                    = subvariant.discriminant_value
+
+            for field in variant.fields:
+                self.field(field, given)
+
+    def list_(
+        self, list_schema: schema.ListSchema, length: int,
+        item_given: Callable[[int], dict[str, Given]] = lambda i: {}
+    ) -> None:
+
+        w = self.writer
+        item_schema = list_schema.item_schema
+
+        match list_schema.first_item:
+            case schema.FirstItem.REGULAR:
+                start = 0
+                w.array(length)
+            case schema.FirstItem.NULL:
+                start = 1
+                w.array(length + 1)
+                w.nil()
+            case schema.FirstItem.BLANK:
+                start = 1
+                w.array(length + 1)
+                w.string(b'')
+
+        for i in range(start, start + length):
+            given = item_given(i)
+
+            if isinstance(list_schema.index, schema.MatchIndexToField):
+                given[list_schema.index.match_to] = i
+
+            if given:
+                assert isinstance(item_schema, schema.ObjSchema)
+                self.obj(item_schema, **given)
+            else:
+                self.value(item_schema)
+
+    def dict_(
+        self, dict_schema: schema.DictSchema, keys: range,
+        value_given: Callable[[int], dict[str, Given]] = lambda key: {}
+    ) -> None:
+
+        self.writer.hash(len(keys))
+
+        for key in keys:
+            self.given(dict_schema.key_schema, key)
+            given = value_given(key)
+
+            if isinstance(dict_schema.key, schema.MatchKeyToField):
+                given[dict_schema.key.match_to] = key
+
+            self.obj(dict_schema.value_schema, **given)
+
+    def record_given(
+        self, obj_schema: schema.ObjSchema, index: int
+    ) -> dict[str, Given]:
+        """Return the given field values for an item of one of the lists of
+        records (actors, tilesets, etc.)."""
+
+        match obj_schema.class_name:
+            case 'Script':
+                # the script pages are looked up by name
+                return {'name': f'script{index}'}
+            case 'Actor':
+                return {'parameters': self.np_rng.integers(1, 1000, (6, 100))}
+            case 'Tileset':
+                shape = (384 + REGULAR_TILE_COUNT,)
+
+                return {
+                    'passages': self.np_rng.integers(0, 16, shape),
+                    'priorities': self.np_rng.integers(0, 6, shape),
+                    'terrain_tags': self.np_rng.integers(0, 8, shape),
+                }
+            case _:
+                return {}
+
+    def map(self) -> None:
+        width = self.scale.map_width
+        height = self.scale.map_height
+
+        def event_given(key: int) -> dict[str, Given]:
+            return {
+                'x': self.rng.randrange(width),
+                'y': self.rng.randrange(height),
+            }
+
+        events_schema = rpgxp_schema.MAP_SCHEMA.get_field('events').schema
+        assert isinstance(events_schema, schema.DictSchema)
+
+        self.obj(
+            rpgxp_schema.MAP_SCHEMA,
+            width=width, height=height,
+            data=map_data(self.np_rng, width, height),
+            events=lambda: self.dict_(
+                events_schema, range(1, self.scale.events + 1), event_given
+            )
+        )
+
+    def map_infos(self) -> None:
+        # the maps form a binary tree, with map 1 at the root
+        self.dict_(
+            rpgxp_schema.MAP_INFOS_SCHEMA, range(1, self.scale.maps + 1),
+            lambda key: {'name': f'Map {key}', 'parent_id': key // 2}
+        )
+
+    def file_content(self, file_schema: schema.SingleFileSchema) -> None:
+        content_schema = file_schema.schema
+
+        if content_schema is rpgxp_schema.MAP_INFOS_SCHEMA:
+            self.map_infos()
+        elif (
+            isinstance(content_schema, schema.ListSchema)
+            and isinstance(content_schema.item_schema, schema.ObjSchema)
+        ):
+            item_schema = content_schema.item_schema
+
+            self.list_(
+                content_schema, self.scale.records,
+                lambda i: self.record_given(item_schema, i)
+            )
+        else:
+            self.value(content_schema)
+
+    def files(self) -> Iterator[tuple[str, bytes]]:
+        """Generate the name and content of each data file."""
+
+        if not 1 <= self.scale.maps <= MAX_MAPS:
+            raise ValueError(f'the number of maps must be 1 to {MAX_MAPS}')
+
+        for file_schema in rpgxp_schema.FILES:
+            self.writer = MarshalWriter()
+
+            match file_schema:
+                case schema.SingleFileSchema(filename, _):
+                    self.file_content(file_schema)
+                    yield filename, self.writer.getvalue()
+                case schema.MultipleFilesSchema():
+                    for map_id in range(1, self.scale.maps + 1):
+                        self.writer = MarshalWriter()
+                        self.map()
+                        yield f'Map{map_id:03}.rxdata', self.writer.getvalue()
+
+def write_game(game_root: Path, scale: Scale) -> None:
+    data_root = game_root / 'Data'
+    data_root.mkdir(parents=True, exist_ok=True)
+
+    for filename, content in Synthesizer(scale).files():
+        (data_root / filename).write_bytes(content)
+
+if __name__ == '__main__':
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(
+        description='Write the data files of a synthetic game'
+    )
+
+    arg_parser.add_argument('game_root', type=Path)
+    arg_parser.add_argument('--maps', type=int, default=Scale.maps)
+
+    arg_parser.add_argument(
+        '--map-size', type=int, nargs=2, metavar=('WIDTH', 'HEIGHT'),
+        default=(Scale.map_width, Scale.map_height)
+    )
+
+    arg_parser.add_argument('--events', type=int, default=Scale.events)
+    arg_parser.add_argument('--pages', type=int, default=Scale.pages)
+    arg_parser.add_argument('--commands', type=int, default=Scale.commands)
+    arg_parser.add_argument('--records', type=int, default=Scale.records)
+    arg_parser.add_argument('--seed', type=int, default=Scale.seed)
+    parsed_args = arg_parser.parse_args()
+
+    write_game(parsed_args.game_root, Scale(
+        maps=parsed_args.maps,
+        map_width=parsed_args.map_size[0],
+        map_height=parsed_args.map_size[1],
+        events=parsed_args.events,
+        pages=parsed_args.pages,
+        commands=parsed_args.commands,
+        records=parsed_args.records,
+        seed=parsed_args.seed,
+    ))
@@ -0,0 +1,156 @@
+"""Benchmark for the "tree" aggregate function, comparing FlatTreeAgg (the
+implementation which the database uses) with TreeAgg (the original one,
+which parses each label and builds rpgxp.forest trees).
+
+Run with `python -m rpgxp.bench.tree_agg`. Each implementation aggregates
+the same synthetic rows, both called directly and as an aggregate function
+in an in-memory database, and the outputs are checked to be the same tree.
+There are two shapes of input: "random", where each row's parent is a
+random earlier row (like the map tree, but much bigger), and "indented",
+where the depth goes up and down by one at a time (like a list of event
+commands)."""
+
+from dataclasses import dataclass
+import json
+import random
+import time
+import tracemalloc
+import apsw
+from rpgxp.db import FlatTreeAgg, TreeAgg
+
+IMPLEMENTATIONS = {'TreeAgg': TreeAgg, 'FlatTreeAgg': FlatTreeAgg}
+
+type Row = tuple[int, int | None, str]
+
+def label(id_: int) -> str:
+    return json.dumps({'id': id_, 'name': f'Node {id_}', 'code': id_ % 700})
+
+def random_rows(count: int, rng: random.Random) -> list[Row]:
+    rows: list[Row] = []
+
+    for id_ in range(1, count + 1):
+        if id_ == 1 or rng.random() < 0.01:
+            parent_id = None
+        else:
+            parent_id = rng.randrange(1, id_)
+
+        rows.append((id_, parent_id, label(id_)))
+
+    rng.shuffle(rows)
+    return rows
+
+def indented_rows(count: int, rng: random.Random) -> list[Row]:
+    rows: list[Row] = []
+    parents: list[int] = []
+
+    for id_ in range(1, count + 1):
+        rows.append((id_, parents[-1] if parents else None, label(id_)))
+        step = rng.choice((-1, 0, 1))
+
+        if step > 0 and len(parents) < 8:
+            parents.append(id_)
+        elif step < 0 and parents:
+            parents.pop()
+
+    return rows
+
+SHAPES = {'random': random_rows, 'indented': indented_rows}
+
+@dataclass
+class Measurement:
+    seconds: float
+    peak_kib: int
+    output: str
+
+def aggregate(agg_class: type, rows: list[Row]) -> str:
+    agg = agg_class()
+
+    for row in rows:
+        agg.step(*row)
+
+    return agg.final()
+
+def measure_direct(agg_class: type, rows: list[Row]) -> Measurement:
+    start = time.perf_counter()
+    output = aggregate(agg_class, rows)
+    seconds = time.perf_counter() - start
+
+    # tracemalloc slows the aggregate down a lot, so it gets a separate run
+    tracemalloc.start()
+
+    try:
+        aggregate(agg_class, rows)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Measurement(seconds, peak // 1024, output)
+
+def measure_sql(agg_class: type, rows: list[Row]) -> Measurement:
+    connection = apsw.Connection(':memory:')
+    connection.create_aggregate_function('tree', agg_class, numargs=3)
+    connection.execute('CREATE TABLE node (id, parent_id, label)')
+    connection.executemany('INSERT INTO node VALUES (?, ?, ?)', rows)
+
+    start = time.perf_counter()
+
+    output = connection.execute(
+        'SELECT tree(id, parent_id, json(label)) FROM node'
+    ).fetchall()[0][0]
+
+    seconds = time.perf_counter() - start
+    connection.close()
+    assert isinstance(output, str)
+    return Measurement(seconds, 0, output)
+
+def run(count: int, repeat: int, seed: int) -> None:
+    print(f'{"input":>10} {"implementation":>16} {"direct":>10} '
+          f'{"peak":>10} {"SQL":>10}')
+
+    for shape, make_rows in SHAPES.items():
+        rows = make_rows(count, random.Random(seed))
+        trees = []
+
+        for name, agg_class in IMPLEMENTATIONS.items():
+            direct = min(
+                (measure_direct(agg_class, rows) for _ in range(repeat)),
+                key=lambda m: m.seconds
+            )
+
+            sql = min(
+                (measure_sql(agg_class, rows) for _ in range(repeat)),
+                key=lambda m: m.seconds
+            )
+
+            trees.append(json.loads(direct.output))
+            assert json.loads(sql.output) == trees[-1]
+
+            print(
+                f'{shape:>10} {name:>16} {direct.seconds * 1000:>8.1f}ms '
+                f'{direct.peak_kib / 1024:>7.1f}MiB '
+                f'{sql.seconds * 1000:>8.1f}ms'
+            )
+
+        assert all(tree == trees[0] for tree in trees)
+
+if __name__ == '__main__':
+    import argparse
+
+    arg_parser = argparse.ArgumentParser()
+
+    arg_parser.add_argument(
+        '--rows', type=int, default=100_000,
+        help='number of rows in each input'
+    )
+
+    arg_parser.add_argument(
+        '--repeat', type=int, default=3,
+        help='number of times to run each implementation on each input'
+    )
+
+    arg_parser.add_argument(
+        '--seed', type=int, default=0, help='seed for generating the inputs'
+    )
+
+    parsed_args = arg_parser.parse_args()
+    run(parsed_args.rows, parsed_args.repeat, parsed_args.seed)
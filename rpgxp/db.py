@@ -1,7 +1,10 @@
 from dataclasses import dataclass
 import functools as ft
+import hashlib
 import json
 from pathlib import Path
+import re
+from typing import Iterable
 import apsw
 import apsw.bestpractice
 from rpgxp import forest, settings
@@ -38,6 +41,146 @@ class TreeAgg:
     def final(self) -> str:
         return forest.to_json(forest.from_rows(self.rows))
 
+_NO_ROW = -1
+
+class FlatTreeAgg:
+    """A faster implementation of the "tree" aggregate function (see TreeAgg,
+    which gives the same result, but is kept as the reference implementation
+    for the tests and rpgxp.bench.tree_agg).
+
+    Labels are kept as the JSON text they're given as, rather than being
+    parsed and then serialized again, and the tree is kept as flat lists of
+    row indices: each id's first and last child, and each row's next
+    sibling. The JSON is then written out by concatenating strings. As with
+    TreeAgg, rows which have a parent that's not one of the rows are left
+    out, and rows which share an id share their children."""
+
+    ids: list[apsw.SQLiteValue]
+    parent_ids: list[apsw.SQLiteValue]
+    labels: list[str]
+
+    def __init__(self) -> None:
+        self.ids = []
+        self.parent_ids = []
+        self.labels = []
+
+    def step(self, *args: apsw.SQLiteValue) -> None:
+        assert len(args) == 3
+        id_, parent_id, label = args
+        self.ids.append(id_)
+        self.parent_ids.append(parent_id)
+        self.labels.append(str(label))
+
+    def final(self) -> str:
+        row_count = len(self.ids)
+        id_indices: dict[apsw.SQLiteValue, int] = {}
+        first_child: list[int] = []
+        last_child: list[int] = []
+        row_id_indices = [0] * row_count
+        next_sibling = [_NO_ROW] * row_count
+        first_root = last_root = _NO_ROW
+
+        def id_index(id_: apsw.SQLiteValue) -> int:
+            try:
+                return id_indices[id_]
+            except KeyError:
+                index = id_indices[id_] = len(first_child)
+                first_child.append(_NO_ROW)
+                last_child.append(_NO_ROW)
+                return index
+
+        for row, (id_, parent_id) in enumerate(zip(self.ids, self.parent_ids)):
+            row_id_indices[row] = id_index(id_)
+
+            if parent_id is None:
+                if last_root == _NO_ROW:
+                    first_root = row
+                else:
+                    next_sibling[last_root] = row
+
+                last_root = row
+            else:
+                parent_index = id_index(parent_id)
+                last = last_child[parent_index]
+
+                if last == _NO_ROW:
+                    first_child[parent_index] = row
+                else:
+                    next_sibling[last] = row
+
+                last_child[parent_index] = row
+
+        # each entry is the next row to write out at that depth
+        stack = [first_root]
+        parts = ['[']
+
+        while True:
+            row = stack[-1]
+
+            if row == _NO_ROW:
+                stack.pop()
+
+                if not stack:
+                    parts.append(']')
+                    return ''.join(parts)
+
+                parts.append(']}')
+                continue
+
+            if parts[-1] == ']}':
+                parts.append(', ')
+
+            stack[-1] = next_sibling[row]
+            parts += ('{"label": ', self.labels[row], ', "children": [')
+            stack.append(first_child[row_id_indices[row]])
+
+            # only possible when rows share an id
+            if len(stack) > row_count + 1:
+                raise ValueError('the rows given to tree() form a cycle')
+
+def fts_query(*args: apsw.SQLiteValue) -> str:
+    """Defines the "fts_query" function for the database.
+
+    This function turns text typed into a search box into an FTS5 query which
+    matches rows containing every word of the text, where the last word may be
+    incomplete. Any FTS5 syntax in the text is ignored. If the text has no
+    words in it, the query is an empty phrase, which matches nothing."""
+
+    assert len(args) == 1
+    text, = args
+
+    if not isinstance(text, str):
+        text = ''
+
+    terms = [f'"{word}"' for word in re.findall(r'\w+', text)]
+
+    if not terms:
+        return '""'
+
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+def sha256(*args: apsw.SQLiteValue) -> str | None:
+    """Defines the "sha256" function for the database.
+
+    This function returns the hex SHA-256 digest of a BLOB (or of a string,
+    encoded as UTF-8), or NULL if given NULL. It lets a query stand in for a
+    large BLOB with something small which changes whenever the BLOB does."""
+
+    assert len(args) == 1
+    value, = args
+
+    if value is None:
+        return None
+
+    if isinstance(value, str):
+        value = value.encode('utf-8')
+
+    if not isinstance(value, bytes):
+        raise TypeError(f'sha256() takes a BLOB or TEXT, not {value!r}')
+
+    return hashlib.sha256(value).hexdigest()
+
 def connect(db_path: Path | None=None) -> apsw.Connection:
     if db_path is None:
         db_path = settings.db_root / 'db.sqlite'
@@ -45,7 +188,15 @@ def connect(db_path: Path | None=None) -> apsw.Connection:
     db_path.parent.mkdir(parents=True, exist_ok=True)
     apsw.bestpractice.apply(apsw.bestpractice.recommended)
     connection = apsw.Connection(str(db_path))
-    connection.create_aggregate_function('tree', TreeAgg, numargs=3)
+    connection.create_aggregate_function('tree', FlatTreeAgg, numargs=3)
+
+    connection.create_scalar_function(
+        'fts_query', fts_query, numargs=1, deterministic=True
+    )
+
+    connection.create_scalar_function(
+        'sha256', sha256, numargs=1, deterministic=True
+    )
     return connection
 
 def fetch_rows(
@@ -101,6 +252,10 @@ def run_script(
 
     return dbh.execute(script, bindings)
 
+def named_query(query_name: str) -> str:
+    """Return the SQL of one of the queries in the sql directory."""
+    return (settings.project_root / f'sql/{query_name}.sql').read_text()
+
 def run_named_query(
     query_name: str,
     bindings: apsw.Bindings | None=None,
@@ -110,79 +265,209 @@ def run_named_query(
     if dbh is None:
         dbh = connect()
 
-    script_path = settings.project_root / f'sql/{query_name}.sql'
-    return run_script(dbh, script_path, bindings)
-
-def foreign_key_report(dbh: apsw.Connection) -> str:
-    raw_check = dbh.execute('pragma foreign_key_check').fetchall()
-    reports = []
-
-    for table, rowid, parent, fkid in raw_check:
-        assert isinstance(table, str)
-        assert isinstance(rowid, int)
-        assert isinstance(parent, str)
+    return dbh.execute(named_query(query_name), bindings)
+
+TABLE_VERSION_SCHEMA = '''CREATE TABLE IF NOT EXISTS table_version (
+    name TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    version INTEGER NOT NULL
+) STRICT;'''
+"""Keeps track of which tables have changed, so that anything derived from them
+(such as materialized views) only needs to be rebuilt when they do. Each table
+has a digest of its contents, as supplied by whatever populated it, and a
+version number which is incremented whenever the digest changes."""
+
+def record_table_digests(
+    dbh: apsw.Connection, digests: dict[str, str]
+) -> None:
+
+    dbh.execute(TABLE_VERSION_SCHEMA)
+
+    with dbh:
+        dbh.executemany(
+            'INSERT INTO table_version (name, digest, version) '
+            'VALUES (?, ?, 1) '
+            'ON CONFLICT (name) DO UPDATE SET '
+            'digest = excluded.digest, version = version + 1 '
+            'WHERE digest != excluded.digest',
+            digests.items()
+        )
+
+def table_versions(
+    dbh: apsw.Connection, names: Iterable[str]
+) -> dict[str, int | None]:
+    """Return the version of each of the given tables, or None for tables whose
+    digests have never been recorded."""
+
+    dbh.execute(TABLE_VERSION_SCHEMA)
+    result: dict[str, int | None] = {}
+
+    for name in names:
+        version = fetch_value(
+            'SELECT max(version) FROM table_version WHERE name = ?', [name],
+            dbh=dbh
+        )
+
+        assert version is None or isinstance(version, int)
+        result[name] = version
+
+    return result
+
+@dataclass
+class ForeignKey:
+    parent: str
+    columns: list[str]
+    referenced_columns: list[str]
+
+    def __str__(self) -> str:
+        columns_csv = ', '.join(f'"{column}"' for column in self.columns)
+
+        referenced_columns_csv = ', '.join(
+            f'"{column}"' for column in self.referenced_columns
+        )
+
+        return (
+            f'FOREIGN KEY ({columns_csv}) '
+            f'REFERENCES "{self.parent}" ({referenced_columns_csv})'
+        )
+
+@dataclass
+class ForeignKeyViolation:
+    table: str
+    rowid: int
+    foreign_key: ForeignKey
+    pk_values: tuple[apsw.SQLiteValue, ...]
+    fk_values: tuple[apsw.SQLiteValue, ...]
+    """The values of the foreign key columns in the violating row."""
+
+    def to_json(self) -> dict:
+        return {
+            'table': self.table,
+            'rowid': self.rowid,
+            'parent': self.foreign_key.parent,
+            'columns': self.foreign_key.columns,
+            'referenced_columns': self.foreign_key.referenced_columns,
+            'pk_values': list(self.pk_values),
+            'fk_values': list(self.fk_values),
+        }
+
+def foreign_keys(dbh: apsw.Connection, table: str) -> dict[int, ForeignKey]:
+    """Return the foreign keys of a table, by their IDs (as used in the results
+    of foreign_key_check)."""
+
+    result: dict[int, ForeignKey] = {}
+
+    for fkid, parent, from_, to in dbh.execute(
+        'SELECT "id", "table", "from", "to" '
+        'FROM pragma_foreign_key_list(?) ORDER BY "id", "seq"', (table,)
+    ):
         assert isinstance(fkid, int)
+        assert isinstance(parent, str)
+        assert isinstance(from_, str)
+        assert isinstance(to, str)
 
-        fk = dbh.execute('\n'.join([
-            f"SELECT * FROM pragma_foreign_key_list('{table}')",
-            f'WHERE "id" = {fkid}',
-            f'ORDER BY "seq"',
-        ])).fetchall()
-
-        assert len(fk) > 0
-        fk_cols = []
-        ref_cols = []
-
-        for _, _, table_, from_, to, _, _, _ in fk:
-            assert isinstance(table, str)
-            assert isinstance(from_, str)
-            assert isinstance(to, str)
-            assert table_ == parent
-            fk_cols.append(from_)
-            ref_cols.append(to)
-
-        fk_cols_csv = ', '.join([f'"{col}"' for col in fk_cols])
-        ref_cols_csv = ', '.join([f'"{col}"' for col in ref_cols])
-
-        fk_string = ' '.join([
-            f'FOREIGN KEY ({fk_cols_csv}) ',
-            f'REFERENCES "{parent}" ({ref_cols_csv})',
-        ])
+        foreign_key = result.setdefault(fkid, ForeignKey(parent, [], []))
+        foreign_key.columns.append(from_)
+        foreign_key.referenced_columns.append(to)
 
-        violator_resultset = dbh.execute(
-            f'SELECT {fk_cols_csv} FROM "{table}" WHERE "rowid" = {rowid}'
-        ).fetchall()
+    return result
 
-        assert len(violator_resultset) == 1
-        violator, = violator_resultset
+def pk_columns(dbh: apsw.Connection, table: str) -> list[str]:
+    result: list[str] = []
 
-        pk_cols_resultset = dbh.execute(
-            f'SELECT "name" from pragma_table_info(\'{table}\') WHERE "pk" = 1'
-        ).fetchall()
+    for column, in dbh.execute(
+        'SELECT "name" FROM pragma_table_info(?) WHERE "pk" > 0 ORDER BY "pk"',
+        (table,)
+    ):
+        assert isinstance(column, str)
+        result.append(column)
 
-        pk_cols = []
+    return result
 
-        for col, in pk_cols_resultset:
-            assert isinstance(col, str)
-            pk_cols.append(col)
+def foreign_key_violations(
+    dbh: apsw.Connection
+) -> list[ForeignKeyViolation]:
+    """Return every row which violates a foreign key constraint.
 
-        pk_cols_csv = ', '.join([f'"{col}"' for col in pk_cols])
+    The metadata for each table is only looked up once, and the values from
+    the violating rows are fetched with one query per table."""
 
-        pk_vals_resultset = dbh.execute(
-            f'SELECT {pk_cols_csv} from "{table}" WHERE "rowid" = {rowid}'
-        ).fetchall()
+    violations_by_table: dict[str, list[tuple[int, int]]] = {}
 
-        assert len(pk_vals_resultset) == 1
-        pk_vals, = pk_vals_resultset
+    for table, rowid, parent, fkid in dbh.execute('pragma foreign_key_check'):
+        assert isinstance(table, str)
+        assert isinstance(rowid, int)
+        assert isinstance(parent, str)
+        assert isinstance(fkid, int)
+        violations_by_table.setdefault(table, []).append((rowid, fkid))
+
+    result: list[ForeignKeyViolation] = []
+
+    for table, violations in violations_by_table.items():
+        table_fks = foreign_keys(dbh, table)
+        table_pk_columns = pk_columns(dbh, table)
+
+        fk_columns = list(dict.fromkeys(
+            column
+            for _, fkid in violations
+            for column in table_fks[fkid].columns
+        ))
+
+        columns = [*table_pk_columns, *fk_columns]
+        columns_csv = ', '.join(f'"{column}"' for column in columns)
+        rowids = sorted({rowid for rowid, _ in violations})
+        rows: dict[int, dict[str, apsw.SQLiteValue]] = {}
+
+        # the rowids are passed as a single JSON array, so that there's no
+        # limit on how many there can be
+        for rowid, *values in dbh.execute(
+            f'SELECT "rowid", {columns_csv} FROM "{table}" '
+            'WHERE "rowid" IN (SELECT "value" FROM json_each(?))',
+            (json.dumps(rowids),)
+        ):
+            assert isinstance(rowid, int)
+            rows[rowid] = dict(zip(columns, values))
+
+        for rowid, fkid in violations:
+            row = rows[rowid]
+            foreign_key = table_fks[fkid]
+
+            result.append(ForeignKeyViolation(
+                table, rowid, foreign_key,
+                tuple(row[column] for column in table_pk_columns),
+                tuple(row[column] for column in foreign_key.columns),
+            ))
+
+    return result
 
-        reports.append('\n'.join([
-            f'Foreign key violation in table "{table}"',
-            f'  At row with primary key values {pk_vals}',
-            f'  FK declaration: {fk_string}',
-            f'  FK column values in violating row: {violator}',
-        ]))
+def foreign_key_report(dbh: apsw.Connection) -> str:
+    reports = [
+        '\n'.join([
+            f'Foreign key violation in table "{violation.table}"',
+            f'  At row with primary key values {violation.pk_values}',
+            f'  FK declaration: {violation.foreign_key}',
+            f'  FK column values in violating row: {violation.fk_values}',
+        ])
+        for violation in foreign_key_violations(dbh)
+    ]
 
     if not reports:
         return "No foreign key constraint violations found."
 
-    return '\n\n'.join(reports)
\ No newline at end of file
+    return '\n\n'.join(reports)
+
+def _blob_to_json(value: object) -> str:
+    """Encode the BLOB values in a foreign key report as hex strings."""
+
+    if isinstance(value, bytes):
+        return value.hex()
+
+    raise TypeError(
+        f'Object of type {type(value).__name__} is not JSON serializable'
+    )
+
+def foreign_key_report_json(dbh: apsw.Connection) -> str:
+    return json.dumps(
+        [violation.to_json() for violation in foreign_key_violations(dbh)],
+        indent=2, default=_blob_to_json
+    )
\ No newline at end of file
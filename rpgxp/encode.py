@@ -0,0 +1,112 @@
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+)
+from enum import Enum
+import io
+import os
+from pathlib import Path
+from types import TracebackType
+from typing import Any, assert_never, Self, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PIL.Image import Image
+
+class ImagePolicy(Enum):
+    """How hard to compress the PNG images generated for the site (map images
+    and re-hued materials)."""
+
+    DEV = 'dev'
+    """Compress quickly (zlib level 1). Used by the dynamic server."""
+
+    PUBLISH = 'publish'
+    """Compress as much as zlib can (level 9). This takes several times as
+    long as the default level, for files a few percent smaller."""
+
+    def save_options(self) -> dict[str, Any]:
+        match self:
+            case ImagePolicy.DEV:
+                return {'compress_level': 1}
+            case ImagePolicy.PUBLISH:
+                return {'compress_level': 9}
+            case _:
+                assert_never(self)
+
+def png_bytes(image: Image, policy: ImagePolicy) -> bytes:
+    stream = io.BytesIO()
+    image.save(stream, 'png', **policy.save_options())
+    return stream.getvalue()
+
+def save_png(image: Image, path: Path, policy: ImagePolicy) -> None:
+    """Save an image as a PNG file, which is written alongside and then moved
+    into place, so that it's never seen half written."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+
+    try:
+        image.save(tmp_path, 'png', **policy.save_options())
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+class EncoderPool:
+    """A pool of threads which save images as PNG files, so that the next
+    image can be made while the previous ones are being encoded. Pillow
+    releases the GIL while zlib compresses, so the threads run in parallel
+    with the caller.
+
+    At most `max_pending` images are waiting to be saved at once (submit()
+    blocks until there's room), since each one may be large. An error from
+    saving an image is raised by the next call to submit(), or on leaving the
+    with block."""
+
+    def __init__(
+        self, policy: ImagePolicy, *, jobs: int | None=None,
+        max_pending: int | None=None
+    ) -> None:
+
+        if jobs is None:
+            jobs = os.process_cpu_count() or 1
+
+        self.policy = policy
+        self.executor = ThreadPoolExecutor(jobs)
+        self.max_pending = jobs if max_pending is None else max_pending
+        self.pending: set[Future[None]] = set()
+
+    def _save(self, image: Image, path: Path) -> None:
+        try:
+            save_png(image, path, self.policy)
+        finally:
+            image.close()
+
+    def _collect(self, futures: set[Future[None]]) -> None:
+        for future in futures:
+            future.result()
+
+    def submit(self, image: Image, path: Path) -> None:
+        """Save `image` to `path` in the background, closing the image
+        afterwards."""
+
+        if len(self.pending) >= self.max_pending:
+            done, self.pending = wait(
+                self.pending, return_when=FIRST_COMPLETED
+            )
+
+            self._collect(done)
+
+        self.pending.add(self.executor.submit(self._save, image, path))
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None,
+        exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+
+        try:
+            if exc_type is None:
+                self._collect(self.pending)
+        finally:
+            self.executor.shutdown(cancel_futures=exc_type is not None)
@@ -116,13 +116,17 @@ class ClassDecl:
 	name: str
 	members: Sequence[ClassMember]=field(default_factory=lambda: [])
 	bases: Sequence[str]=field(default_factory=lambda: [])
+	slots: bool=True
+	"""Whether the class stores its attributes in slots rather than a
+	__dict__, which makes instances much smaller."""
 
 	def __str__(self) -> str:
 		bases_csv = ', '.join(self.bases)
 		bases_string = f'({bases_csv})' if self.bases else ''
+		slots_arg = ', slots=True' if self.slots else ''
 
 		return '\n'.join([
-			'@dataclass(frozen=True)',
+			f'@dataclass(frozen=True{slots_arg})',
 			f'class {self.name}{bases_string}:',
 			*(f'    {decl}' for decl in self.members),
 		])
@@ -220,7 +224,7 @@ class Module:
 	def __str__(self) -> str:
 		return '\n\n'.join(map(str, self.members))
 
-def generate_module() -> str:
+def generate_module(*, slots: bool=True) -> str:
 	result = Module()
 	classes_declared = set()
 
@@ -232,7 +236,10 @@ def generate_module() -> str:
 				continue
 
 			classes_declared.add(class_name)
-			result.members.extend(ClassDecl.from_schema(obj_schema))
+
+			for class_decl in ClassDecl.from_schema(obj_schema):
+				class_decl.slots = slots
+				result.members.append(class_decl)
 
 	return '\n'.join([
 		'from abc import ABC',
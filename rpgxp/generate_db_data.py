@@ -1,13 +1,11 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 import importlib.resources
-import io
 from pathlib import Path
 import random
 import re
 from typing import Any, Iterator, Self
-import numpy as np
-from rpgxp import db, material, parse, settings, sql
+from rpgxp import db, instrument, material, parse, settings, sql
 from rpgxp.generate_db_schema import DBSchema, generate_schema
 from rpgxp.schema import rpgxp_schema, Schema
 from rpgxp.util import camel_case_to_snake
@@ -36,10 +34,11 @@ def process_field(
             | Schema.FloatSchema() | Schema.StrSchema() | Schema.ZlibSchema()
         ):
             row_result = {col_name: field_value}
-        case Schema.NDArraySchema():
-            stream = io.BytesIO()
-            np.save(stream, field_value)
-            row_result = {col_name: stream.getvalue()}
+        case Schema.NDArraySchema(dims):
+            row_result = {col_name: field_value.tobytes(order='F')}
+
+            for axis, size in zip('xyz', field_value.shape[:dims]):
+                row_result[f'{col_name}_{axis}size'] = size
         case Schema.EnumSchema(enum_class):
             row_result = {col_name: field_value.value}
         case Schema.MaterialRefSchema():
@@ -372,11 +371,13 @@ def process_file_schema(
     match file_schema:
         case Schema.SingleFileSchema(filename, content_schema):
             print(f'processing {filename}')
-            parsed_content = parse.parse_filename(filename, data_root)
 
-            return process_table_schema(
-                content_schema, parsed_content, db_schema, {}
-            )
+            with instrument.timed(filename):
+                parsed_content = parse.parse_filename(filename, data_root)
+
+                return process_table_schema(
+                    content_schema, parsed_content, db_schema, {}
+                )
         case Schema.MultipleFilesSchema(pattern, table_name, keys, content_schema):
             db_table_schema = db_schema.get_table(table_name)
 
@@ -423,17 +424,18 @@ def process_file_schema(
                     row |= row_result
                     result += script_result
 
-                data = parse.parse_filename(filename, data_root)
-
                 parent_refs = {
                     f'{table_name}_{key_name}': key_value
                     for key_name, key_value in row.items()
                 }
 
-                row_result, script_result = process_field(
-                    data, '', content_schema, parent_refs,
-                    db_table_schema, db_schema
-                )
+                with instrument.timed(filename):
+                    data = parse.parse_filename(filename, data_root)
+
+                    row_result, script_result = process_field(
+                        data, '', content_schema, parent_refs,
+                        db_table_schema, db_schema
+                    )
 
                 row |= row_result
                 result += script_result
@@ -465,7 +467,9 @@ def process_file_schema(
         case _:
             assert False, file_schema
 
-def generate_script(*, db_schema: DBSchema, quick: bool=False) -> str:
+def generate_script(
+    *, db_schema: DBSchema, quick: bool=False
+) -> sql.Script:
     data_root = settings.game_data_root
     result = sql.Script()
 
@@ -474,19 +478,38 @@ def generate_script(*, db_schema: DBSchema, quick: bool=False) -> str:
             file_schema, data_root=data_root, db_schema=db_schema, quick=quick
         )
 
-    return str(result.with_truncation())
+    return result.with_truncation()
 
 def run(*, quick: bool=False) -> None:
-    material.generate_db_data()
+    with instrument.timed('material'):
+        material.generate_db_data()
 
     db_schema = generate_schema()
-    script = generate_script(db_schema=db_schema, quick=quick)
 
-    with open(settings.db_root / 'db_data.sql', 'w') as f:
-        f.write(script)
+    with instrument.timed('files'):
+        script_obj = generate_script(db_schema=db_schema, quick=quick)
+
+    with instrument.timed('render'):
+        script, digests = script_obj.render_with_digests()
+
+        with open(settings.db_root / 'db_data.sql', 'w') as f:
+            f.write(script)
 
     connection = db.connect()
     connection.pragma('foreign_keys', False)
 
-    with connection:
+    # the indexes are dropped while the data is loaded and recreated
+    # afterwards, which is quicker than updating them for every row
+    with instrument.timed('load'), connection:
+        connection.execute(db_schema.drop_index_script())
         connection.execute(script)
+
+    with instrument.timed('index'), connection:
+        connection.execute(db_schema.index_script())
+
+    # many of the foreign keys refer to enum tables, so their indexes aren't
+    # very selective; gathering statistics lets the query planner know this
+    with instrument.timed('analyze'):
+        connection.execute('PRAGMA analysis_limit = 1000; ANALYZE;')
+
+    db.record_table_digests(connection, digests)
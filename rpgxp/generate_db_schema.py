@@ -23,6 +23,42 @@ class DBSchema:
             if isinstance(s, sql.InsertStatement):
                 yield s
 
+    def indexes(self) -> Iterator[sql.IndexSchema]:
+        """Yield the indexes declared in rpgxp_schema.INDEXES, followed by an
+        index for each foreign key which isn't already covered by one of
+        them."""
+
+        declared: list[sql.IndexSchema] = []
+
+        for index in rpgxp_schema.INDEXES:
+            table = self.get_table(index.table_name)
+            column_names = {column.name for column in table.columns()}
+
+            missing = [c for c in index.columns if c not in column_names]
+
+            if missing:
+                raise Schema.SchemaError(
+                    f'index on {index.table_name} refers to nonexistent '
+                    f'columns: {", ".join(missing)}'
+                )
+
+            declared.append(sql.IndexSchema(
+                index.table_name, list(index.columns), index.unique
+            ))
+
+        yield from declared
+
+        for table in self.tables():
+            yield from table.foreign_key_indexes(
+                index.columns for index in declared
+                if index.table_name == table.name
+            )
+
+    def index_script(self) -> str:
+        return '\n'.join(str(index) for index in self.indexes())
+
+    def drop_index_script(self) -> str:
+        return '\n'.join(index.drop_string() for index in self.indexes())
 
     def add_table(self, table_schema: sql.TableSchema) -> None:
         self.script.statements.append(table_schema)
@@ -254,8 +290,28 @@ class DBSchema:
                     ))
             case Schema.StrSchema() | Schema.ZlibSchema():
                 result.members.append(sql.ColumnSchema(field_name, 'TEXT'))
-            case Schema.NDArraySchema():
+            case Schema.NDArraySchema(dims):
+                # the array is stored as the raw content of the Table it was
+                # parsed from (16-bit little-endian integers in Fortran
+                # order), with the size of each dimension in its own column
+                size_column_names = [
+                    f'{field_name}_{axis}size' for axis in 'xyz'[:dims]
+                ]
+
+                size_product = ' * '.join(
+                    f'"{name}"' for name in size_column_names
+                )
+
                 result.members.append(sql.ColumnSchema(field_name, 'BLOB'))
+
+                result.members.extend(
+                    sql.ColumnSchema(name, 'INTEGER')
+                    for name in size_column_names
+                )
+
+                result.members.append(sql.CheckConstraint(
+                    f'length("{field_name}") = 2 * {size_product}'
+                ))
             case Schema.EnumSchema(enum_class):
                 coltype = 'TEXT' if issubclass(enum_class, StrEnum) else 'INTEGER'
                 enum_table_name = camel_case_to_snake(enum_class.__name__)
@@ -400,12 +456,19 @@ def generate_script() -> str:
 
 def run() -> None:
     material.generate_db_schema()
-    script = generate_script()
+    db_schema = generate_schema()
+    script = str(db_schema.script)
     schema_path = settings.project_root / 'sql/schema.sql'
 
     with schema_path.open('w') as f:
         f.write(script)
 
+    # the indexes aren't created here, but after the data has been loaded
+    # (see generate_db_data.run), as that's much quicker than keeping them
+    # up to date while inserting the rows
+    with (settings.project_root / 'sql/indexes.sql').open('w') as f:
+        f.write(db_schema.index_script())
+
     connection = db.connect()
     connection.pragma('foreign_keys', False)
 
@@ -4,7 +4,7 @@ from typing import ClassVar, Optional
 import numpy as np
 from rpgxp.common import *
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Actor:
     id_: int
     name: str
@@ -29,7 +29,7 @@ class Actor:
     armor3_fix: bool
     armor4_fix: bool
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Animation:
     id_: int
     name: str
@@ -40,12 +40,12 @@ class Animation:
     frames: list[AnimationFrame]
     timings: list[AnimationTiming]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnimationFrame:
     cell_max: int
     cell_data: np.ndarray
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnimationTiming:
     frame: int
     se: AudioFile
@@ -54,20 +54,20 @@ class AnimationTiming:
     flash_duration: int
     condition: AnimationTimingCondition
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AudioFile:
     name: str
     volume: int
     pitch: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Color:
     red: float
     green: float
     blue: float
     alpha: float
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Armor:
     id_: int
     name: str
@@ -86,7 +86,7 @@ class Armor:
     guard_element_set: set[Optional[int]]
     guard_state_set: set[Optional[int]]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Class:
     id_: int
     name: str
@@ -97,12 +97,12 @@ class Class:
     state_ranks: np.ndarray
     learnings: list[ClassLearning]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClassLearning:
     level: int
     skill_id: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommonEvent:
     id_: int
     name: str
@@ -110,66 +110,66 @@ class CommonEvent:
     switch_id: Optional[int]
     list_: list[EventCommand]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand(ABC):
     code: ClassVar[int]
     indent: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_Blank(EventCommand):
     code = 0
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ShowText(EventCommand):
     code = 101
     text: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ShowChoices(EventCommand):
     code = 102
     choices: list[str]
     cancel_type: ChoicesCancelType
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_InputNumber(EventCommand):
     code = 103
     variable_id: Optional[int]
     max_digits: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangeTextOptions(EventCommand):
     code = 104
     position: TextPosition
     no_frame: bool
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ButtonInputProcessing(EventCommand):
     code = 105
     variable_id: Optional[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_Wait(EventCommand):
     code = 106
     duration: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_Comment(EventCommand):
     code = 108
     text: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch(EventCommand, ABC):
     code = 111
     subcode: ClassVar[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Switch(EventCommand_ConditionalBranch):
     code = 111
     subcode = 0
     switch_id: Optional[int]
     state: SwitchState
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Variable(EventCommand_ConditionalBranch):
     code = 111
     subcode = 1
@@ -178,171 +178,171 @@ class EventCommand_ConditionalBranch_Variable(EventCommand_ConditionalBranch):
     value: int
     comparison: Comparison
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_SelfSwitch(EventCommand_ConditionalBranch):
     code = 111
     subcode = 2
     self_switch_ch: SelfSwitch
     state: SwitchState
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Timer(EventCommand_ConditionalBranch):
     code = 111
     subcode = 3
     value: int
     bound_type: BoundType
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Actor(EventCommand_ConditionalBranch, ABC):
     code = 111
     subcode = 4
     actor_id: Optional[int]
     infracode: ClassVar[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Actor_InParty(EventCommand_ConditionalBranch_Actor):
     code = 111
     subcode = 4
     infracode = 0
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Actor_Name(EventCommand_ConditionalBranch_Actor):
     code = 111
     subcode = 4
     infracode = 1
     value: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Actor_Skill(EventCommand_ConditionalBranch_Actor):
     code = 111
     subcode = 4
     infracode = 2
     skill_id: Optional[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Actor_Weapon(EventCommand_ConditionalBranch_Actor):
     code = 111
     subcode = 4
     infracode = 3
     weapon_id: Optional[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Actor_Armor(EventCommand_ConditionalBranch_Actor):
     code = 111
     subcode = 4
     infracode = 4
     armor_id: Optional[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Actor_State(EventCommand_ConditionalBranch_Actor):
     code = 111
     subcode = 4
     infracode = 5
     state_id: Optional[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Enemy(EventCommand_ConditionalBranch, ABC):
     code = 111
     subcode = 5
     enemy_id: Optional[int]
     infracode: ClassVar[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Enemy_Appear(EventCommand_ConditionalBranch_Enemy):
     code = 111
     subcode = 5
     infracode = 0
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Enemy_State(EventCommand_ConditionalBranch_Enemy):
     code = 111
     subcode = 5
     infracode = 1
     state_id: Optional[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Character(EventCommand_ConditionalBranch):
     code = 111
     subcode = 6
     character_reference: int
     direction: Direction
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Gold(EventCommand_ConditionalBranch):
     code = 111
     subcode = 7
     amount: int
     bound_type: BoundType
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Item(EventCommand_ConditionalBranch):
     code = 111
     subcode = 8
     item_id: Optional[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Weapon(EventCommand_ConditionalBranch):
     code = 111
     subcode = 9
     weapon_id: Optional[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Armor(EventCommand_ConditionalBranch):
     code = 111
     subcode = 10
     armor_id: Optional[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Button(EventCommand_ConditionalBranch):
     code = 111
     subcode = 11
     button: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranch_Script(EventCommand_ConditionalBranch):
     code = 111
     subcode = 12
     expr: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_Loop(EventCommand):
     code = 112
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_BreakLoop(EventCommand):
     code = 113
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ExitEventProcessing(EventCommand):
     code = 115
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_EraseEvent(EventCommand):
     code = 116
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_CallCommonEvent(EventCommand):
     code = 117
     called_event_id: Optional[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_Label(EventCommand):
     code = 118
     id: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_JumpToLabel(EventCommand):
     code = 119
     id: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ControlSwitches(EventCommand):
     code = 121
     switch_id_lo: int
     switch_id_hi: int
     state: SwitchState
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ControlVariables(EventCommand, ABC):
     code = 122
     variable_id_hi: int
@@ -350,68 +350,68 @@ class EventCommand_ControlVariables(EventCommand, ABC):
     assign_type: AssignType
     operand_type: ClassVar[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ControlVariables_Invariant(EventCommand_ControlVariables):
     code = 122
     operand_type = 0
     value: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ControlVariables_Variable(EventCommand_ControlVariables):
     code = 122
     operand_type = 1
     variable_id: Optional[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ControlVariables_RandomNumber(EventCommand_ControlVariables):
     code = 122
     operand_type = 2
     lb: int
     ub: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ControlVariables_Character(EventCommand_ControlVariables):
     code = 122
     operand_type = 6
     attr_value: int
     attr_code: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ControlVariables_Other(EventCommand_ControlVariables):
     code = 122
     operand_type = 7
     other_operand_type: OtherOperandType
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ControlSelfSwitch(EventCommand):
     code = 123
     self_switch_ch: SelfSwitch
     state: SwitchState
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ControlTimer(EventCommand, ABC):
     code = 124
     subcode: ClassVar[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ControlTimer_Start(EventCommand_ControlTimer):
     code = 124
     subcode = 0
     initial_value: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ControlTimer_Stop(EventCommand_ControlTimer):
     code = 124
     subcode = 1
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangeGold(EventCommand):
     code = 125
     diff_type: DiffType
     with_variable: bool
     amount: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangeItems(EventCommand):
     code = 126
     item_id: Optional[int]
@@ -419,7 +419,7 @@ class EventCommand_ChangeItems(EventCommand):
     operand_type: ConstOrVar
     operand: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangeWeapons(EventCommand):
     code = 127
     weapon_id: Optional[int]
@@ -427,7 +427,7 @@ class EventCommand_ChangeWeapons(EventCommand):
     operand_type: ConstOrVar
     operand: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangeArmor(EventCommand):
     code = 128
     armor_id: Optional[int]
@@ -435,39 +435,39 @@ class EventCommand_ChangeArmor(EventCommand):
     operand_type: ConstOrVar
     operand: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangePartyMember(EventCommand):
     code = 129
     actor_id: Optional[int]
     add_or_remove: AddOrRemove
     initialize: bool
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangeBattleBGM(EventCommand):
     code = 132
     audio: AudioFile
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangeBattleEndME(EventCommand):
     code = 133
     audio: AudioFile
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangeSaveAccess(EventCommand):
     code = 134
     enabled: bool
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangeMenuAccess(EventCommand):
     code = 135
     enabled: bool
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangeEncounter(EventCommand):
     code = 136
     enabled: bool
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_TransferPlayer(EventCommand):
     code = 201
     with_variables: bool
@@ -477,7 +477,7 @@ class EventCommand_TransferPlayer(EventCommand):
     direction: Direction
     no_fade: bool
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_SetEventLocation(EventCommand):
     code = 202
     event_reference: int
@@ -486,26 +486,26 @@ class EventCommand_SetEventLocation(EventCommand):
     y: int
     direction: Direction
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ScrollMap(EventCommand):
     code = 203
     direction: Direction
     distance: int
     speed: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangeMapSettings(EventCommand, ABC):
     code = 204
     subcode: ClassVar[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangeMapSettings_Panorama(EventCommand_ChangeMapSettings):
     code = 204
     subcode = 0
     name: str
     hue: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangeMapSettings_Fog(EventCommand_ChangeMapSettings):
     code = 204
     subcode = 1
@@ -517,74 +517,74 @@ class EventCommand_ChangeMapSettings_Fog(EventCommand_ChangeMapSettings):
     sx: int
     sy: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangeMapSettings_BattleBack(EventCommand_ChangeMapSettings):
     code = 204
     subcode = 2
     name: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangeFogColorTone(EventCommand):
     code = 205
     tone: Tone
     duration: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangeFogOpacity(EventCommand):
     code = 206
     opacity: int
     duration: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ShowAnimation(EventCommand):
     code = 207
     event_reference: int
     animation_id: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangeTransparentFlag(EventCommand):
     code = 208
     is_normal: bool
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_SetMoveRoute(EventCommand):
     code = 209
     event_reference: int
     move_route: MoveRoute
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_WaitForMoveCompletion(EventCommand):
     code = 210
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_PrepareForTransition(EventCommand):
     code = 221
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ExecuteTransition(EventCommand):
     code = 222
     name: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangeScreenColorTone(EventCommand):
     code = 223
     tone: Tone
     duration: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ScreenFlash(EventCommand):
     code = 224
     color: Color
     duration: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ScreenShake(EventCommand):
     code = 225
     power: int
     speed: int
     duration: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ShowPicture(EventCommand):
     code = 231
     number: int
@@ -598,7 +598,7 @@ class EventCommand_ShowPicture(EventCommand):
     opacity: int
     blend_type: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_MovePicture(EventCommand):
     code = 232
     number: int
@@ -612,390 +612,390 @@ class EventCommand_MovePicture(EventCommand):
     opacity: int
     blend_type: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_RotatePicture(EventCommand):
     code = 233
     number: int
     speed: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ChangePictureColorTone(EventCommand):
     code = 234
     number: int
     tone: Tone
     duration: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ErasePicture(EventCommand):
     code = 235
     number: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_SetWeatherEffects(EventCommand):
     code = 236
     type: Weather
     power: int
     duration: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_PlayBGM(EventCommand):
     code = 241
     audio: AudioFile
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_FadeOutBGM(EventCommand):
     code = 242
     seconds: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_PlayBGS(EventCommand):
     code = 245
     audio: AudioFile
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_FadeOutBGS(EventCommand):
     code = 246
     seconds: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_MemorizeBGAudio(EventCommand):
     code = 247
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_RestoreBGAudio(EventCommand):
     code = 248
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_PlayME(EventCommand):
     code = 249
     audio: AudioFile
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_PlaySE(EventCommand):
     code = 250
     audio: AudioFile
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_StopSE(EventCommand):
     code = 251
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_BattleProcessing(EventCommand):
     code = 301
     opponent_troop_id: Optional[int]
     can_escape: bool
     can_continue_when_loser: bool
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ShopProcessing(EventCommand):
     code = 302
     goods: int
     price: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_NameInputProcessing(EventCommand):
     code = 303
     actor_id: Optional[int]
     maxlen: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_RecoverAll(EventCommand):
     code = 314
     actor_id: Optional[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_EnemyAppearance(EventCommand):
     code = 335
     enemy_index: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_EnemyTransform(EventCommand):
     code = 336
     enemy_index: int
     new_enemy_id: Optional[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_AbortBattle(EventCommand):
     code = 340
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_CallMenuScreen(EventCommand):
     code = 351
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_CallSaveScreen(EventCommand):
     code = 352
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_GameOver(EventCommand):
     code = 353
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ReturnToTitleScreen(EventCommand):
     code = 354
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_Script(EventCommand):
     code = 355
     line: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ContinueShowText(EventCommand):
     code = 401
     text: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ShowChoicesWhenChoice(EventCommand):
     code = 402
     choice_index: int
     choice_text: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ShowChoicesWhenCancel(EventCommand):
     code = 403
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ShowChoicesBranchEnd(EventCommand):
     code = 404
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ContinueComment(EventCommand):
     code = 408
     text: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_Else(EventCommand):
     code = 411
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ConditionalBranchEnd(EventCommand):
     code = 412
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_RepeatAbove(EventCommand):
     code = 413
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ContinueSetMoveRoute(EventCommand):
     code = 509
     command: MoveCommand
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_IfWin(EventCommand):
     code = 601
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_IfEscape(EventCommand):
     code = 602
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_IfLose(EventCommand):
     code = 603
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_BattleProcessingEnd(EventCommand):
     code = 604
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ContinueShopProcessing(EventCommand):
     code = 605
     goods: int
     price: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventCommand_ContinueScript(EventCommand):
     code = 655
     line: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Tone:
     red: float
     green: float
     blue: float
     grey: float
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveRoute:
     repeat: bool
     skippable: bool
     list_: list[MoveCommand]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand(ABC):
     code: ClassVar[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_Blank(MoveCommand):
     code = 0
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_MoveDown(MoveCommand):
     code = 1
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_MoveLeft(MoveCommand):
     code = 2
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_MoveRight(MoveCommand):
     code = 3
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_MoveUp(MoveCommand):
     code = 4
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_MoveLowerLeft(MoveCommand):
     code = 5
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_MoveLowerRight(MoveCommand):
     code = 6
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_MoveUpperLeft(MoveCommand):
     code = 7
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_MoveUpperRight(MoveCommand):
     code = 8
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_MoveAtRandom(MoveCommand):
     code = 9
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_MoveTowardPlayer(MoveCommand):
     code = 10
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_MoveAwayFromPlayer(MoveCommand):
     code = 11
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_StepForward(MoveCommand):
     code = 12
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_StepBackward(MoveCommand):
     code = 13
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_Jump(MoveCommand):
     code = 14
     x: int
     y: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_Wait(MoveCommand):
     code = 15
     duration: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_TurnDown(MoveCommand):
     code = 16
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_TurnLeft(MoveCommand):
     code = 17
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_TurnRight(MoveCommand):
     code = 18
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_TurnUp(MoveCommand):
     code = 19
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_Turn90Right(MoveCommand):
     code = 20
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_Turn90Left(MoveCommand):
     code = 21
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_Turn180(MoveCommand):
     code = 22
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_Turn90RightOrLeft(MoveCommand):
     code = 23
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_TurnAtRandom(MoveCommand):
     code = 24
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_TurnTowardPlayer(MoveCommand):
     code = 25
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_TurnAwayFromPlayer(MoveCommand):
     code = 26
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_SwitchOn(MoveCommand):
     code = 27
     switch_id: Optional[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_SwitchOff(MoveCommand):
     code = 28
     switch_id: Optional[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_ChangeSpeed(MoveCommand):
     code = 29
     speed: MoveSpeed
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_ChangeFreq(MoveCommand):
     code = 30
     freq: MoveFrequency
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_MoveAnimationOn(MoveCommand):
     code = 31
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_MoveAnimationOff(MoveCommand):
     code = 32
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_StopAnimationOn(MoveCommand):
     code = 33
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_StopAnimationOff(MoveCommand):
     code = 34
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_DirectionFixOn(MoveCommand):
     code = 35
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_DirectionFixOff(MoveCommand):
     code = 36
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_ThroughOn(MoveCommand):
     code = 37
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_ThroughOff(MoveCommand):
     code = 38
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_AlwaysOnTopOn(MoveCommand):
     code = 39
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_AlwaysOnTopOff(MoveCommand):
     code = 40
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_Graphic(MoveCommand):
     code = 41
     character_name: str
@@ -1003,27 +1003,27 @@ class MoveCommand_Graphic(MoveCommand):
     direction: Direction
     pattern: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_ChangeOpacity(MoveCommand):
     code = 42
     opacity: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_ChangeBlending(MoveCommand):
     code = 43
     blend_type: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_PlaySE(MoveCommand):
     code = 44
     audio: AudioFile
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveCommand_Script(MoveCommand):
     code = 45
     line: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Enemy:
     id_: int
     name: str
@@ -1051,7 +1051,7 @@ class Enemy:
     armor_id: Optional[int]
     treasure_prob: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnemyAction:
     kind: EnemyActionKind
     basic: EnemyBasicAction
@@ -1063,7 +1063,7 @@ class EnemyAction:
     condition_switch_id: Optional[int]
     rating: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Item:
     id_: int
     name: str
@@ -1091,7 +1091,7 @@ class Item:
     plus_state_set: set[Optional[int]]
     minus_state_set: set[Optional[int]]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Map:
     tileset_id: int
     width: int
@@ -1105,7 +1105,7 @@ class Map:
     data: np.ndarray
     events: dict[int, Event]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Event:
     id_: int
     name: str
@@ -1113,7 +1113,7 @@ class Event:
     y: int
     pages: list[EventPage]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventPage:
     condition: EventPageCondition
     graphic: EventPageGraphic
@@ -1129,7 +1129,7 @@ class EventPage:
     trigger: EventPageTrigger
     list_: list[EventCommand]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventPageCondition:
     switch1_valid: bool
     switch2_valid: bool
@@ -1141,7 +1141,7 @@ class EventPageCondition:
     variable_value: int
     self_switch_ch: SelfSwitch
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventPageGraphic:
     tile_id: int
     character_name: str
@@ -1151,7 +1151,7 @@ class EventPageGraphic:
     opacity: int
     blend_type: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MapInfo:
     name: str
     parent_id: Optional[int]
@@ -1160,13 +1160,13 @@ class MapInfo:
     scroll_x: int
     scroll_y: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Script:
     id_: int
     name: str
     content: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Skill:
     id_: int
     name: str
@@ -1194,7 +1194,7 @@ class Skill:
     plus_state_set: set[Optional[int]]
     minus_state_set: set[Optional[int]]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class State:
     id_: int
     name: str
@@ -1225,7 +1225,7 @@ class State:
     plus_state_set: set[Optional[int]]
     minus_state_set: set[Optional[int]]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class System:
     magic_number: int
     party_members: list[int]
@@ -1264,7 +1264,7 @@ class System:
     edit_map_id: Optional[int]
     _: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SystemWords:
     gold: str
     hp: str
@@ -1287,7 +1287,7 @@ class SystemWords:
     item: str
     equip: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SystemTestBattler:
     actor_id: int
     level: int
@@ -1297,7 +1297,7 @@ class SystemTestBattler:
     armor3_id: Optional[int]
     armor4_id: Optional[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Tileset:
     id_: int
     name: str
@@ -1317,14 +1317,14 @@ class Tileset:
     priorities: np.ndarray
     terrain_tags: np.ndarray
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Troop:
     id_: int
     name: str
     members: list[TroopMember]
     pages: list[TroopPage]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TroopMember:
     enemy_id: int
     x: int
@@ -1332,13 +1332,13 @@ class TroopMember:
     hidden: bool
     immortal: bool
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TroopPage:
     condition: TroopPageCondition
     span: TroopPageSpan
     list_: list[EventCommand]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TroopPageCondition:
     turn_valid: bool
     enemy_valid: bool
@@ -1352,7 +1352,7 @@ class TroopPageCondition:
     actor_hp: int
     switch_id: Optional[int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Weapon:
     id_: int
     name: str
@@ -1,24 +1,28 @@
+import functools as ft
 from PIL import Image as pil
-import numpy as np 
 
-def adjust_hue(image: pil.Image, value: int) -> pil.Image:
-    assert image.mode == 'RGBA'
+@ft.cache
+def hue_lut(value: int) -> list[int]:
+    """Return the lookup table for Image.point which rotates the hue of an
+    HSV image by the given RPG Maker XP hue (leaving the saturation and value
+    as they are)."""
 
     # RPG Maker XP hue values range from 0 to 360
     # Pillow hue values range from 0 to 256
-    scaled_value = np.uint8(((value / 360) * 256) % 256)
+    shift = int(((value / 360) * 256) % 256)
+    return [(h + shift) % 256 for h in range(256)] + [*range(256)] * 2
+
+def adjust_hue(image: pil.Image, value: int) -> pil.Image:
+    assert image.mode == 'RGBA'
+    lut = hue_lut(value)
+
+    if lut[0] == 0:
+        return image.copy()
 
     # HSV conversion doesn't preserve the alpha channel
     alpha = image.getchannel('A')
 
-    hsv = image.convert('HSV')
-    array = np.array(hsv)
-    h = array[:, :, 0]
-
-    with np.errstate(over='ignore'):
-        h += scaled_value
-    
-    hsv_adjusted = pil.fromarray(array, 'HSV')
+    hsv_adjusted = image.convert('HSV').point(lut)
 
     adjusted = hsv_adjusted.convert('RGBA')
     adjusted.putalpha(alpha)
@@ -26,8 +30,8 @@ def adjust_hue(image: pil.Image, value: int) -> pil.Image:
 
 if __name__ == '__main__':
     from rpgxp import settings
-    
+
     img = pil.open(settings.game_root / 'Graphics' / 'Battlers' / 'E_Mage.png')
-    
+
     imga = adjust_hue(img, 300)
-    imga.show()
\ No newline at end of file
+    imga.show()
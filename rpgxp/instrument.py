@@ -0,0 +1,143 @@
+from contextlib import contextmanager
+import cProfile
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import platform
+import resource
+import sys
+import threading
+import time
+from typing import Any, Iterator
+
+@dataclass
+class Timing:
+    """The resources used by a stage of a run, or by a part of a stage (such as
+    the processing of one data file).
+
+    The CPU time includes that of child processes which finished during the
+    stage. The peak RSS is the peak for the whole process up to the end of the
+    stage (the operating system doesn't provide a peak for a span of time), so
+    rss_growth_kib, the amount the peak went up during the stage, is the best
+    indication of how much memory the stage itself needed. Likewise, the CPU
+    time and peak RSS of stages which run at the same time include each
+    other's."""
+
+    name: str
+    wall_seconds: float=0.0
+    cpu_seconds: float=0.0
+    peak_rss_kib: int=0
+    rss_growth_kib: int=0
+    parts: list[Timing] = field(default_factory=lambda: [])
+
+    def to_json(self) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            'name': self.name,
+            'wall_seconds': round(self.wall_seconds, 6),
+            'cpu_seconds': round(self.cpu_seconds, 6),
+            'peak_rss_kib': self.peak_rss_kib,
+            'rss_growth_kib': self.rss_growth_kib,
+        }
+
+        if self.parts:
+            result['parts'] = [part.to_json() for part in self.parts]
+
+        return result
+
+_run_timing = Timing('run')
+
+_local = threading.local()
+
+def _stack() -> list[Timing]:
+    """Return the timing for the run as a whole, followed by those for the
+    stages and parts of stages which are in progress in the current thread,
+    innermost last."""
+
+    try:
+        return _local.stack
+    except AttributeError:
+        _local.stack = [_run_timing]
+        return _local.stack
+
+def cpu_seconds() -> float:
+    self_usage = resource.getrusage(resource.RUSAGE_SELF)
+    children_usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+    return (
+        self_usage.ru_utime + self_usage.ru_stime
+        + children_usage.ru_utime + children_usage.ru_stime
+    )
+
+def peak_rss_kib() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # macOS gives the peak in bytes, rather than kibibytes
+    if sys.platform == 'darwin':
+        peak //= 1024
+
+    return peak
+
+@contextmanager
+def timed(name: str, *, profile_path: Path | None=None) -> Iterator[Timing]:
+    """Record the resources used by the code in the with block, as a part of
+    whichever timed block it's nested in. If `profile_path` is given, the
+    block is also profiled with cProfile and the stats are saved there."""
+
+    timing = Timing(name)
+    stack = _stack()
+    stack[-1].parts.append(timing)
+    stack.append(timing)
+
+    profiler = None if profile_path is None else cProfile.Profile()
+    start_rss = peak_rss_kib()
+    start_cpu = cpu_seconds()
+    start_wall = time.perf_counter()
+
+    try:
+        if profiler is None:
+            yield timing
+        else:
+            with profiler:
+                yield timing
+    finally:
+        timing.wall_seconds = time.perf_counter() - start_wall
+        timing.cpu_seconds = cpu_seconds() - start_cpu
+        timing.peak_rss_kib = peak_rss_kib()
+        timing.rss_growth_kib = timing.peak_rss_kib - start_rss
+        stack.pop()
+
+        if profiler is not None:
+            assert profile_path is not None
+            profile_path.parent.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(profile_path)
+
+def summary(timing: Timing) -> str:
+    return (
+        f'{timing.name}: {timing.wall_seconds:.2f}s wall, '
+        f'{timing.cpu_seconds:.2f}s CPU, '
+        f'peak RSS {timing.peak_rss_kib / 1024:.1f} MiB '
+        f'(+{timing.rss_growth_kib / 1024:.1f} MiB)'
+    )
+
+def report(**run_info: Any) -> dict[str, Any]:
+    """Return a report of the stages which have been timed so far, together
+    with the given information about the run."""
+
+    return {
+        **run_info,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'wall_seconds': round(
+            sum(stage.wall_seconds for stage in _run_timing.parts), 6
+        ),
+        'stages': [stage.to_json() for stage in _run_timing.parts],
+    }
+
+def save_report(path: Path, **run_info: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+
+    with tmp_path.open('w', encoding='utf-8') as f:
+        json.dump(report(**run_info), f, indent=2)
+
+    tmp_path.replace(path)
@@ -0,0 +1,314 @@
+"""Lazy views of RPG Maker XP data files.
+
+The functions in rpgxp.parse turn the whole of a file into objects up front,
+which is wasteful when only a small part of the file is needed (e.g. the name
+of one map in MapInfos.rxdata). The views in this module wrap the node tree
+produced by the Marshal parser instead, and only convert a part of it into a
+Python value when that part is accessed. Each view caches the values it has
+converted, so each node is converted at most once.
+
+Objects, lists and hashes are wrapped in views; everything else (including
+event commands and the other objects with variants, which have to be looked
+at in full to work out their class) is converted by rpgxp.parse as soon as
+it's accessed. The checks made by rpgxp.parse are made at the same time as
+the conversion, so an invalid item in a list is only reported if it's
+accessed.
+"""
+
+from collections.abc import Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+import ruby_marshal_parser as marshal
+from rpgxp import parse
+from rpgxp.parse import ParseError
+from rpgxp.schema import Schema as schema
+
+_MISSING = object()
+"""Stands in for the items of a LazyList which haven't been converted yet (as
+None is a possible value)."""
+
+class LazyObject:
+    """A view of an object, whose fields are converted when they're first
+    accessed as attributes."""
+
+    __slots__ = ('_schema', '_field_nodes', '_cache')
+
+    _schema: schema.ObjSchema
+    _field_nodes: dict[str, marshal.Node]
+    _cache: dict[str, Any]
+
+    def __init__(self, obj_schema: schema.ObjSchema, node: marshal.Node):
+        self._schema = obj_schema
+        self._field_nodes = field_nodes(obj_schema, node)
+        self._cache = {}
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+
+        try:
+            node = self._field_nodes[name]
+        except KeyError:
+            raise AttributeError(
+                f'{self._schema.class_name} has no field {name!r}'
+            ) from None
+
+        value = lazy(self._schema.get_field(name).schema, node)
+        self._cache[name] = value
+        return value
+
+    def __dir__(self) -> list[str]:
+        return [field.name for field in self._schema.fields]
+
+    def __repr__(self) -> str:
+        return f'<lazy {self._schema.class_name}>'
+
+class LazyList(Sequence):
+    """A view of a list, whose items are converted when they're first
+    accessed."""
+
+    __slots__ = ('_item_schema', '_start', '_match_to', '_nodes', '_cache')
+
+    _item_schema: schema.DataSchema
+    _start: int
+    _match_to: str
+    _nodes: list[marshal.Node]
+    _cache: list[Any]
+
+    def __init__(self, list_schema: schema.ListSchema, node: marshal.Node):
+        start, nodes = parse.list_items(node, list_schema.first_item)
+
+        if not list_schema.length_schema.matches(len(nodes)):
+            raise ParseError(
+                f"array length {len(nodes)} doesn't match schema "
+                f'{list_schema.length_schema}'
+            )
+
+        self._item_schema = list_schema.item_schema
+        self._start = start
+        self._nodes = nodes
+
+        if isinstance(list_schema.index, schema.MatchIndexToField):
+            self._match_to = list_schema.index.match_to
+        else:
+            self._match_to = ''
+
+        self._cache = [_MISSING] * len(nodes)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+
+        value = self._cache[index]
+
+        if value is _MISSING:
+            value = lazy(self._item_schema, self._nodes[index])
+
+            if self._match_to:
+                match_field_value = getattr(value, self._match_to)
+                array_index = self._start + range(len(self))[index]
+
+                if array_index != match_field_value:
+                    raise ParseError(
+                        f"expected '{self._match_to}' value to be the same as "
+                        f'the array index which is {array_index}, but '
+                        f"instead it's {match_field_value}"
+                    )
+
+            self._cache[index] = value
+
+        return value
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __repr__(self) -> str:
+        return f'<lazy list of {len(self)}>'
+
+class LazyDict(Mapping):
+    """A view of a hash. The keys are converted straight away, and each value
+    is converted when it's first looked up."""
+
+    __slots__ = ('_value_schema', '_match_to', '_nodes', '_cache')
+
+    _value_schema: schema.ObjSchema
+    _match_to: str
+    _nodes: dict[Any, marshal.Node]
+    _cache: dict[Any, Any]
+
+    def __init__(self, dict_schema: schema.DictSchema, node: marshal.Node):
+        content = node.body_content
+
+        if not isinstance(content, (marshal.Hash, marshal.DefaultHash)):
+            raise ParseError(f'expected a hash')
+
+        key_schema = dict_schema.key_schema
+        self._value_schema = dict_schema.value_schema
+
+        if isinstance(dict_schema.key, schema.MatchKeyToField):
+            self._match_to = dict_schema.key.match_to
+        else:
+            self._match_to = ''
+
+        self._nodes = {
+            parse.parse(key_schema, key_node): value_node
+            for key_node, value_node in content.items
+        }
+
+        self._cache = {}
+
+    def __getitem__(self, key: Any) -> Any:
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        value = lazy(self._value_schema, self._nodes[key])
+
+        if self._match_to:
+            match_field_value = getattr(value, self._match_to)
+
+            if key != match_field_value:
+                raise ParseError(
+                    f"expected '{self._match_to}' value to be the same as the "
+                    f"hash key which is {key}, but instead it's "
+                    f'{match_field_value}'
+                )
+
+        self._cache[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __repr__(self) -> str:
+        return f'<lazy dict of {len(self)}>'
+
+def field_nodes(
+    obj_schema: schema.ObjSchema, node: marshal.Node
+) -> dict[str, marshal.Node]:
+    """Return the node for each field of an object, by field name."""
+
+    content = node.body_content
+
+    match obj_schema:
+        case schema.ArrayObjSchema(_, fields):
+            if not isinstance(content, marshal.Array):
+                raise ParseError(f'expected an array')
+
+            if len(content.items) != len(fields):
+                raise ParseError(
+                    f'expected an array of length {len(fields)}, got '
+                    f'{len(content.items)}'
+                )
+
+            return {
+                field.name: item for field, item in zip(fields, content.items)
+            }
+        case (
+            schema.RPGObjSchema(_, rpg_class_name, fields)
+            | schema.RPGSingletonObjSchema(_, _, rpg_class_name, fields)
+        ):
+            if not isinstance(content, marshal.Object):
+                raise ParseError(
+                    f"expected '{rpg_class_name}' object, got node of type "
+                    f"'{type(content).__name__}'"
+                )
+
+            if content.class_name != rpg_class_name:
+                raise ParseError(
+                    f"expected '{rpg_class_name}' object, got "
+                    f"'{content.class_name}'"
+                )
+
+            expected_ivars = {parse.as_ivar_name(f.rpg_name) for f in fields}
+            actual_ivars = set(node.inst_vars.keys())
+
+            if expected_ivars != actual_ivars:
+                raise ParseError(
+                    f'expected set of instance variables different from '
+                    f'actual; expected - actual = '
+                    f'{expected_ivars - actual_ivars}; actual - expected = '
+                    f'{actual_ivars - expected_ivars}'
+                )
+
+            return {
+                field.name: node.inst_vars[parse.as_ivar_name(field.rpg_name)]
+                for field in fields
+            }
+        case _:
+            assert False, type(obj_schema)
+
+def lazy(data_schema: schema.DataSchema, node: marshal.Node) -> Any:
+    """Return a lazy view of the data in a node, if it's an object, list or
+    hash; otherwise, convert it in the same way as rpgxp.parse.parse."""
+
+    match data_schema:
+        case (
+            schema.ArrayObjSchema() | schema.RPGObjSchema()
+            | schema.RPGSingletonObjSchema()
+        ):
+            return LazyObject(data_schema, node)
+        case schema.ListSchema():
+            return LazyList(data_schema, node)
+        case schema.DictSchema():
+            return LazyDict(data_schema, node)
+        case _:
+            return parse.parse(data_schema, node)
+
+def lazy_filename(target_filename: str, data_root: Path) -> Any:
+    content_schema = parse.filename_content_schema(target_filename)
+    data = marshal.parse_file(data_root / target_filename)
+    assert data.content is not None
+    return lazy(content_schema, data.content)
+
+def lookup(value: Any, path: list[str]) -> Any:
+    """Follow a path of attribute names, list indices and hash keys (given as
+    strings, with those consisting of digits taken to be integers)."""
+
+    for component in path:
+        key: str | int = int(component) if component.isdigit() else component
+
+        if isinstance(value, LazyList):
+            if not isinstance(key, int):
+                raise TypeError(f'list index must be an integer, not {key!r}')
+
+            value = value[key]
+        elif isinstance(value, LazyDict):
+            value = value[key]
+        else:
+            if not isinstance(key, str):
+                raise TypeError(
+                    f'attribute name must be a string, not {key!r}'
+                )
+
+            value = getattr(value, key)
+
+    return value
+
+if __name__ == '__main__':
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(
+        description=(
+            'Print part of an RPG Maker XP data file, converting only the '
+            'parts of the file on the way to it'
+        )
+    )
+
+    arg_parser.add_argument('data_root', type=Path)
+    arg_parser.add_argument('filename', type=str)
+
+    arg_parser.add_argument('path', nargs='*', help=(
+        'attribute names, list indices and hash keys leading to the value, '
+        'e.g. "0 name" for the name of the first actor in Actors.rxdata'
+    ))
+
+    parsed_args = arg_parser.parse_args()
+    content = lazy_filename(parsed_args.filename, parsed_args.data_root)
+    print(lookup(content, parsed_args.path))
@@ -1,7 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import os
 from pathlib import Path
-import shutil
+from typing import Iterator
 import apsw
 from rpgxp import db, settings
+from rpgxp.publish import publish_files, PublishMode
 
 SCHEMA = '''DROP TABLE IF EXISTS material_type;
 CREATE TABLE material_type (name TEXT PRIMARY KEY) STRICT;
@@ -69,6 +74,19 @@ CREATE TABLE material_file (
         REFERENCES material (type, subtype, name)
 ) STRICT;
 
+-- The modification time of each directory under a source's root as of the last
+-- time it was scanned (NULL for directories that didn't exist). Adding,
+-- removing or renaming a file changes the modification time of the directory
+-- containing it, so if none of these have changed, the source doesn't need to
+-- be rescanned.
+DROP TABLE IF EXISTS material_scan_snapshot;
+CREATE TABLE material_scan_snapshot (
+    source TEXT REFERENCES material_source (name),
+    path TEXT,
+    mtime_ns INTEGER,
+    PRIMARY KEY (source, path)
+) STRICT;
+
 -- Assigns a "best" file to each material to use in the website, in case there
 -- are multiple files with the same name. Game files will be preferred over RTP
 -- files, and for files from the same source, those whose file extensions come
@@ -100,43 +118,129 @@ CREATE TABLE material_best_file__materialized (
 INSERT INTO material_best_file__materialized (
     type, subtype, name, source, extension, full_name
 ) SELECT
-    m.type, m.subtype, m.name, m.source, m.extension, m.name || m.extension
-FROM material_file m
-JOIN material_source s on s.name = m.source
-WHERE NOT EXISTS (
-    SELECT * FROM material_file m2
-    JOIN material_source s2 on s2.name = m2.source
-    WHERE m2.type = m.type AND m2.subtype = m.subtype AND m2.name = m.name
-    AND (
-        s2.priority > s.priority
-        OR (s2.priority = s.priority AND m2.extension < m.extension)
-    )
-);
+    type, subtype, name, source, extension, name || extension
+FROM (
+    SELECT
+        m.type, m.subtype, m.name, m.source, m.extension,
+        ROW_NUMBER() OVER (
+            PARTITION BY m.type, m.subtype, m.name
+            ORDER BY s.priority DESC, m.extension
+        ) AS file_rank
+    FROM material_file m
+    JOIN material_source s on s.name = m.source
+)
+WHERE file_rank = 1;
+-- the primary key of material_file already orders the rows by partition, so
+-- only the files within each partition need sorting; this index is for looking
+-- materials up by their full name (e.g. for the graphics pages)
+CREATE INDEX material_best_file__materialized_full_name
+ON material_best_file__materialized (type, subtype, full_name);
 '''
 
-def insert_material(dbh: apsw.Connection, root: Path, source: str) -> None:
+MaterialFileRow = tuple[str, str, str, str, str]
+DirSnapshot = dict[str, int | None]
+
+def scan_subtype(
+    root: Path, source: str, type_: str, subtype: str
+) -> tuple[list[MaterialFileRow], DirSnapshot]:
+    """Find all the material files of a given type and subtype under `root`.
+    Return the rows for the material_file table, together with the
+    modification time of each directory that was scanned."""
+
+    rows: list[MaterialFileRow] = []
+    snapshot: DirSnapshot = {}
+    subtype_root = str(root / type_ / subtype)
+    stack = [(subtype_root, '')]
+
+    while stack:
+        dir_path, rel_dir = stack.pop()
+
+        try:
+            snapshot[dir_path] = os.stat(dir_path).st_mtime_ns
+
+            with os.scandir(dir_path) as dir_entries:
+                entries = list(dir_entries)
+        except FileNotFoundError:
+            snapshot[dir_path] = None
+            continue
+
+        for entry in entries:
+            if entry.is_dir():
+                stack.append((entry.path, os.path.join(rel_dir, entry.name)))
+                continue
+
+            stem, extension = os.path.splitext(entry.name)
+            name = os.path.join(rel_dir, stem) if rel_dir else stem
+            rows.append((type_, subtype, name, source, extension))
+
+    return rows, snapshot
+
+def snapshot_matches(dbh: apsw.Connection, root: Path, source: str) -> bool:
+    """Check whether the snapshot for the given source was taken with the same
+    root, and none of the directories recorded in it have been modified since
+    it was taken."""
+
+    snapshot = dbh.execute(
+        'SELECT path, mtime_ns FROM material_scan_snapshot WHERE source = ?',
+        (source,)
+    ).fetchall()
+
+    snapshot_paths = {path for path, _ in snapshot}
+
     for type_, subtype in dbh.execute(
         'SELECT type, name FROM material_subtype'
     ):
-        subtype_root = root / type_ / subtype
+        if str(root / str(type_) / str(subtype)) not in snapshot_paths:
+            return False
 
-        for path in subtype_root.rglob('*'):
-            if path.is_dir():
-                continue
+    for path, mtime_ns in snapshot:
+        assert isinstance(path, str)
 
-            name = str(path.relative_to(subtype_root).parent / path.stem)
+        try:
+            current_mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            current_mtime_ns = None
 
-            dbh.execute(
-                'INSERT OR IGNORE INTO material (type, subtype, name) '
-                'VALUES (?, ?, ?)',
-                (type_, subtype, name)
-            )
+        if current_mtime_ns != mtime_ns:
+            return False
 
-            dbh.execute(
+    return True
+
+def insert_material(dbh: apsw.Connection, root: Path, source: str) -> None:
+    """Scan the material files of the given source and replace its rows in
+    the material_file table with the result. The subtype directories are
+    scanned in parallel, and all the rows are inserted in a single
+    transaction."""
+
+    subtypes = dbh.execute('SELECT type, name FROM material_subtype').fetchall()
+
+    with ThreadPoolExecutor() as executor:
+        results = list(executor.map(
+            lambda subtype: scan_subtype(root, source, *subtype), subtypes
+        ))
+
+    with dbh:
+        dbh.execute('DELETE FROM material_file WHERE source = ?', (source,))
+
+        dbh.execute(
+            'DELETE FROM material_scan_snapshot WHERE source = ?', (source,)
+        )
+
+        for rows, snapshot in results:
+            dbh.executemany(
                 'INSERT INTO material_file '
                 '(type, subtype, name, source, extension) '
                 'VALUES (?, ?, ?, ?, ?)',
-                (type_, subtype, name, source, path.suffix)
+                rows
+            )
+
+            dbh.executemany(
+                'INSERT INTO material_scan_snapshot (source, path, mtime_ns) '
+                'VALUES (?, ?, ?)',
+                [
+                    (source, path, mtime_ns)
+                    for path, mtime_ns in snapshot.items()
+                ]
             )
 
 def root_for_source(source: str) -> Path:
@@ -156,21 +260,45 @@ def generate_db_schema():
         dbh.execute(SCHEMA)
 
 def generate_db_data():
-    rtp_root = settings.rtp_root
     dbh = db.connect()
     dbh.pragma('foreign_keys', False)
-    dbh.execute('DELETE FROM material_file')
-    dbh.execute('DELETE FROM material')
+
+    sources = ((settings.rtp_root, 'rtp'), (settings.game_root, 'game'))
+
+    for root, source in sources:
+        if snapshot_matches(dbh, root, source):
+            print(f'Material files for source {source} are unchanged')
+        else:
+            print(f'Scanning material files for source {source}')
+            insert_material(dbh, root, source)
 
     with dbh:
-        if rtp_root.exists():
-            insert_material(dbh, rtp_root, 'rtp')
+        dbh.execute('DELETE FROM material')
 
-        insert_material(dbh, settings.game_root, 'game')
+        # RTP files are inserted first, so that if the same material has files
+        # whose names differ in case, the RTP name is used
+        dbh.execute(
+            'INSERT OR IGNORE INTO material (type, subtype, name) '
+            'SELECT f.type, f.subtype, f.name FROM material_file f '
+            'JOIN material_source s ON s.name = f.source '
+            'ORDER BY s.priority'
+        )
 
     dbh.execute(MATERIALIZED_VIEWS)
 
-def copy_static_files():
+    # the contents of the material tables are determined by the snapshot
+    snapshot_digest = hashlib.sha256(json.dumps(dbh.execute(
+        'SELECT source, path, mtime_ns FROM material_scan_snapshot '
+        'ORDER BY source, path'
+    ).fetchall()).encode('utf-8')).hexdigest()
+
+    db.record_table_digests(dbh, {
+        table: snapshot_digest for table in (
+            'material_file', 'material', 'material_best_file__materialized'
+        )
+    })
+
+def static_file_paths() -> Iterator[tuple[Path, Path]]:
     dbh = db.connect()
 
     for type_, subtype, name, source, extension in dbh.execute(
@@ -184,6 +312,8 @@ def copy_static_files():
             settings.site_root / type_.lower() / subtype.lower() / full_name
         )
 
-        #print(f'Copying {src_path} to {dst_path}')
-        dst_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copyfile(src_path, dst_path)
+        yield src_path, dst_path
+
+def copy_static_files(*, mode: PublishMode=PublishMode.AUTO) -> None:
+    summary = publish_files(static_file_paths(), mode=mode)
+    print(f'Materials: {summary}')
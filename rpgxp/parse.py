@@ -1,17 +1,30 @@
 from enum import Enum, StrEnum
+import functools as ft
 from pathlib import Path
 import re
 import struct
-from typing import Any, assert_never
+from typing import Any, assert_never, TYPE_CHECKING
 import zlib
-import numpy as np
 import ruby_marshal_parser as marshal
+from rpgxp import parse_cache
 from rpgxp.schema import Schema as schema, rpgxp_schema
-from rpgxp.generated import schema as gschema
+
+# numpy and the generated classes are imported the first time they're needed,
+# since between them they take most of the time it takes to import this
+# module, and lazy lookups (see rpgxp.lazy) often need neither
+if TYPE_CHECKING:
+    import numpy as np
+    from rpgxp.generated import schema as gschema
 
 class ParseError(Exception):
     pass
 
+@ft.cache
+def generated_class(class_name: str) -> type:
+    # cached, as it's called for every object parsed
+    from rpgxp.generated import schema as gschema
+    return getattr(gschema, class_name)
+
 def parse_bool(node: marshal.Node) -> bool:
     content = node.body_content
 
@@ -112,7 +125,11 @@ def parse_array_from_table_data(
     # same row and column, but have different depths, are next to each other;
     # likewise any of the resulting "cells" which are on the same column are
     # next to each other.
-    return np.ndarray(shape=dimensions, dtype='h', buffer=tiledata, order='F')
+    import numpy as np
+
+    return np.ndarray(
+        shape=dimensions, dtype='<i2', buffer=tiledata, order='F'
+    )
 
 def parse_ndarray(dimcount: int, node: marshal.Node) -> np.ndarray:
     node_content = node.body_content
@@ -256,7 +273,7 @@ def parse_rpg_variant_obj[T](
         )
 
     subclass_name = f'{cls.__name__}_{variant.name}'
-    subclass = getattr(gschema, subclass_name)
+    subclass = generated_class(subclass_name)
     i = 0
 
     while True:
@@ -293,11 +310,13 @@ def parse_rpg_variant_obj[T](
             )
 
         subclass_name = f'{subclass_name}_{variant.name}'
-        subclass = getattr(gschema, subclass_name)
+        subclass = generated_class(subclass_name)
 
 def parse_color_from_data(data: bytes) -> gschema.Color:
+    from rpgxp.generated.schema import Color
+
     r, g, b, a = struct.unpack('<dddd', data)
-    return gschema.Color(r, g, b, a)
+    return Color(r, g, b, a)
 
 def parse_color(node: marshal.Node) -> gschema.Color:
     node_content = node.body_content
@@ -311,8 +330,10 @@ def parse_color(node: marshal.Node) -> gschema.Color:
     return parse_color_from_data(node_content.data)
 
 def parse_tone_from_data(data: bytes) -> gschema.Tone:
+    from rpgxp.generated.schema import Tone
+
     r, g, b, gray = struct.unpack('<dddd', data)
-    return gschema.Tone(r, g, b, gray)
+    return Tone(r, g, b, gray)
 
 def parse_tone(node: marshal.Node) -> gschema.Tone:
     node_content = node.body_content
@@ -325,29 +346,28 @@ def parse_tone(node: marshal.Node) -> gschema.Tone:
 
     return parse_tone_from_data(node_content.data)
 
-def parse_list(
-    item_schema: schema.DataSchema, node: marshal.Node, *,
-    first_item_behavior: schema.FirstItem,
-    length_schema: schema.IntSchema,
-    index_behavior: schema.IndexBehavior
-) -> list:
+def list_items(
+    node: marshal.Node, first_item_behavior: schema.FirstItem
+) -> tuple[int, list[marshal.Node]]:
+    """Return the index of the first item of an array which is actually part of
+    the list, along with the nodes for the items from that point on."""
 
     if not isinstance(node.body_content, marshal.Array):
         raise ParseError(f'expected an array')
 
-    items = iter(node.body_content.items)
+    items = node.body_content.items
 
     match first_item_behavior:
         case schema.FirstItem.REGULAR:
             start = 0
         case schema.FirstItem.NULL:
-            first_item = next(items)
+            first_item = items[0]
             start = 1
 
             if not isinstance(first_item.body_content, marshal.Nil):
                 raise ParseError(f'expected nil as first item of array')
         case schema.FirstItem.BLANK:
-            first_item = next(items)
+            first_item = items[0]
             start = 1
 
             if (
@@ -358,6 +378,17 @@ def parse_list(
         case _:
             assert False
 
+    return start, items[start:]
+
+def parse_list(
+    item_schema: schema.DataSchema, node: marshal.Node, *,
+    first_item_behavior: schema.FirstItem,
+    length_schema: schema.IntSchema,
+    index_behavior: schema.IndexBehavior
+) -> list:
+
+    start, items = list_items(node, first_item_behavior)
+
     result = []
 
     if isinstance(index_behavior, schema.MatchIndexToField):
@@ -454,18 +485,18 @@ def parse(data_schema: schema.DataSchema, node: marshal.Node) -> Any:
             foreign_pk_schema = foreign_schema.pk_schema()
             return parse(foreign_pk_schema, node)
         case schema.ArrayObjSchema(class_name, fields):
-            klass = getattr(gschema, class_name)
+            klass = generated_class(class_name)
             return parse_array_obj(klass, fields, node)
         case schema.RPGObjSchema(class_name, rpg_class_name, fields):
-            klass = getattr(gschema, class_name)
+            klass = generated_class(class_name)
             return parse_rpg_obj(klass, rpg_class_name, fields, node)
         case schema.RPGSingletonObjSchema(class_name, _, rpg_class_name, fields):
-            klass = getattr(gschema, class_name)
+            klass = generated_class(class_name)
             return parse_rpg_obj(klass, rpg_class_name, fields, node)
         case schema.RPGVariantObjSchema(
             class_name, rpg_class_name, fields, discriminant_name, variants
         ):
-            klass = getattr(gschema, class_name)
+            klass = generated_class(class_name)
             
             return parse_rpg_variant_obj(
                 klass, rpg_class_name, fields, discriminant_name, variants,
@@ -522,24 +553,45 @@ def parse_file(file_schema: schema.FileSchema, data_root: Path) -> Any:
         case _:
             assert False
 
-def parse_filename(target_filename: str, data_root: Path) -> Any:
-    path = data_root / target_filename
+def filename_content_schema(target_filename: str) -> schema.DataSchema:
+    """Return the schema for the content of the data file with the given
+    name."""
 
     for file_schema in rpgxp_schema.FILES:
         match file_schema:
             case schema.SingleFileSchema(filename, content_schema):
                 if filename == target_filename:
-                    data = marshal.parse_file(path)
-                    assert data.content is not None
-                    return parse(content_schema, data.content)
+                    return content_schema
             case schema.MultipleFilesSchema(pattern, _, _, content_schema):
                 if re.match(pattern, target_filename) is not None:
-                    data = marshal.parse_file(path)
-                    assert data.content is not None
-                    return parse(content_schema, data.content)
+                    return content_schema
             case _:
                 assert_never(file_schema)
 
+    raise ValueError(f'no schema for data file {target_filename}')
+
+def parse_path(content_schema: schema.DataSchema, path: Path) -> Any:
+    data = marshal.parse_file(path)
+    assert data.content is not None
+    return parse(content_schema, data.content)
+
+def parse_filename(
+    target_filename: str, data_root: Path, *, use_cache: bool=True
+) -> Any:
+    """Parse a data file. Unless `use_cache` is false, the result is looked up
+    in (or added to) the parse cache, so that files which haven't changed
+    since the last time they were parsed don't need to be parsed again."""
+
+    content_schema = filename_content_schema(target_filename)
+    path = data_root / target_filename
+
+    if not use_cache:
+        return parse_path(content_schema, path)
+
+    return parse_cache.cached(
+        path, lambda path: parse_path(content_schema, path)
+    )
+
 if __name__ == '__main__':
     import argparse
 
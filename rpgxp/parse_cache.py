@@ -0,0 +1,200 @@
+from dataclasses import dataclass
+import functools as ft
+import hashlib
+import importlib.util
+from pathlib import Path
+import pickle
+import struct
+from typing import Any, Callable
+from rpgxp import settings
+
+MAGIC = b'RPGXPPC1'
+
+HEADER = struct.Struct('<8s32s32sIQ')
+"""The header of a cache entry: MAGIC, the digest of the data file, the schema
+digest, the number of out-of-band buffers and the length of the pickle. The
+header is followed by the length of each buffer (as an unsigned 64-bit
+integer), then the pickle, then the buffers."""
+
+BUFFER_LENGTH = struct.Struct('<Q')
+
+PARSE_VERSION = 1
+"""Incremented whenever the parsed content of a file changes for a reason
+which isn't captured by the schema sources or modules below (such as a change
+in how a dependency behaves), to invalidate the whole cache."""
+
+SCHEMA_SOURCES = (
+    'parse.py', 'common.py', 'schema/Schema.py', 'schema/rpgxp_schema.py',
+    'generated/schema.py',
+)
+"""The modules which determine what the parsed content of a file looks like,
+relative to the package root. If any of them change, the whole cache is
+invalidated."""
+
+SCHEMA_MODULES = ('ruby_marshal_parser',)
+"""Modules outside the package which determine what the parsed content of a
+file looks like. If any of their files change, the whole cache is
+invalidated."""
+
+def cache_root() -> Path:
+    return settings.db_root / 'parse_cache'
+
+def module_files(module_name: str) -> list[tuple[str, Path]]:
+    """Return the files a top-level module is loaded from (every file under it,
+    for a package), without importing it. Each file comes with its path
+    relative to the directory the module is in."""
+
+    spec = importlib.util.find_spec(module_name)
+
+    if spec is None:
+        return []
+
+    if spec.submodule_search_locations is None:
+        if spec.origin is None:
+            return []
+
+        path = Path(spec.origin)
+        return [(path.name, path)]
+
+    return sorted(
+        (str(path.relative_to(Path(location).parent)), path)
+        for location in spec.submodule_search_locations
+        for path in Path(location).rglob('*')
+        if path.is_file() and '__pycache__' not in path.parts
+    )
+
+@ft.cache
+def schema_digest() -> bytes:
+    hasher = hashlib.sha256(f'{PARSE_VERSION}\0'.encode('utf-8'))
+
+    for source in SCHEMA_SOURCES:
+        hasher.update((settings.package_root / source).read_bytes())
+
+    for module_name in SCHEMA_MODULES:
+        hasher.update(f'{module_name}\0'.encode('utf-8'))
+
+        for name, path in module_files(module_name):
+            hasher.update(f'{name}\0'.encode('utf-8'))
+            hasher.update(path.read_bytes())
+
+    return hasher.digest()
+
+def entry_path(path: Path, file_digest: bytes) -> Path:
+    """Return the path of the cache entry for a data file with the given
+    digest. Entries are named after a digest of the data file's full path
+    (since which schema a file is parsed with depends on its name), followed
+    by the digest of its contents."""
+
+    path_digest = hashlib.sha256(str(path.resolve()).encode('utf-8'))
+    name = f'{path_digest.hexdigest()}-{file_digest.hex()}.pickle'
+    return cache_root() / name
+
+@dataclass
+class Entry:
+    file_digest: bytes
+    schema_digest: bytes
+    content: Any
+
+def dump(entry: Entry) -> list[bytes | memoryview]:
+    """Serialize a cache entry. NumPy arrays in the content are stored
+    out-of-band, so that they're written to the file as they are rather than
+    being copied into the pickle."""
+
+    buffers: list[pickle.PickleBuffer] = []
+
+    data = pickle.dumps(
+        entry.content, protocol=5, buffer_callback=buffers.append
+    )
+
+    raw_buffers = [buffer.raw() for buffer in buffers]
+
+    return [
+        HEADER.pack(
+            MAGIC, entry.file_digest, entry.schema_digest, len(raw_buffers),
+            len(data)
+        ),
+        *(BUFFER_LENGTH.pack(len(buffer)) for buffer in raw_buffers),
+        data,
+        *raw_buffers,
+    ]
+
+def load(data: bytes, file_digest: bytes) -> Entry | None:
+    """Deserialize a cache entry, unless it's for a different version of the
+    file or the schema, in which case return None. The NumPy arrays in the
+    content share memory with `data`."""
+
+    if len(data) < HEADER.size:
+        return None
+
+    magic, entry_file_digest, entry_schema_digest, buffer_count, data_length \
+        = HEADER.unpack_from(data)
+
+    if (
+        magic != MAGIC
+        or entry_file_digest != file_digest
+        or entry_schema_digest != schema_digest()
+    ):
+        return None
+
+    view = memoryview(data)
+    offset = HEADER.size
+    buffer_lengths: list[int] = []
+
+    for _ in range(buffer_count):
+        length, = BUFFER_LENGTH.unpack_from(data, offset)
+        buffer_lengths.append(length)
+        offset += BUFFER_LENGTH.size
+
+    pickle_data = view[offset:offset + data_length]
+    offset += data_length
+    buffers: list[memoryview] = []
+
+    for length in buffer_lengths:
+        buffers.append(view[offset:offset + length])
+        offset += length
+
+    content = pickle.loads(pickle_data, buffers=buffers)
+    return Entry(entry_file_digest, entry_schema_digest, content)
+
+def cached(path: Path, parse_path: Callable[[Path], Any]) -> Any:
+    """Return the parsed content of a data file from the cache, or parse it with
+    `parse_path` and add it to the cache if it's not there. Entries are keyed by
+    the file's path and contents (see `entry_path`), and only used if the
+    schema is unchanged. Adding an entry removes any other entry for the same
+    path."""
+
+    file_digest = hashlib.sha256(path.read_bytes()).digest()
+    cache_path = entry_path(path, file_digest)
+
+    try:
+        entry = load(cache_path.read_bytes(), file_digest)
+    except FileNotFoundError:
+        entry = None
+    except Exception as e:
+        # a corrupt entry is just treated as missing
+        print(f'warning: ignoring parse cache entry {cache_path}: {e!r}')
+        entry = None
+
+    if entry is not None:
+        return entry.content
+
+    content = parse_path(path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix('.tmp')
+
+    with tmp_path.open('wb') as f:
+        f.writelines(dump(Entry(file_digest, schema_digest(), content)))
+
+    tmp_path.replace(cache_path)
+
+    # entries for earlier contents of the same file are never used again
+    path_prefix = cache_path.name.split('-')[0]
+
+    for stale_path in cache_path.parent.glob(f'{path_prefix}-*.pickle'):
+        if stale_path != cache_path:
+            stale_path.unlink(missing_ok=True)
+
+    # nor is the entry from before entries were named after digests
+    (cache_path.parent / f'{path.name}.pickle').unlink(missing_ok=True)
+
+    return content
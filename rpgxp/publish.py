@@ -0,0 +1,146 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+import os
+from pathlib import Path
+import shutil
+from typing import Iterable
+
+FICLONE = 0x40049409
+"""The Linux ioctl request code for cloning a file (i.e. making a reflink)."""
+
+class PublishMode(Enum):
+    """How files are published to the site.
+
+    In every mode, files whose destination already has the same size and
+    modification time as the source are skipped."""
+
+    AUTO = 'auto'
+    """Make a reflink if possible, otherwise a hard link if possible, and
+    otherwise a copy."""
+
+    REFLINK = 'reflink'
+    """Make a reflink (a copy-on-write clone of the file) if possible, and
+    otherwise a copy."""
+
+    LINK = 'link'
+    """Make a hard link if possible, and otherwise a copy."""
+
+    COPY = 'copy'
+    """Always make a copy."""
+
+class PublishAction(Enum):
+    SKIPPED = 'skipped'
+    REFLINKED = 'reflinked'
+    LINKED = 'linked'
+    COPIED = 'copied'
+
+@dataclass
+class PublishSummary:
+    files: dict[PublishAction, int] = field(
+        default_factory=lambda: {action: 0 for action in PublishAction}
+    )
+
+    sizes: dict[PublishAction, int] = field(
+        default_factory=lambda: {action: 0 for action in PublishAction}
+    )
+
+    def add(self, action: PublishAction, size: int) -> None:
+        self.files[action] += 1
+        self.sizes[action] += size
+
+    def __str__(self) -> str:
+        total = sum(self.files.values())
+
+        parts = ', '.join(
+            f'{self.files[action]} {action.value} '
+            f'({format_size(self.sizes[action])})'
+            for action in PublishAction
+        )
+
+        return f'Published {total} files: {parts}'
+
+def format_size(size: int) -> str:
+    if size < 1024:
+        return f'{size} B'
+
+    value = size / 1024
+
+    for unit in ('KiB', 'MiB'):
+        if value < 1024:
+            return f'{value:.1f} {unit}'
+
+        value /= 1024
+
+    return f'{value:.1f} GiB'
+
+def reflink(src_path: Path, dst_path: Path) -> None:
+    import fcntl
+
+    with src_path.open('rb') as src, dst_path.open('wb') as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            dst_path.unlink()
+            raise
+
+def publish_file(
+    src_path: Path, dst_path: Path, mode: PublishMode
+) -> tuple[PublishAction, int]:
+
+    src_stat = src_path.stat()
+
+    try:
+        dst_stat = dst_path.stat()
+    except FileNotFoundError:
+        dst_path.parent.mkdir(parents=True, exist_ok=True)
+    else:
+        if (
+            dst_stat.st_size == src_stat.st_size
+            and dst_stat.st_mtime_ns == src_stat.st_mtime_ns
+        ):
+            return PublishAction.SKIPPED, src_stat.st_size
+
+        # the destination may be a hard link to an old version of the source,
+        # so it's replaced rather than written to
+        dst_path.unlink()
+
+    if mode in (PublishMode.AUTO, PublishMode.REFLINK):
+        try:
+            reflink(src_path, dst_path)
+        except (ImportError, OSError):
+            pass
+        else:
+            os.utime(dst_path, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+            return PublishAction.REFLINKED, src_stat.st_size
+
+    if mode in (PublishMode.AUTO, PublishMode.LINK):
+        try:
+            os.link(src_path, dst_path)
+        except OSError:
+            pass
+        else:
+            return PublishAction.LINKED, src_stat.st_size
+
+    shutil.copyfile(src_path, dst_path)
+    os.utime(dst_path, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    return PublishAction.COPIED, src_stat.st_size
+
+def publish_files(
+    paths: Iterable[tuple[Path, Path]],
+    *, mode: PublishMode=PublishMode.AUTO, jobs: int | None=None
+) -> PublishSummary:
+    """Publish each source path in `paths` to the corresponding destination
+    path. The files are handled by a pool of `jobs` threads, since the work is
+    almost all waiting on the filesystem."""
+
+    summary = PublishSummary()
+
+    with ThreadPoolExecutor(jobs) as executor:
+        for action, size in executor.map(
+            lambda pair: publish_file(pair[0], pair[1], mode), paths
+        ):
+            summary.add(action, size)
+
+    return summary
@@ -2,7 +2,9 @@ from dataclasses import dataclass, field
 from enum import Enum
 import mimetypes
 import json
-from typing import Any, assert_never, Iterator, Self
+from pathlib import Path
+import re
+from typing import Any, assert_never, Callable, Iterator, Self
 import apsw
 from rpgxp import db
 from rpgxp.util import expect1
@@ -136,6 +138,13 @@ def json_param(*, optional: bool=False) -> ParamType:
 		{BasicParamType.NONE} if optional else set()
 	))
 
+type BinaryRenderer = Callable[..., bytes | Path | Iterator[bytes]]
+"""A function which renders a binary page directly, given the template
+arguments as keyword arguments. It may return either the content of the page,
+the path to an existing file whose content is the content of the page, or an
+iterator over the chunks of the content (for pages which are too big to be
+held in memory at once)."""
+
 class PatternParserState(Enum):
 	START = 0
 	VAR = 1
@@ -151,17 +160,21 @@ class Route:
 	treated as a regex where each pattern variable is replaced with a named
 	capture group of the form (?P<name>.*?)."""
 	
-	template: str
+	template: str | BinaryRenderer
 	"""The path to the template which will be used to render the route, relative
-	to the /templates directory."""
+	to the /templates directory.
+
+	For binary routes, this may instead be a function which renders the page
+	(see `BinaryRenderer`). Its output is written or served as it is, without
+	going through Jinja."""
 
 	template_query: str | None = None
 	"""The path to the SQL query which is used to fetch the template arguments.
-	This query will have the URL arguments passed to it as parameters, and it
-	should return a set of columns with the same names as the template
-	arguments; the values of these columns, after being parsed according to
-	their type as indicated by the `param_types` field, will be used as the
-	template arguments.
+	This query will have the URL arguments passed to it as parameters (unless
+	`batched` is set), and it should return a set of columns with the same
+	names as the template arguments; the values of these columns, after being
+	parsed according to their type as indicated by the `param_types` field,
+	will be used as the template arguments.
 	
 	If set to None, the template will receive no arguments."""
 
@@ -190,6 +203,44 @@ class Route:
 	encoding (based on whether the content is text or binary; UTF-8 is used
 	for all text content)."""
 
+	dependency_query: str | None = None
+	"""The path to the SQL query which is used to fetch any inputs of a page
+	other than its template and template arguments, such as a map's tile data.
+	This is used only when generating the site statically, in order to decide
+	whether a page needs to be regenerated. The query will have the URL
+	arguments passed to it as parameters, and every value in every row of its
+	result counts as an input. A row which has the columns `source`, `type`,
+	`subtype` and `name` refers to a material file, which counts as an input as
+	well.
+
+	If the route is batched, so is its dependency query: it's run without any
+	parameter bindings, and is expected to return the rows for every page at
+	once, with columns named after the variables in the URL pattern (which
+	don't count as inputs) as well as the inputs themselves.
+
+	If set to None, the page is assumed to depend only on its template and
+	template arguments (which includes any material file they refer to)."""
+
+	batched: bool=False
+	"""Whether the template query fetches the template arguments for every
+	page of the route at once. If so, the query is run without any parameter
+	bindings, and is expected to return one row per page, with columns named
+	after the variables in the URL pattern as well as the template arguments.
+	When generating the site statically, it's run once, in place of running
+	the URL query and then the template query once for each page. The template
+	arguments for a single page are fetched by filtering its result down to the
+	row whose URL argument columns are equal to the URL arguments (see
+	`page_query`)."""
+
+	query_params: list[str]=field(default_factory=lambda: [])
+	"""The names of parameters which are taken from the query string of the
+	URL, rather than from the URL pattern. They are passed to the template
+	query along with the URL arguments (as empty strings, if they're missing
+	from the query string).
+
+	Routes with query parameters can only be served dynamically, so no pages
+	are generated for them when generating the site statically."""
+
 	def url(self, **args: str) -> str:
 		"""Substitute URL parameter values into the URL pattern to return a
 		specific page's URL."""
@@ -236,6 +287,39 @@ class Route:
 
 		return ''.join(result_chars)
 
+	@property
+	def template_name(self) -> str:
+		"""A name for the template, for use in messages."""
+		template = self.template
+
+		if isinstance(template, str):
+			return template
+
+		return f'{template.__module__}.{template.__qualname__}'
+
+	def url_params(self) -> list[str]:
+		"""Return the names of the variables in the URL pattern."""
+		return re.findall(r'{([^{}]*)}', self.url_pattern)
+
+	def page_query(self) -> str:
+		"""Return the SQL for fetching the template arguments of a single page,
+		for a route whose template query is batched."""
+
+		assert self.batched and self.template_query is not None
+		return self._filter_to_page(self.template_query)
+
+	def _filter_to_page(self, query_name: str) -> str:
+		url_params = self.url_params()
+		assert url_params, 'a batched route needs URL parameters'
+		sql = db.named_query(query_name).strip().removesuffix(';')
+
+		conditions = ' AND '.join(
+			f'"{param}" = :{param}' for param in url_params
+		)
+
+		# the query is put on lines of its own in case it ends with a comment
+		return f'SELECT * FROM (\n{sql}\n) WHERE {conditions}'
+
 	def format_template_args(
 		self, args: dict[str, apsw.SQLiteValue]
 	) -> dict[str, Any]:
@@ -264,15 +348,26 @@ class Route:
 
 		return result
 
-	def get_template_args(self, url_args: dict[str, str]) -> dict[str, Any]:
+	def get_template_args(
+		self, url_args: dict[str, str], *, dbh: apsw.Connection | None=None
+	) -> dict[str, Any]:
+
 		template_query = self.template_query
 		url_query = self.url_query
 
 		if template_query is None:
 			return {}
 
+		if dbh is None:
+			dbh = db.connect()
+
 		try:
-			query_result = db.run_named_query(template_query, url_args)
+			if self.batched:
+				query_result = dbh.execute(self.page_query(), url_args)
+			else:
+				query_result = db.run_named_query(
+					template_query, url_args, dbh=dbh
+				)
 		except Exception as e:
 			if isinstance(e, KeyError):
 				e.add_note(f'No argument given for URL parameter "{e.args[0]}"')
@@ -299,4 +394,114 @@ class Route:
 		
 		return self.format_template_args(
 			dict(zip(template_params, template_arg_values))
-		)
\ No newline at end of file
+		)
+
+	def get_dependencies(
+		self, url_args: dict[str, str], *, dbh: apsw.Connection | None=None
+	) -> list[dict[str, apsw.SQLiteValue]]:
+
+		dependency_query = self.dependency_query
+
+		if dependency_query is None:
+			return []
+
+		if dbh is None:
+			dbh = db.connect()
+
+		if self.batched:
+			query_result = dbh.execute(
+				self._filter_to_page(dependency_query), url_args
+			)
+		else:
+			query_result = db.run_named_query(
+				dependency_query, url_args, dbh=dbh
+			)
+
+		try:
+			query_desc = query_result.get_description()
+		except apsw.ExecutionCompleteError:
+			return []
+
+		columns, _ = zip(*query_desc)
+		url_params = set(self.url_params()) if self.batched else set()
+
+		return [
+			{
+				column: value for column, value in zip(columns, row)
+				if column not in url_params
+			}
+			for row in query_result
+		]
+
+	def batch_dependencies(
+		self, *, dbh: apsw.Connection | None=None
+	) -> dict[tuple[str, ...], list[dict[str, apsw.SQLiteValue]]]:
+		"""Run the batched dependency query, returning the dependencies of each
+		page (as returned by `get_dependencies`), keyed by the values of its
+		URL arguments in the order of `url_params`. Pages without any
+		dependencies are left out."""
+
+		dependency_query = self.dependency_query
+		assert self.batched and dependency_query is not None
+		query_result = db.run_named_query(dependency_query, dbh=dbh)
+		result: dict[tuple[str, ...], list[dict[str, apsw.SQLiteValue]]] = {}
+
+		try:
+			query_desc = query_result.get_description()
+		except apsw.ExecutionCompleteError:
+			return result
+
+		columns, _ = zip(*query_desc)
+		url_params = self.url_params()
+
+		for row in query_result:
+			args = dict(zip(columns, row))
+
+			try:
+				key = tuple(str(args.pop(param)) for param in url_params)
+			except KeyError as e:
+				e.add_note(
+					f'Expected a column in the batched dependency query result '
+					f'named {e.args[0]}'
+				)
+				e.add_note(f'Query name is {dependency_query}')
+				raise
+
+			result.setdefault(key, []).append(args)
+
+		return result
+
+	def iter_batch_args(
+		self, *, dbh: apsw.Connection | None=None
+	) -> Iterator[tuple[dict[str, str], dict[str, apsw.SQLiteValue]]]:
+		"""Run the batched template query, yielding the URL arguments and the
+		raw (i.e. not yet formatted) template arguments for each page as they
+		are read from the cursor."""
+
+		template_query = self.template_query
+		assert self.batched and template_query is not None
+		query_result = db.run_named_query(template_query, dbh=dbh)
+
+		try:
+			query_desc = query_result.get_description()
+		except apsw.ExecutionCompleteError:
+			# the query returned no rows, so there are no pages to generate
+			return
+
+		columns, _ = zip(*query_desc)
+		url_params = self.url_params()
+
+		for row in query_result:
+			args = dict(zip(columns, row))
+
+			try:
+				url_args = {param: str(args[param]) for param in url_params}
+			except KeyError as e:
+				e.add_note(
+					f'Expected a column in the batched template query result '
+					f'named {e.args[0]}'
+				)
+				e.add_note(f'Query name is {template_query}')
+				raise
+
+			yield url_args, args
@@ -3,12 +3,19 @@ import functools as ft
 from rpgxp.route.Route import (
     Route, ContentType, bool_param, int_param, str_param, json_param
 )
+from rpgxp.site import binary
 
 @ft.cache
 def routes() -> list[Route]:
 	return [
 		Route('index.html', 'index.j2'),
 
+		# search
+		Route('search', 'search.j2', 'view_search', {
+			'q': str_param(),
+			'results': json_param(),
+		}, query_params=['q']),
+
 		# maps
 		Route('maps.html', 'maps.j2', 'view_maps', {'maps': json_param()}),
 		Route('map/{id}.html', 'map.j2', 'view_map', {
@@ -22,10 +29,12 @@ def routes() -> list[Route]:
 			'bgs': json_param(optional=True),
 			'encounter_step': int_param(),
 			'encounters': json_param(),
-		}, 'map_ids'),
-		Route('map/{id}.png', 'map_image.j2', 'view_map_image', {
+		}, 'map_ids', batched=True),
+		Route('map/{id}.png', binary.map_image, 'map_ids_with_images', {
 			'id': int_param(),
-		}, 'map_ids_with_images', content_type=ContentType.PNG),
+		}, 'map_ids_with_images', content_type=ContentType.PNG,
+		dependency_query='map_image_dependencies',
+		batched=True),
 
 		# tilesets
 		Route('tilesets.html', 'tilesets.j2', 'view_tilesets', {
@@ -41,9 +50,9 @@ def routes() -> list[Route]:
 			'fog': json_param(optional=True),
 			'battleback': json_param(optional=True),
 			'maps': json_param(),
-		}, 'tileset_ids'),
+		}, 'tileset_ids', batched=True),
 		Route(
-			'tileset/{id}/panorama.png', 'material_with_hue.j2',
+			'tileset/{id}/panorama.png', binary.material_with_hue,
 			'view_panorama',
 			{
 				'source': str_param(),
@@ -52,10 +61,11 @@ def routes() -> list[Route]:
 				'name': str_param(),
 				'hue': int_param()
 			},
-			'tileset_ids_with_panoramas', content_type=ContentType.PNG
+			'tileset_ids_with_panoramas', content_type=ContentType.PNG,
+			batched=True
 		),
 		Route(
-			'tileset/{id}/fog.png', 'material_with_hue.j2',
+			'tileset/{id}/fog.png', binary.material_with_hue,
 			'view_fog',
 			{
 				'source': str_param(),
@@ -64,7 +74,8 @@ def routes() -> list[Route]:
 				'name': str_param(),
 				'hue': int_param()
 			},
-			'tileset_ids_with_fogs', content_type=ContentType.PNG
+			'tileset_ids_with_fogs', content_type=ContentType.PNG,
+			batched=True
 		),
 
 		# common events
@@ -76,7 +87,8 @@ def routes() -> list[Route]:
                 'id': int_param(),
                 'name': str_param(),
                 'trigger': json_param(optional=True),
-            }, 'common_event_ids'
+            }, 'common_event_ids',
+			batched=True
 		),
 
 		# switches
@@ -85,7 +97,7 @@ def routes() -> list[Route]:
 		}),
 		Route('switch/{id}.html', 'switch.j2', 'view_switch', {
 			'switch': json_param(),
-		}, 'switch_ids'),
+		}, 'switch_ids', batched=True),
 
 		# scripts
 		Route('scripts.html', 'scripts.j2', 'view_scripts', {
@@ -95,22 +107,28 @@ def routes() -> list[Route]:
 			'id': int_param(),
 			'name': str_param(),
 			'content': str_param(),
-		}, 'script_names'),
+		}, 'script_names', batched=True),
 		Route('script/raw/{name}.rb', 'raw_script.j2', 'view_raw_script', {
 			'content': str_param(),
-		}, 'script_names', content_type=ContentType.RUBY),
-		Route('scripts.zip', 'scripts_zip.j2', 'get_scripts_for_archive', {
-			'scripts': json_param()
-		}, content_type=ContentType.ZIP),
+		}, 'script_names', content_type=ContentType.RUBY,
+		batched=True),
+		Route(
+			'scripts.zip', binary.scripts_zip, content_type=ContentType.ZIP,
+			dependency_query='script_archive_dependencies'
+		),
 
 		# graphics
-		Route('graphics/{subtype}/{name}', 'material.j2', 'view_graphic', {
-			'source': str_param(),
-			'type': str_param(),
-			'subtype': str_param(),
-			'name': str_param()
-		},
-		'graphics', content_type=ContentType.VARIABLE_BINARY),
+		Route(
+			'graphics/{subtype}/{name}', binary.material_file, 'view_graphic',
+			{
+				'source': str_param(),
+				'type': str_param(),
+				'subtype': str_param(),
+				'name': str_param()
+			},
+			'graphics', content_type=ContentType.VARIABLE_BINARY,
+			batched=True
+		),
 
 		# troops
 		Route('troops.html', 'troops.j2', 'view_troops', {
@@ -121,7 +139,7 @@ def routes() -> list[Route]:
 			'name': str_param(),
 			'members': json_param(),
 			'maps': json_param(),
-		}, 'troop_ids'),
+		}, 'troop_ids', batched=True),
 
 		# enemies
 		Route('enemies.html', 'enemies.j2', 'view_enemies', {
@@ -142,12 +160,13 @@ def routes() -> list[Route]:
 			'treasure': json_param(optional=True),
 			'troops': json_param(),
 			'actions': json_param(),
-		}, 'enemy_ids'),
-		Route('enemy/{id}.png', 'material_with_hue.j2', 'view_enemy_image', {
+		}, 'enemy_ids', batched=True),
+		Route('enemy/{id}.png', binary.material_with_hue, 'view_enemy_image', {
 			'source': str_param(), 
 			'type': str_param(), 
 			'subtype': str_param(),
 			'name': str_param(),
 			'hue': int_param(),
-		}, 'enemy_ids_with_images', content_type=ContentType.PNG),
+		}, 'enemy_ids_with_images', content_type=ContentType.PNG,
+		batched=True),
 	]
@@ -640,6 +640,23 @@ class MultipleFilesSchema(RefableSchema):
 
 FileSchema = SingleFileSchema | MultipleFilesSchema
 
+@dataclass(frozen=True)
+class Index:
+    """An index on a database table, in addition to the ones which are created
+    automatically for each foreign key.
+
+    Attributes:
+      table_name
+        The name of the table.
+      columns
+        The names of the indexed columns, in order.
+      unique
+        Whether to create a unique index."""
+
+    table_name: str
+    columns: list[str]
+    unique: bool=False
+
 ###############################################################################
 
 # Utility functions to help with building the schema
@@ -1027,4 +1027,11 @@ FILES: list[FileSchema] = [
     SingleFileSchema('Tilesets.rxdata', TILESETS_SCHEMA),
     SingleFileSchema('Troops.rxdata', TROOPS_SCHEMA),
     SingleFileSchema('Weapons.rxdata', WEAPONS_SCHEMA),
-]
\ No newline at end of file
+]
+
+INDEXES: list[Index] = [
+    # the script pages are looked up by name
+    Index('script', ['name']),
+    # the map tree is built by listing the children of each map in order
+    Index('map_info', ['parent_id', 'order']),
+]
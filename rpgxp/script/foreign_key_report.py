@@ -1,8 +1,21 @@
 from rpgxp import db
 
-def run():
+def run(*, as_json: bool=False):
 	dbh = db.connect()
-	print(db.foreign_key_report(dbh))
+
+	if as_json:
+		print(db.foreign_key_report_json(dbh))
+	else:
+		print(db.foreign_key_report(dbh))
 
 if __name__ == '__main__':
-	run()
\ No newline at end of file
+	import argparse
+
+	arg_parser = argparse.ArgumentParser()
+
+	arg_parser.add_argument('--json', action='store_true', help=(
+		'output the violations as JSON'
+	))
+
+	parsed_args = arg_parser.parse_args()
+	run(as_json=parsed_args.json)
@@ -1,11 +1,12 @@
 from rpgxp import db, settings, tile
+from rpgxp.encode import EncoderPool, ImagePolicy
 
-def run() -> None:
+def run(*, image_policy: ImagePolicy=ImagePolicy.PUBLISH) -> None:
     dbh = db.connect()
 
-    for map_id, in dbh.execute('select id from map'):
-        print(f'Saving image of map {map_id}')
-        dst_path = settings.site_root / 'map' / f'{map_id}.png'
-        
-        with tile.map_image_from_id(map_id) as image:
-            image.save(dst_path, 'png')
\ No newline at end of file
+    # each image is encoded while the next one is being made
+    with EncoderPool(image_policy) as pool:
+        for map_id, in dbh.execute('select id from map'):
+            print(f'Saving image of map {map_id}')
+            dst_path = settings.site_root / 'map' / f'{map_id}.png'
+            pool.submit(tile.map_image_from_id(map_id), dst_path)
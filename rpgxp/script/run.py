@@ -1,15 +1,22 @@
-import importlib
-import subprocess
-from rpgxp import db, material, settings
-from rpgxp.script import foreign_key_report
+from pathlib import Path
+from rpgxp import instrument
+from rpgxp.encode import ImagePolicy
+from rpgxp.publish import PublishMode
+from rpgxp.script import stages
 
 RECOGNIZED_MODULES = {
     'class', 'type', 'schema', 'material.schema', 'data', 'material.data',
-    'fk', 'views', 'site', 'static', 'material.static', 'maps', 'serve',
-    'dserve'
+    'fk', 'xref', 'search', 'views', 'site', 'static', 'material.static',
+    'maps', 'serve', 'dserve'
 }
 
-def run(*, modules_list: list[str], quick: bool):
+def run(
+	*, modules_list: list[str], quick: bool, jobs: int | None=None,
+	publish_mode: PublishMode=PublishMode.AUTO,
+	profile_root: Path | None=None, report_path: Path | None=None,
+	force: bool=False, precompile_templates: bool=False,
+	image_policy: ImagePolicy=ImagePolicy.PUBLISH
+):
 	modules = set(modules_list)
 	unrecognized_modules = modules - RECOGNIZED_MODULES
 
@@ -18,70 +25,33 @@ def run(*, modules_list: list[str], quick: bool):
 			f'unrecognized modules: {", ".join(unrecognized_modules)}'
 		)
 
-	if 'class' in modules:
-		print("Generating classes...")
-		module = importlib.import_module('rpgxp.generate_classes')
-		module.run()
-
-	if 'type' in modules:
-		print("Typechecking the codebase...")
-		mypy_result = subprocess.run(['sh', 'typecheck'])
-
-		if mypy_result.returncode:
-			print("Typechecking failed.")
-			return
-
-	if 'schema' in modules:
-		print("Generating the database schema...")
-		module = importlib.import_module('rpgxp.generate_db_schema')
-		module.run()
-	elif 'material.schema' in modules:
-		print("Generating the database schema for materials...")
-		material.generate_db_schema()
-
-	if 'data' in modules:
-		print("Generating the database data...")
-		module = importlib.import_module('rpgxp.generate_db_data')
-		module.run(quick=quick)
-	elif 'material.data' in modules:
-		print("Generating material data...")
-		material.generate_db_data()
-
-	if 'fk' in modules:
-		print("Checking foreign keys...")
-		module = importlib.import_module('rpgxp.script.foreign_key_report')
-		module.run()
-
-	if 'views' in modules:
-		print("Creating database views...")
-		db.run_named_query('views')
-
-	if 'site' in modules:
-		print("Generating web UI...")
-		module = importlib.import_module('rpgxp.site.generate')
-		module.run()
-	elif 'static' in modules:
-		print("Copying static files for web UI...")
-		module = importlib.import_module('rpgxp.site.generate')
-		module.copy_static_files()
-	elif 'material.static' in modules:
-		print("Copying static files for materials...")
-		material.copy_static_files()
-
-	if 'maps' in modules:
-		print('Generating map images...')
-		module = importlib.import_module('rpgxp.script.generate_map_images')
-		module.run()
-
-	if 'serve' in modules:
-		print('Serving web UI (statically)...')
-		module = importlib.import_module('rpgxp.site.serve_static')
-		module.run()
-
-	if 'dserve' in modules:
-		print('Serving web UI (dynamically)...')
-		module = importlib.import_module('rpgxp.site.serve_dynamic')
-		module.run()
+	runner = stages.Runner(
+		stages.RunOptions(
+			quick=quick, jobs=jobs, publish_mode=publish_mode,
+			precompile_templates=precompile_templates,
+			image_policy=image_policy
+		),
+		force=force, profile_root=profile_root
+	)
+
+	# cProfile can only profile one thread at a time
+	max_workers = 1 if profile_root is not None else len(stages.STAGES)
+
+	try:
+		runner.run_all(
+			stages.selected_stages(modules), max_workers=max_workers
+		)
+	except stages.StageError as e:
+		# the report is still saved (by the finally clause) before exiting
+		print(e)
+		raise SystemExit(1)
+	finally:
+		if report_path is not None:
+			instrument.save_report(
+				report_path, modules=modules_list, quick=quick
+			)
+
+			print(f'Saved run report to {report_path}')
 
 if __name__ == '__main__':
     import argparse
@@ -96,8 +66,9 @@ if __name__ == '__main__':
 
     arg_parser.add_argument('-m', '--modules', nargs='*', help=(
     	'Modules to run'
-    ), default='class type schema data fk views site maps serve'.split()
-    )
+    ), default=(
+    	'class type schema data fk xref search views site maps serve'
+    ).split())
     
     arg_parser.add_argument('-q', '--quick', action='store_true', help=(
     	"avoid processing everything so that the database is generated more "
@@ -105,11 +76,64 @@ if __name__ == '__main__':
     	"developing"
     ))
 
+    arg_parser.add_argument('-j', '--jobs', type=int, default=None, help=(
+    	"number of worker processes to use when generating the web UI "
+    	"(defaults to the number of CPUs)"
+    ))
+
+    arg_parser.add_argument(
+    	'--publish-mode', choices=[mode.value for mode in PublishMode],
+    	default=PublishMode.AUTO.value, help=(
+    		"how to publish static files and materials to the web UI: 'copy' "
+    		"always copies, 'link' hard-links and 'reflink' makes copy-on-write "
+    		"clones where possible, and 'auto' (the default) tries reflinking, "
+    		"then hard-linking; unchanged files are skipped in every mode"
+    	)
+    )
+
+    arg_parser.add_argument('--profile', type=Path, metavar='DIR', help=(
+    	"profile each module with cProfile, saving the stats to "
+    	"DIR/<module>.pstats (which can be read with the pstats module, or "
+    	"tools like snakeviz)"
+    ))
+
+    arg_parser.add_argument('--report', type=Path, metavar='PATH', help=(
+    	"save a JSON report of the wall time, CPU time and peak memory of "
+    	"each module (and of each data file in the 'data' module) to PATH"
+    ))
+
+    arg_parser.add_argument('-f', '--force', action='store_true', help=(
+    	"run every module, even those whose inputs haven't changed since "
+    	"they last ran"
+    ))
+
+    arg_parser.add_argument(
+    	'--precompile-templates', action='store_true', help=(
+    		"compile the templates into Python modules before generating the "
+    		"web UI (by default, compiled templates are cached as bytecode)"
+    	)
+    )
+
+    arg_parser.add_argument(
+    	'--image-policy', choices=[policy.value for policy in ImagePolicy],
+    	default=ImagePolicy.PUBLISH.value, help=(
+    		"how hard to compress the images in the web UI: 'dev' compresses "
+    		"quickly and 'publish' (the default) compresses as much as possible"
+    	)
+    )
+
     parsed_args = arg_parser.parse_args()
     
     run(
    		modules_list=parsed_args.modules,
-    	quick=parsed_args.quick
+    	quick=parsed_args.quick,
+    	jobs=parsed_args.jobs,
+    	publish_mode=PublishMode(parsed_args.publish_mode),
+    	profile_root=parsed_args.profile,
+    	report_path=parsed_args.report,
+    	force=parsed_args.force,
+    	precompile_templates=parsed_args.precompile_templates,
+    	image_policy=ImagePolicy(parsed_args.image_policy)
     )
 
 
@@ -0,0 +1,563 @@
+"""The stages of a run of rpgxp.script.run, and the order they run in.
+
+Each stage declares the stages it comes after, and the files and directories
+it reads and writes. A stage is skipped if none of its inputs have changed
+since the last time it ran (going by the size and modification time of each
+file), the stages it comes after (directly or through other stages) haven't
+produced anything new since then, and its outputs are all still there.
+Stages which don't depend on each other run at the same time, in separate
+threads, except that a stage which writes to the database never runs at the
+same time as another stage which uses it."""
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import (
+	FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+)
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+import hashlib
+import importlib
+import json
+import os
+from pathlib import Path
+import subprocess
+import threading
+from typing import ContextManager
+from rpgxp import db, instrument, material, settings, views
+from rpgxp.encode import ImagePolicy
+from rpgxp.publish import PublishMode
+
+class StageError(Exception):
+	"""Raised by a stage which fails in an expected way (so that there's no
+	need for a traceback)."""
+
+@dataclass
+class RunOptions:
+	quick: bool
+	jobs: int | None
+	publish_mode: PublishMode
+	precompile_templates: bool=False
+	image_policy: ImagePolicy=ImagePolicy.PUBLISH
+
+def run_class(options: RunOptions) -> None:
+	module = importlib.import_module('rpgxp.generate_classes')
+	module.run()
+
+def run_type(options: RunOptions) -> None:
+	mypy_result = subprocess.run(
+		['sh', 'typecheck'], cwd=settings.project_root
+	)
+
+	if mypy_result.returncode:
+		raise StageError("Typechecking failed.")
+
+def run_schema(options: RunOptions) -> None:
+	module = importlib.import_module('rpgxp.generate_db_schema')
+	module.run()
+
+def run_material_schema(options: RunOptions) -> None:
+	material.generate_db_schema()
+
+def run_data(options: RunOptions) -> None:
+	module = importlib.import_module('rpgxp.generate_db_data')
+	module.run(quick=options.quick)
+
+def run_material_data(options: RunOptions) -> None:
+	material.generate_db_data()
+
+def run_fk(options: RunOptions) -> None:
+	module = importlib.import_module('rpgxp.script.foreign_key_report')
+	module.run()
+
+def run_xref(options: RunOptions) -> None:
+	module = importlib.import_module('rpgxp.xref')
+	module.run()
+
+def run_search(options: RunOptions) -> None:
+	module = importlib.import_module('rpgxp.search')
+	module.run()
+
+def run_views(options: RunOptions) -> None:
+	views.run()
+
+def run_views_refresh(options: RunOptions) -> None:
+	views.refresh_all(db.connect())
+
+def run_site(options: RunOptions) -> None:
+	module = importlib.import_module('rpgxp.site.generate')
+	module.run(
+		jobs=options.jobs, publish_mode=options.publish_mode,
+		precompile_templates=options.precompile_templates,
+		image_policy=options.image_policy
+	)
+
+def run_static(options: RunOptions) -> None:
+	module = importlib.import_module('rpgxp.site.generate')
+	module.copy_static_files(mode=options.publish_mode)
+
+def run_material_static(options: RunOptions) -> None:
+	material.copy_static_files(mode=options.publish_mode)
+
+def run_maps(options: RunOptions) -> None:
+	module = importlib.import_module('rpgxp.script.generate_map_images')
+	module.run(image_policy=options.image_policy)
+
+def run_serve(options: RunOptions) -> None:
+	module = importlib.import_module('rpgxp.site.serve_static')
+	module.run()
+
+def run_dserve(options: RunOptions) -> None:
+	module = importlib.import_module('rpgxp.site.serve_dynamic')
+	module.run()
+
+def package_paths(*names: str) -> list[Path]:
+	return [settings.package_root / name for name in names]
+
+def project_paths(*names: str) -> list[Path]:
+	return [settings.project_root / name for name in names]
+
+def db_path() -> Path:
+	return settings.db_root / 'db.sqlite'
+
+def material_paths() -> list[Path]:
+	return [
+		root / type_ for root in (settings.game_root, settings.rtp_root)
+		for type_ in ('Graphics', 'Audio')
+	]
+
+def no_paths() -> list[Path]:
+	return []
+
+@dataclass
+class Stage:
+	name: str
+	message: str
+	function: Callable[[RunOptions], None]
+
+	after: tuple[str, ...]=()
+	"""The stages which have to finish before this one starts, if they're
+	being run. They're taken to be inputs of this stage, so if any of them
+	(or any stage they come after in turn) produce something new, this stage
+	is no longer up to date."""
+
+	inputs: Callable[[], list[Path]]=no_paths
+	"""The files and directories this stage reads, apart from those written
+	by the stages it comes after."""
+
+	outputs: Callable[[], list[Path]]=no_paths
+	"""The files and directories this stage writes. If any of them are
+	missing, the stage is no longer up to date."""
+
+	options: tuple[str, ...]=()
+	"""The names of the run options which affect what this stage does."""
+
+	reads_db: bool=False
+	writes_db: bool=False
+
+	replaced_by: tuple[str, ...]=()
+	"""Stages which do everything this one does; if any of them are being
+	run, this one isn't."""
+
+	implied_by: tuple[str, ...]=()
+	"""Stages which need this one to run after them, if they're being run,
+	even if it wasn't asked for."""
+
+	foreground: bool=False
+	"""Whether this stage runs until it's interrupted (like the servers).
+	Such stages are never skipped, and run in the main thread after all the
+	other stages have finished."""
+
+STAGES = [
+	Stage(
+		'class', "Generating classes...", run_class,
+		inputs=lambda: package_paths('schema', 'generate_classes.py'),
+		outputs=lambda: package_paths('generated/schema.py'),
+	),
+	Stage(
+		'type', "Typechecking the codebase...", run_type, ('class',),
+		inputs=lambda: [
+			settings.package_root, *project_paths('typecheck', 'pyproject.toml')
+		],
+	),
+	Stage(
+		'schema', "Generating the database schema...", run_schema,
+		('class', 'type'),
+		inputs=lambda: package_paths(
+			'schema', 'generate_db_schema.py', 'material.py', 'db.py'
+		),
+		outputs=lambda: [
+			*project_paths('sql/schema.sql', 'sql/indexes.sql'), db_path()
+		],
+		writes_db=True,
+	),
+	Stage(
+		'material.schema', "Generating the database schema for materials...",
+		run_material_schema, ('type',),
+		inputs=lambda: package_paths('material.py'),
+		outputs=lambda: [db_path()],
+		writes_db=True, replaced_by=('schema',),
+	),
+	Stage(
+		'data', "Generating the database data...", run_data,
+		('type', 'schema', 'material.schema'),
+		inputs=lambda: [
+			settings.game_data_root, *material_paths(),
+			*package_paths(
+				'parse.py', 'generate_db_data.py', 'schema', 'generated',
+				'material.py'
+			),
+		],
+		outputs=lambda: [db_path()],
+		options=('quick',), writes_db=True,
+	),
+	Stage(
+		'material.data', "Generating material data...", run_material_data,
+		('type', 'schema', 'material.schema'),
+		inputs=lambda: [*material_paths(), *package_paths('material.py')],
+		outputs=lambda: [db_path()],
+		writes_db=True, replaced_by=('data',),
+	),
+	Stage(
+		'fk', "Checking foreign keys...", run_fk, ('data', 'material.data'),
+		inputs=lambda: package_paths('script/foreign_key_report.py', 'db.py'),
+		reads_db=True,
+	),
+	Stage(
+		'xref', (
+			"Indexing references to switches, variables and common "
+			"events..."
+		),
+		run_xref, ('data',),
+		inputs=lambda: [*package_paths('xref.py'), *project_paths('sql')],
+		writes_db=True,
+	),
+	Stage(
+		'search', "Building the search index...", run_search, ('data',),
+		inputs=lambda: [*package_paths('search.py'), *project_paths('sql')],
+		writes_db=True,
+	),
+	Stage(
+		'views', "Creating database views...", run_views,
+		('data', 'material.data', 'xref', 'search'),
+		inputs=lambda: [*package_paths('views.py'), *project_paths('sql')],
+		writes_db=True,
+	),
+	Stage(
+		'views.refresh', "Refreshing materialized views...",
+		run_views_refresh, ('data', 'material.data'),
+		inputs=lambda: package_paths('views.py'),
+		writes_db=True, replaced_by=('views',),
+		implied_by=('data', 'material.data'),
+	),
+	Stage(
+		'site', "Generating web UI...", run_site, ('views', 'views.refresh'),
+		inputs=lambda: [
+			*package_paths(
+				'site', 'route', 'publish.py', 'db.py', 'encode.py', 'image.py',
+				'tile.py', 'autotile', 'material.py'
+			),
+			*project_paths('site', 'sql'), *material_paths(),
+		],
+		outputs=lambda: [settings.site_root],
+		options=('publish_mode', 'precompile_templates', 'image_policy'),
+		reads_db=True,
+	),
+	Stage(
+		'static', "Copying static files for web UI...", run_static,
+		('views', 'views.refresh'),
+		inputs=lambda: [
+			*package_paths('site', 'publish.py'),
+			*project_paths('site/static'), *material_paths(),
+		],
+		outputs=lambda: [settings.site_root],
+		options=('publish_mode',), reads_db=True, replaced_by=('site',),
+	),
+	Stage(
+		'material.static', "Copying static files for materials...",
+		run_material_static, ('views', 'views.refresh'),
+		inputs=lambda: [*package_paths('publish.py'), *material_paths()],
+		outputs=lambda: [settings.site_root],
+		options=('publish_mode',), reads_db=True,
+		replaced_by=('site', 'static'),
+	),
+	# the map images only need the data, but waiting for the views means that
+	# they don't hold up the stages which write to the database. The site
+	# generates the same images (skipping those which are up to date), so
+	# this stage is only for when the rest of the site isn't wanted
+	Stage(
+		'maps', "Generating map images...", run_maps,
+		('data', 'material.data', 'views', 'views.refresh'),
+		inputs=lambda: [
+			*package_paths(
+				'script/generate_map_images.py', 'tile.py', 'autotile',
+				'encode.py'
+			),
+			*material_paths(),
+		],
+		outputs=lambda: [settings.site_root / 'map'],
+		options=('image_policy',), reads_db=True, replaced_by=('site',),
+	),
+	Stage(
+		'serve', "Serving web UI (statically)...", run_serve,
+		foreground=True,
+	),
+	Stage(
+		'dserve', "Serving web UI (dynamically)...", run_dserve,
+		foreground=True,
+	),
+]
+
+STAGES_BY_NAME = {stage.name: stage for stage in STAGES}
+
+def selected_stages(names: set[str]) -> list[Stage]:
+	"""Return the stages to run, given the names of those asked for."""
+
+	return [
+		stage for stage in STAGES
+		if (
+			stage.name in names
+			or any(name in names for name in stage.implied_by)
+		)
+		and not any(name in names for name in stage.replaced_by)
+	]
+
+def ancestors(stage: Stage) -> list[str]:
+	"""Return the names of the stages a stage comes after, either directly or
+	through other stages."""
+
+	result: set[str] = set()
+	stack = list(stage.after)
+
+	while stack:
+		name = stack.pop()
+
+		if name not in result:
+			result.add(name)
+			stack.extend(STAGES_BY_NAME[name].after)
+
+	return sorted(result)
+
+def stamps_path() -> Path:
+	return settings.db_root / 'stage_stamps.json'
+
+def load_stamps() -> dict[str, str]:
+	"""Load the key of each stage as of the last time it finished."""
+
+	try:
+		with stamps_path().open(encoding='utf-8') as f:
+			return json.load(f)
+	except FileNotFoundError:
+		return {}
+
+def save_stamps(stamps: dict[str, str]) -> None:
+	path = stamps_path()
+	path.parent.mkdir(parents=True, exist_ok=True)
+	tmp_path = path.with_suffix('.tmp')
+
+	with tmp_path.open('w', encoding='utf-8') as f:
+		json.dump(stamps, f, indent=0, sort_keys=True)
+
+	tmp_path.replace(path)
+
+def file_stamps(path: Path) -> Iterator[tuple[str, int, int]]:
+	"""Yield the path, size and modification time of every file under a
+	path (or of the path itself, if it's a file)."""
+
+	stack = [str(path)]
+
+	while stack:
+		current = stack.pop()
+
+		try:
+			stat = os.stat(current)
+		except FileNotFoundError:
+			continue
+
+		if not os.path.isdir(current):
+			yield current, stat.st_size, stat.st_mtime_ns
+			continue
+
+		with os.scandir(current) as entries:
+			for entry in sorted(entries, key=lambda entry: entry.name):
+				if entry.name != '__pycache__':
+					stack.append(entry.path)
+
+def stage_key(
+	stage: Stage, options: RunOptions, stamps: dict[str, str]
+) -> str:
+	"""Return a digest of everything the stage's output is determined by: its
+	inputs, its options and the keys of the stages it comes after, directly or
+	not (a stage which isn't being run may be what connects this one to a
+	stage which is)."""
+
+	hasher = hashlib.sha256(stage.name.encode('utf-8'))
+
+	for name in stage.options:
+		hasher.update(f'{name}={getattr(options, name)}\0'.encode('utf-8'))
+
+	for name in ancestors(stage):
+		hasher.update(f'{name}:{stamps.get(name, "")}\0'.encode('utf-8'))
+
+	for input_path in stage.inputs():
+		for stamp in file_stamps(input_path):
+			hasher.update(json.dumps(stamp).encode('utf-8'))
+
+	return hasher.hexdigest()
+
+@contextmanager
+def run_stage(
+	name: str, message: str, *, profile_root: Path | None
+) -> Iterator[None]:
+
+	print(message)
+
+	profile_path = (
+		None if profile_root is None else profile_root / f'{name}.pstats'
+	)
+
+	with instrument.timed(name, profile_path=profile_path) as timing:
+		yield
+
+	print(f'Finished {instrument.summary(timing)}')
+
+class DatabaseLock:
+	"""Lets any number of stages read the database at once, or one stage
+	write to it."""
+
+	_condition: threading.Condition
+	_readers: int
+	_writing: bool
+
+	def __init__(self) -> None:
+		self._condition = threading.Condition()
+		self._readers = 0
+		self._writing = False
+
+	@contextmanager
+	def reading(self) -> Iterator[None]:
+		with self._condition:
+			self._condition.wait_for(lambda: not self._writing)
+			self._readers += 1
+
+		try:
+			yield
+		finally:
+			with self._condition:
+				self._readers -= 1
+				self._condition.notify_all()
+
+	@contextmanager
+	def writing(self) -> Iterator[None]:
+		with self._condition:
+			self._condition.wait_for(
+				lambda: not self._writing and not self._readers
+			)
+
+			self._writing = True
+
+		try:
+			yield
+		finally:
+			with self._condition:
+				self._writing = False
+				self._condition.notify_all()
+
+	def for_stage(self, stage: Stage) -> ContextManager[None]:
+		if stage.writes_db:
+			return self.writing()
+		elif stage.reads_db:
+			return self.reading()
+		else:
+			return nullcontext()
+
+class Runner:
+	"""Runs a set of stages, keeping track of their keys."""
+
+	options: RunOptions
+	force: bool
+	profile_root: Path | None
+	stamps: dict[str, str]
+	stamps_lock: threading.Lock
+	db_lock: DatabaseLock
+
+	def __init__(
+		self, options: RunOptions, *, force: bool, profile_root: Path | None
+	):
+		self.options = options
+		self.force = force
+		self.profile_root = profile_root
+		self.stamps = load_stamps()
+		self.stamps_lock = threading.Lock()
+		self.db_lock = DatabaseLock()
+
+	def up_to_date(self, stage: Stage, key: str) -> bool:
+		return (
+			not self.force
+			and self.stamps.get(stage.name) == key
+			and all(path.exists() for path in stage.outputs())
+		)
+
+	def run(self, stage: Stage) -> None:
+		with self.stamps_lock:
+			key = stage_key(stage, self.options, self.stamps)
+
+		if not stage.foreground and self.up_to_date(stage, key):
+			# written in one go, as other stages may be printing at once
+			print(f'Skipping {stage.name}, as it is up to date\n', end='')
+			return
+
+		with self.db_lock.for_stage(stage), run_stage(
+			stage.name, stage.message, profile_root=self.profile_root
+		):
+			stage.function(self.options)
+
+		with self.stamps_lock:
+			self.stamps[stage.name] = key
+			save_stamps(self.stamps)
+
+	def run_all(self, stages: list[Stage], *, max_workers: int) -> None:
+		"""Run each stage as soon as the stages it comes after, directly or
+		not (out of those being run), have finished. If a stage fails, the
+		stages which have already started are allowed to finish, but no more
+		are started, and the exception is raised again."""
+
+		names = {stage.name for stage in stages}
+		pending = [stage for stage in stages if not stage.foreground]
+		finished: set[str] = set()
+		running: dict[Future[None], Stage] = {}
+		error: BaseException | None = None
+
+		with ThreadPoolExecutor(max_workers=max_workers) as executor:
+			while pending or running:
+				if error is None:
+					for stage in list(pending):
+						if all(
+							name in finished or name not in names
+							for name in ancestors(stage)
+						):
+							pending.remove(stage)
+							future = executor.submit(self.run, stage)
+							running[future] = stage
+
+				if not running:
+					break
+
+				done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+				for future in done:
+					stage = running.pop(future)
+
+					try:
+						future.result()
+					except BaseException as e:
+						if error is None:
+							error = e
+					else:
+						finished.add(stage.name)
+
+		if error is not None:
+			raise error
+
+		for stage in stages:
+			if stage.foreground:
+				self.run(stage)
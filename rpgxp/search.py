@@ -0,0 +1,17 @@
+from rpgxp import db, settings
+
+def run() -> None:
+    """Fill the full-text search index (the search_index table) from the
+    scripts, the text of the messages and choices in events, and the names of
+    things."""
+
+    dbh = db.connect()
+
+    with dbh:
+        db.run_script(dbh, settings.project_root / 'sql/search.sql')
+
+    count = db.fetch_value('SELECT count(*) FROM search_index', dbh=dbh)
+    print(f'Indexed {count} rows for searching')
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,144 @@
+# PIL, numpy (via rpgxp.tile) and zipfile are imported when a file is first
+# rendered, rather than here, since the routes import this module and most
+# commands which use the routes never render a binary file
+import functools as ft
+import hashlib
+import io
+import os
+from pathlib import Path
+from typing import Any, Callable, Iterator
+from rpgxp import db, encode, material, settings
+
+image_policy = encode.ImagePolicy.DEV
+"""How the images made here are compressed. Site generation sets this in each
+worker process; the dynamic server leaves it as it is."""
+
+def material_path(source: str, type: str, subtype: str, name: str) -> Path:
+    root = material.root_for_source(source)
+    return root / type.capitalize() / subtype.capitalize() / name
+
+def map_image(id: int) -> bytes:
+    from rpgxp import tile
+
+    with tile.map_image_from_id(id) as image:
+        return encode.png_bytes(image, image_policy)
+
+def material_file(source: str, type: str, subtype: str, name: str) -> Path:
+    """Return the material file as it is, without decoding it."""
+    return material_path(source, type, subtype, name)
+
+DIGEST_CACHE_SIZE = 1024
+"""The number of material files whose digests are kept in memory."""
+
+@ft.cache
+def hue_cache_root() -> Path:
+    # a change to rpgxp.image invalidates the whole cache
+    source = (settings.package_root / 'image.py').read_bytes()
+    return settings.db_root / 'hue_cache' / hashlib.sha256(source).hexdigest()
+
+@ft.lru_cache(maxsize=DIGEST_CACHE_SIZE)
+def _file_digest(path: Path, size: int, mtime_ns: int) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+def file_digest(path: Path) -> str:
+    """Return a digest of the contents of a file, which is only computed
+    again if the file's size or modification time changes."""
+
+    stat = path.stat()
+    return _file_digest(path, stat.st_size, stat.st_mtime_ns)
+
+def png_with_hue(path: Path, hue: int) -> Path:
+    """Return the path of a PNG image of the image at `path` with its hue
+    rotated by `hue` degrees. The PNGs are cached under db_root, keyed by the
+    digest of the image file, the hue and the image policy, so each is only
+    made once."""
+
+    cache_path = (
+        hue_cache_root()
+        / f'{file_digest(path)}-{hue}-{image_policy.value}.png'
+    )
+
+    if cache_path.exists():
+        return cache_path
+
+    from PIL import Image as pil
+    from rpgxp import image as imgmanip
+
+    with pil.open(path) as img:
+        content = encode.png_bytes(
+            imgmanip.adjust_hue(img.convert('RGBA'), hue), image_policy
+        )
+
+    # the site generation workers may be making the same PNG at once
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+    tmp_path.write_bytes(content)
+    tmp_path.replace(cache_path)
+    return cache_path
+
+def material_with_hue(
+    source: str, type: str, subtype: str, name: str, hue: int=0
+) -> bytes | Path:
+    """Return the material as a PNG image with its hue rotated by `hue`
+    degrees. If there's nothing to change, the material file itself is
+    returned."""
+
+    path = material_path(source, type, subtype, name)
+
+    if hue % 360 == 0 and path.suffix.lower() == '.png':
+        return path
+
+    return png_with_hue(path, hue)
+
+RENDERER_SOURCES: dict[Callable[..., Any], tuple[str, ...]] = {
+    map_image: ('tile.py', 'autotile', 'material.py', 'encode.py'),
+    material_with_hue: ('image.py', 'encode.py'),
+}
+"""The files and directories (relative to the package root) which the output
+of each renderer depends on, apart from this module. Static generation
+regenerates a renderer's pages if any of them change."""
+
+ARCHIVE_CHUNK_SIZE = 64 * 1024
+"""The size of the chunks in which archives are written out."""
+
+class _ChunkBuffer(io.RawIOBase):
+    """An unseekable stream which keeps what's written to it until it's taken
+    out with take()."""
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self.buffer += data
+        return len(data)
+
+    def take(self) -> bytes:
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return data
+
+def scripts_zip() -> Iterator[bytes]:
+    """Generate a ZIP archive of the scripts, a chunk at a time, reading each
+    script from the database as it goes."""
+
+    import zipfile
+
+    chunks = _ChunkBuffer()
+
+    # the archive can't seek back to fill in the size of each entry, so it
+    # follows each entry with a data descriptor instead
+    with zipfile.ZipFile(chunks, 'w') as archive:
+        for name, content in db.run_named_query('get_scripts_for_archive'):
+            data = content.encode('utf-8')
+
+            with archive.open(name, 'w') as entry:
+                for start in range(0, len(data), ARCHIVE_CHUNK_SIZE):
+                    entry.write(data[start:start + ARCHIVE_CHUNK_SIZE])
+
+                    if len(chunks.buffer) >= ARCHIVE_CHUNK_SIZE:
+                        yield chunks.take()
+
+    yield chunks.take()
@@ -1,15 +1,12 @@
 import functools as ft
-import io
 from pathlib import Path
-import zipfile
-from typing import Any, Iterable, TypedDict
+import shutil
+from typing import Any, Callable
 
 import jinja2
-from PIL import Image as pil
-from PIL.Image import Image
+import markupsafe
 
-from rpgxp import material, settings, tile
-from rpgxp import image as imgmanip
+from rpgxp import settings
 
 def ordinal(n: int) -> str:
     digits = str(n)
@@ -21,65 +18,123 @@ def ordinal(n: int) -> str:
 
     return digits + suffix
 
-def load_binary_file(path: Path) -> str:
-    with path.open('rb') as f:
-        return f.read().decode('utf-8', 'surrogateescape')
+def highlight(text: str) -> str:
+    """Escape text from the search index for HTML, marking the matched terms
+    (which the search query delimits with STX and ETX characters)."""
 
-def image_content(image: Image) -> str:
-    stream = io.BytesIO()
-    image.save(stream, 'png')
-    return stream.getvalue().decode('utf-8', 'surrogateescape')
+    escaped = str(markupsafe.escape(text))
+    return escaped.replace('\x02', '<mark>').replace('\x03', '</mark>')
 
-NamedStr = TypedDict('NamedStr', {
-    'name': str,
-    'content': str,
-})
+def templates_root() -> Path:
+    return settings.project_root / 'site/templates'
 
-def zip_archive(members: Iterable[NamedStr]) -> str:
-    stream = io.BytesIO()
+def bytecode_cache_root() -> Path:
+    return settings.db_root / 'jinja/bytecode'
 
-    with zipfile.ZipFile(stream, 'w') as archive:
-        for member in members:
-            archive.writestr(member['name'], member['content'])
+def compiled_templates_root() -> Path:
+    return settings.db_root / 'jinja/compiled'
 
-    return stream.getvalue().decode('utf-8', 'surrogateescape')
+class PrecompiledLoader(jinja2.ModuleLoader):
+    """Loads the templates from the modules written by compile_templates(),
+    but gets their source from another loader, since the manifest digests
+    the source of each template."""
 
-def load_material(
-    source: str, type: str, subtype: str, name: str, hue: int=0
+    has_source_access = True
+
+    def __init__(self, path: Path, source_loader: jinja2.BaseLoader) -> None:
+        super().__init__(str(path))
+        self.source_loader = source_loader
+
+    def get_source(
+        self, environment: jinja2.Environment, template: str
+    ) -> tuple[str, str | None, Callable[[], bool] | None]:
+
+        return self.source_loader.get_source(environment, template)
+
+def new_jinja_env(
+    *, dev: bool=False, precompiled: bool=False
+) -> jinja2.Environment:
+    """Create a Jinja environment for the site templates. This reads the
+    settings, so it isn't done when the module is imported; jinja_env()
+    returns the environment used by the dynamic server.
+
+    Compiled templates are cached as bytecode under db_root, and shared
+    between processes and runs, so a template is only compiled again when its
+    source changes. If `precompiled` is set, the templates are loaded from the
+    modules written by compile_templates() instead, falling back to the
+    template files for any which haven't been compiled.
+
+    In dev mode (i.e. when serving the site dynamically), templates are
+    reloaded when they change; otherwise each template is loaded once."""
+
+    # imported here since it imports rpgxp.db, and hence apsw
+    from rpgxp import material
+
+    loader: jinja2.BaseLoader = jinja2.FileSystemLoader(str(templates_root()))
+
+    if precompiled:
+        loader = jinja2.ChoiceLoader([
+            PrecompiledLoader(compiled_templates_root(), loader), loader
+        ])
+
+    bytecode_cache_root().mkdir(parents=True, exist_ok=True)
+
+    env = jinja2.Environment(
+        loader=loader, undefined=jinja2.StrictUndefined,
+        bytecode_cache=jinja2.FileSystemBytecodeCache(
+            str(bytecode_cache_root())
+        ),
+        auto_reload=dev
+    )
+
+    env.globals |= {
+        'game_name': settings.game_name,
+        'url_base': '',
+        'game_root': settings.game_root,
+        'root_for_source': material.root_for_source,
+    }
+
+    env.filters |= {
+        'ordinal': ordinal,
+        'highlight': highlight,
+    }
+
+    return env
+
+@ft.cache
+def jinja_env() -> jinja2.Environment:
+    return new_jinja_env(dev=True)
+
+def load_templates(env: jinja2.Environment) -> None:
+    """Load every template into the environment, which fills the bytecode
+    cache with any templates which have changed. This is done before
+    starting the site generation workers, so that they don't each compile
+    the same templates."""
+
+    for name in env.list_templates(extensions=['j2']):
+        env.get_template(name)
+
+def compile_templates() -> None:
+    """Compile every template into a Python module under db_root, for
+    environments created with `precompiled` set."""
+
+    root = compiled_templates_root()
+    shutil.rmtree(root, ignore_errors=True)
+    root.mkdir(parents=True)
+
+    new_jinja_env().compile_templates(
+        str(root), extensions=['j2'], zip=None, ignore_errors=False
+    )
+
+def render_template(
+    template_path: str, template_args: dict[str, Any],
+    *, env: jinja2.Environment | None=None
 ) -> str:
 
-    root = material.root_for_source(source)
-    path = root / type.capitalize() / subtype.capitalize() / name
-    
-    with pil.open(path) as img:
-        adjusted = imgmanip.adjust_hue(img.convert('RGBA'), hue)
-    
-    stream = io.BytesIO()
-    adjusted.save(stream, 'png')
-    return stream.getvalue().decode('utf-8', 'surrogateescape')
-
-jinja_env = jinja2.Environment(loader=jinja2.FileSystemLoader(
-    str(settings.project_root / 'site/templates')
-), undefined=jinja2.StrictUndefined)
-
-jinja_env.globals |= {
-    'game_name': settings.game_name,
-    'url_base': '',
-    'game_root': settings.game_root,
-    'load_binary_file': load_binary_file,
-    'image_content': image_content,
-    'zip_archive': zip_archive,
-    'root_for_source': material.root_for_source,
-    'material': load_material,
-    'map_image_from_id': tile.map_image_from_id,
-}
-
-jinja_env.filters |= {
-    'ordinal': ordinal
-}
-
-def render_template(template_path: str, template_args: dict[str, Any]) -> str:
-    template = jinja_env.get_template(template_path)
+    if env is None:
+        env = jinja_env()
+
+    template = env.get_template(template_path)
     return template.render(**template_args)
 
 @ft.cache
@@ -1,74 +1,471 @@
+from concurrent.futures import (
+    as_completed, FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+)
+from dataclasses import dataclass
+import itertools as it
+import os
+from pathlib import Path
 import shutil
-from typing import Any
+import time
+from typing import Any, Iterator
 import apsw
 import jinja2
 from rpgxp import db, material, settings
+from rpgxp.encode import ImagePolicy
+from rpgxp.publish import publish_files, PublishMode
+from rpgxp.route.Route import BinaryRenderer, Route
 from rpgxp.route.routes import routes
-from rpgxp.site import common as site
+from rpgxp.site import binary, common as site, manifest
+
+CHUNK_SIZE = 32
+"""The maximum number of pages handed to a worker process at once."""
+
+CHUNKS_IN_FLIGHT_PER_JOB = 4
+"""The maximum number of chunks per worker process which may be waiting to be
+processed at once. Chunks are read from the database as a stream, so this
+bounds how far reading can get ahead of rendering."""
 
 def render_template_to_file(
-    src_path: str, dst_path: str, template_args: dict[str, Any], 
-    *, binary: bool=False
+    src_path: str, dst_path: str, template_args: dict[str, Any],
+    *, env: jinja2.Environment | None=None
 ) -> None:
 
-    content = site.render_template(src_path, template_args)
+    content = site.render_template(src_path, template_args, env=env)
 
-    dst_path_obj = settings.project_root / dst_path 
+    dst_path_obj = settings.project_root / dst_path
     dst_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-    if binary:
-        with dst_path_obj.open('wb') as f:
-            f.write(content.encode('utf-8', 'surrogateescape'))
-    else:
-        with dst_path_obj.open('w', encoding='utf-8') as f:
-            f.write(content)
+    with dst_path_obj.open('w', encoding='utf-8') as f:
+        f.write(content)
+
+def link_or_copy(src_path: Path, dst_path: Path) -> None:
+    """Make `dst_path` a hard link to `src_path`, or a copy of it if they're
+    on different filesystems."""
+
+    try:
+        os.link(src_path, dst_path)
+    except OSError:
+        shutil.copyfile(src_path, dst_path)
+
+def render_binary_to_file(
+    renderer: BinaryRenderer, dst_path: Path, template_args: dict[str, Any]
+) -> None:
 
-def copy_static_files() -> None:
+    content = renderer(**template_args)
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # the file is written alongside and then moved into place, so that it's
+    # never seen half written, and so that the old file (which may be a hard
+    # link to a material file) is replaced rather than overwritten
+    tmp_path = dst_path.with_suffix(f'.{os.getpid()}.tmp')
+    tmp_path.unlink(missing_ok=True)
+
+    try:
+        if isinstance(content, Path):
+            link_or_copy(content, tmp_path)
+        elif isinstance(content, bytes):
+            with tmp_path.open('wb') as f:
+                f.write(content)
+        else:
+            with tmp_path.open('wb') as f:
+                f.writelines(content)
+
+        tmp_path.replace(dst_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+def static_file_paths() -> Iterator[tuple[Path, Path]]:
     static_root = site.static_root()
 
     for static_path in static_root.rglob('*'):
-        dst_path = settings.site_root / static_path.relative_to(static_root)
-        dst_path.parent.mkdir(parents=True, exist_ok=True)
-        print(f'Copying {static_path} to {dst_path}')
-        shutil.copyfile(static_path, dst_path)
+        if static_path.is_file():
+            dst_path = settings.site_root / static_path.relative_to(static_root)
+            yield static_path, dst_path
+
+def copy_static_files(*, mode: PublishMode=PublishMode.AUTO) -> None:
+    summary = publish_files(static_file_paths(), mode=mode)
+    print(f'Static files: {summary}')
+    material.copy_static_files(mode=mode)
+
+def possible_url_args(
+    route: Route, dbh: apsw.Connection
+) -> list[dict[str, str]]:
+
+    if route.url_query is None:
+        return [{}]
+
+    url_query_result = db.run_named_query(route.url_query, dbh=dbh)
+
+    try:
+        url_params, _ = zip(*url_query_result.get_description())
+    except apsw.ExecutionCompleteError:
+        # the query returned no rows, so there are no pages to generate
+        return []
+
+    return [
+        dict(zip(url_params, map(str, url_args)))
+        for url_args in url_query_result
+    ]
+
+@dataclass
+class PageResult:
+    url: str
+    digest: str
+    written: bool
+
+def generate_page(
+    route: Route, url_args: dict[str, str],
+    *, dbh: apsw.Connection, env: jinja2.Environment,
+    raw_template_args: dict[str, apsw.SQLiteValue] | None=None,
+    dependencies: list[dict[str, apsw.SQLiteValue]] | None=None,
+    previous_digest: str | None=None
+) -> PageResult:
+    """Generate a single page, unless the digest of its inputs is equal to
+    `previous_digest` and the page already exists.
+
+    If `raw_template_args` or `dependencies` is given (because it has been
+    fetched by the route's batched template or dependency query), the
+    corresponding query isn't run."""
+
+    if raw_template_args is None:
+        template_args = route.get_template_args(url_args, dbh=dbh)
+    else:
+        template_args = route.format_template_args(raw_template_args)
+
+    if dependencies is None:
+        dependencies = route.get_dependencies(url_args, dbh=dbh)
+
+    url = route.url(**url_args)
+    filesystem_url = settings.site_root / url
 
-    material.copy_static_files()
+    digest = manifest.page_digest(
+        env, route.template, template_args, dependencies
+    )
 
-def run() -> None:
-    copy_static_files()
+    if digest == previous_digest and filesystem_url.exists():
+        return PageResult(url, digest, False)
 
-    for route in routes():
-        print(f'Generating route {route.url_pattern}...')
-        url_params: tuple[str, ...]
-        possible_url_args: list[tuple[apsw.SQLiteValue, ...]]
+    template = route.template
 
-        if route.url_query is None:
-            url_params = ()
-            possible_url_args = [()]
+    if not isinstance(template, str):
+        render_binary_to_file(template, filesystem_url, template_args)
+        return PageResult(url, digest, True)
+
+    try:
+        render_template_to_file(
+            template, str(filesystem_url), template_args, env=env
+        )
+    except jinja2.TemplateError as e:
+        e.add_note(template)
+        e.add_note(str(template_args))
+        raise
+
+    return PageResult(url, digest, True)
+
+@dataclass
+class _WorkerState:
+    dbh: apsw.Connection
+    env: jinja2.Environment
+
+_worker_state: _WorkerState | None = None
+
+def _init_worker(
+    precompiled_templates: bool=False,
+    image_policy: ImagePolicy=ImagePolicy.PUBLISH
+) -> None:
+
+    global _worker_state
+    binary.image_policy = image_policy
+
+    _worker_state = _WorkerState(
+        db.connect(), site.new_jinja_env(precompiled=precompiled_templates)
+    )
+
+type PageWork = tuple[
+    dict[str, str], dict[str, apsw.SQLiteValue] | None,
+    list[dict[str, apsw.SQLiteValue]] | None, str | None
+]
+"""The URL arguments of a page, together with its raw template arguments and
+its dependencies (if they have been fetched by a batched template or
+dependency query) and the digest of its inputs from the previous run (if
+any)."""
+
+def _generate_chunk(
+    route_index: int, pages: list[PageWork]
+) -> tuple[int, list[PageResult], float]:
+
+    if _worker_state is None:
+        _init_worker()
+
+    assert _worker_state is not None
+    route = routes()[route_index]
+    start = time.perf_counter()
+    results: list[PageResult] = []
+
+    for url_args, raw_template_args, dependencies, previous_digest in pages:
+        results.append(generate_page(
+            route, url_args, dbh=_worker_state.dbh, env=_worker_state.env,
+            raw_template_args=raw_template_args, dependencies=dependencies,
+            previous_digest=previous_digest
+        ))
+
+    return route_index, results, time.perf_counter() - start
+
+def work_chunks(
+    dbh: apsw.Connection, previous_manifest: dict[str, str]
+) -> Iterator[tuple[int, list[PageWork]]]:
+    """Split the pages of every route into chunks of work for the worker
+    processes. The chunks are yielded in a fixed order (route order, then
+    query order), so a given database always produces the same chunks.
+
+    For routes with a batched template query, the chunks are read lazily from
+    its cursor, and come with their template arguments already fetched. The
+    dependencies of every page of such a route are fetched up front, by a
+    single run of its dependency query."""
+
+    for route_index, route in enumerate(routes()):
+        if route.query_params:
+            continue
+
+        pages: Iterator[
+            tuple[dict[str, str], dict[str, apsw.SQLiteValue] | None]
+        ]
+
+        if not route.batched:
+            pages = ((url_args, None) for url_args in possible_url_args(
+                route, dbh
+            ))
         else:
-            url_query_result = db.run_named_query(route.url_query)
-            url_params, _ = zip(*url_query_result.get_description())
-            possible_url_args = url_query_result.fetchall()
-
-        for url_args in possible_url_args:
-            coerced_url_args = dict(zip(url_params, map(str, url_args)))
-            template_args = route.get_template_args(coerced_url_args)
-
-            url = route.url(**coerced_url_args)
-            filesystem_url = settings.site_root / url
-            #print(f'Generating {filesystem_url}...')
-
-            try:
-                render_template_to_file(
-                    route.template,
-                    str(filesystem_url),
-                    template_args,
-                    binary=route.content_type.binary
+            pages = route.iter_batch_args(dbh=dbh)
+
+        batch_dependencies = None
+        url_params = route.url_params()
+
+        if route.batched and route.dependency_query is not None:
+            batch_dependencies = route.batch_dependencies(dbh=dbh)
+
+        for chunk in it.batched(pages, CHUNK_SIZE):
+            yield route_index, [
+                (
+                    url_args, raw_template_args,
+                    None if batch_dependencies is None
+                    else batch_dependencies.get(
+                        tuple(url_args[param] for param in url_params), []
+                    ),
+                    previous_manifest.get(route.url(**url_args))
                 )
-            except jinja2.TemplateError as e:
-                e.add_note(route.template)
-                e.add_note(str(template_args))
-                raise
+                for url_args, raw_template_args in chunk
+            ]
+
+def delete_stale_pages(
+    previous_manifest: dict[str, str], current_manifest: dict[str, str]
+) -> int:
+    """Delete the pages generated by the previous run whose URL arguments no
+    longer exist. Return the number of pages deleted."""
+
+    deleted = 0
+
+    for url in previous_manifest.keys() - current_manifest.keys():
+        path = settings.site_root / url
+
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            continue
+
+        print(f'Deleted {path}')
+        deleted += 1
+
+    return deleted
+
+@dataclass
+class _RouteStats:
+    pages: int = 0
+    done: int = 0
+    written: int = 0
+    seconds: float = 0.0
+    all_submitted: bool = False
+
+def run(
+    *, jobs: int | None=None, force: bool=False,
+    publish_mode: PublishMode=PublishMode.AUTO,
+    precompile_templates: bool=False,
+    image_policy: ImagePolicy=ImagePolicy.PUBLISH
+) -> None:
+    """Generate the whole site statically.
+
+    The pages are rendered by a pool of `jobs` worker processes (by default,
+    one per CPU), each with its own database connection and Jinja environment.
+    Every page is written by exactly one worker and its content depends only on
+    the database, so the output is the same regardless of scheduling.
+
+    A manifest of the digest of each page's inputs is kept between runs, and
+    pages whose inputs haven't changed since the previous run are not
+    regenerated unless `force` is set. Pages whose URL arguments no longer
+    exist are deleted.
+
+    Static files and materials are published according to `publish_mode`.
+
+    The templates are compiled before the workers start, into the bytecode
+    cache or, if `precompile_templates` is set, into Python modules which the
+    workers import.
+
+    Images are compressed according to `image_policy`."""
+
+    copy_static_files(mode=publish_mode)
+
+    if precompile_templates:
+        site.compile_templates()
+    else:
+        site.load_templates(site.new_jinja_env())
+
+    previous_manifest = {} if force else manifest.load()
+    current_manifest: dict[str, str] = {}
+    route_list = routes()
+    stats = [_RouteStats() for _ in route_list]
+    done = 0
+    start = time.perf_counter()
+    print(f'Generating pages from {len(route_list)} routes...')
+
+    def report_if_finished(route_index: int) -> None:
+        route_stats = stats[route_index]
+
+        if route_stats.all_submitted and route_stats.done == route_stats.pages:
+            print(
+                f'[{done}] Generated route '
+                f'{route_list[route_index].url_pattern}'
+            )
+
+    def record(result: tuple[int, list[PageResult], float]) -> None:
+        nonlocal done
+        route_index, page_results, seconds = result
+        route_stats = stats[route_index]
+        route_stats.done += len(page_results)
+        route_stats.seconds += seconds
+        done += len(page_results)
+
+        for page_result in page_results:
+            current_manifest[page_result.url] = page_result.digest
+            route_stats.written += page_result.written
+
+        report_if_finished(route_index)
+
+    def mark_submitted(route_index: int) -> None:
+        if not stats[route_index].all_submitted:
+            stats[route_index].all_submitted = True
+            report_if_finished(route_index)
+
+    def submitted_chunks() -> Iterator[tuple[int, list[PageWork]]]:
+        # keeps track of which routes have had all their pages submitted, so
+        # that we can report when each route is finished
+        current_route_index = 0
+
+        for route_index, pages in work_chunks(
+            db.connect(), previous_manifest
+        ):
+            for finished_index in range(current_route_index, route_index):
+                mark_submitted(finished_index)
+
+            current_route_index = route_index
+            stats[route_index].pages += len(pages)
+            yield route_index, pages
+
+        for route_index in range(current_route_index, len(route_list)):
+            mark_submitted(route_index)
+
+    if jobs == 1:
+        _init_worker(precompile_templates, image_policy)
+
+        for chunk in submitted_chunks():
+            record(_generate_chunk(*chunk))
+    else:
+        if jobs is None:
+            jobs = os.process_cpu_count() or 1
+
+        max_in_flight = jobs * CHUNKS_IN_FLIGHT_PER_JOB
+
+        with ProcessPoolExecutor(
+            jobs, initializer=_init_worker,
+            initargs=(precompile_templates, image_policy)
+        ) as executor:
+            in_flight: set[Future[tuple[int, list[PageResult], float]]] = set()
+
+            for chunk in submitted_chunks():
+                if len(in_flight) >= max_in_flight:
+                    finished, in_flight = wait(
+                        in_flight, return_when=FIRST_COMPLETED
+                    )
+
+                    for future in finished:
+                        record(future.result())
+
+                in_flight.add(executor.submit(_generate_chunk, *chunk))
+
+            for future in as_completed(in_flight):
+                record(future.result())
+
+    deleted = delete_stale_pages(manifest.load(), current_manifest)
+    manifest.save(current_manifest)
+
+    elapsed = time.perf_counter() - start
+    total = sum(route_stats.pages for route_stats in stats)
+    written = sum(route_stats.written for route_stats in stats)
+
+    print(
+        f'Generated {total} pages in {elapsed:.2f}s ({written} written, '
+        f'{total - written} unchanged, {deleted} deleted)'
+    )
+
+    print('Time per route (summed over workers):')
+
+    for route, route_stats in zip(route_list, stats):
+        print(
+            f'  {route.url_pattern}: {route_stats.pages} pages '
+            f'({route_stats.written} written) in {route_stats.seconds:.2f}s'
+        )
 
 if __name__ == '__main__':
-    run()
\ No newline at end of file
+    import argparse
+
+    arg_parser = argparse.ArgumentParser()
+
+    arg_parser.add_argument('-j', '--jobs', type=int, default=None, help=(
+        'number of worker processes to use (defaults to the number of CPUs)'
+    ))
+
+    arg_parser.add_argument('-f', '--force', action='store_true', help=(
+        'regenerate every page, even if its inputs are unchanged'
+    ))
+
+    arg_parser.add_argument(
+        '--publish-mode', choices=[mode.value for mode in PublishMode],
+        default=PublishMode.AUTO.value, help=(
+            'how to publish static files and materials (by default, reflink '
+            'or hard link them where possible)'
+        )
+    )
+
+    arg_parser.add_argument(
+        '--precompile-templates', action='store_true', help=(
+            'compile the templates into Python modules before generating the '
+            'pages (by default, compiled templates are cached as bytecode)'
+        )
+    )
+
+    arg_parser.add_argument(
+        '--image-policy', choices=[policy.value for policy in ImagePolicy],
+        default=ImagePolicy.PUBLISH.value, help=(
+            "how hard to compress images: 'dev' compresses quickly and "
+            "'publish' (the default) compresses as much as possible"
+        )
+    )
+
+    parsed_args = arg_parser.parse_args()
+
+    run(
+        jobs=parsed_args.jobs, force=parsed_args.force,
+        publish_mode=PublishMode(parsed_args.publish_mode),
+        precompile_templates=parsed_args.precompile_templates,
+        image_policy=ImagePolicy(parsed_args.image_policy)
+    )
@@ -0,0 +1,180 @@
+import functools as ft
+import hashlib
+import inspect
+import json
+from pathlib import Path
+from typing import Any, Iterable
+import weakref
+import apsw
+import jinja2
+import jinja2.meta
+from rpgxp import material, settings
+from rpgxp.route.Route import BinaryRenderer
+from rpgxp.site import binary
+
+MATERIAL_COLUMNS = ('source', 'type', 'subtype', 'name')
+
+def manifest_path() -> Path:
+    return settings.db_root / 'site_manifest.json'
+
+def load() -> dict[str, str]:
+    """Load the manifest from the previous run, mapping each generated URL to
+    the digest of the inputs it was generated from."""
+
+    try:
+        with manifest_path().open(encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def save(manifest: dict[str, str]) -> None:
+    path = manifest_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+
+    with tmp_path.open('w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=0, sort_keys=True)
+
+    tmp_path.replace(path)
+
+_template_digests: weakref.WeakKeyDictionary[
+    jinja2.Environment, dict[str, bytes]
+] = weakref.WeakKeyDictionary()
+
+def template_digest(env: jinja2.Environment, template_name: str) -> bytes:
+    """Return a digest of the source of a template, together with every
+    template it extends, includes or imports."""
+
+    env_digests = _template_digests.setdefault(env, {})
+
+    try:
+        return env_digests[template_name]
+    except KeyError:
+        pass
+
+    assert env.loader is not None
+    source, _, _ = env.loader.get_source(env, template_name)
+    hasher = hashlib.sha256(source.encode('utf-8'))
+
+    for referenced in sorted(
+        name for name in
+        jinja2.meta.find_referenced_templates(env.parse(source))
+        if name is not None
+    ):
+        hasher.update(template_digest(env, referenced))
+
+    result = hasher.digest()
+    env_digests[template_name] = result
+    return result
+
+def source_files(path: Path) -> list[Path]:
+    """Return the path, if it's a file, or else every file under it (apart
+    from compiled modules), in a fixed order."""
+
+    if path.is_file():
+        return [path]
+
+    return sorted(
+        file_path for file_path in path.rglob('*')
+        if file_path.is_file() and '__pycache__' not in file_path.parts
+    )
+
+@ft.cache
+def renderer_digest(renderer: BinaryRenderer) -> bytes:
+    """Return a digest of the name of a binary renderer, together with the
+    source of the module it's defined in and of the files it depends on (see
+    binary.RENDERER_SOURCES)."""
+
+    hasher = hashlib.sha256(
+        f'{renderer.__module__}.{renderer.__qualname__}'.encode('utf-8')
+    )
+
+    module = inspect.getmodule(renderer)
+
+    if module is not None:
+        hasher.update(inspect.getsource(module).encode('utf-8'))
+
+    for source in binary.RENDERER_SOURCES.get(renderer, ()):
+        root = settings.package_root / source
+
+        for path in source_files(root):
+            hasher.update(path.relative_to(root).as_posix().encode('utf-8'))
+            hasher.update(b'\0')
+            hasher.update(hashlib.sha256(path.read_bytes()).digest())
+
+    return hasher.digest()
+
+def material_file_stamp(
+    source: Any, type_: Any, subtype: Any, name: Any
+) -> list[Any] | None:
+    """Return the size and modification time of a material file, or None if
+    the arguments don't identify an existing material file."""
+
+    if not all(isinstance(arg, str) for arg in (source, type_, subtype, name)):
+        return None
+
+    try:
+        root = material.root_for_source(source)
+    except ValueError:
+        return None
+
+    path = root / type_.capitalize() / subtype.capitalize() / name
+
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    return [stat.st_size, stat.st_mtime_ns]
+
+def _material_stamps(values: Iterable[Any]) -> Iterable[list[Any] | None]:
+    for value in values:
+        if isinstance(value, dict) and all(
+            column in value for column in MATERIAL_COLUMNS
+        ):
+            yield material_file_stamp(*(value[c] for c in MATERIAL_COLUMNS))
+
+        if isinstance(value, dict):
+            yield from _material_stamps(value.values())
+        elif isinstance(value, list):
+            yield from _material_stamps(value)
+
+def _hash_value(hasher: Any, value: apsw.SQLiteValue) -> None:
+    if isinstance(value, bytes):
+        hasher.update(b'b%d:' % len(value))
+        hasher.update(value)
+    else:
+        hasher.update(json.dumps(value).encode('utf-8'))
+
+    hasher.update(b'\0')
+
+def page_digest(
+    env: jinja2.Environment,
+    template: str | BinaryRenderer,
+    template_args: dict[str, Any],
+    dependencies: list[dict[str, apsw.SQLiteValue]],
+) -> str:
+    """Return a digest of everything a page is generated from: its template,
+    its template arguments, the rows of its dependency query and the size and
+    modification time of every material file referred to by any of these. For
+    binary pages, the image policy counts too."""
+
+    if isinstance(template, str):
+        hasher = hashlib.sha256(template_digest(env, template))
+    else:
+        hasher = hashlib.sha256(renderer_digest(template))
+        hasher.update(binary.image_policy.value.encode('utf-8'))
+
+    hasher.update(
+        json.dumps(template_args, sort_keys=True, default=repr).encode('utf-8')
+    )
+
+    for stamp in _material_stamps([template_args, *dependencies]):
+        hasher.update(json.dumps(stamp).encode('utf-8'))
+
+    for row in dependencies:
+        for column, value in row.items():
+            hasher.update(column.encode('utf-8'))
+            _hash_value(hasher, value)
+
+    return hasher.hexdigest()
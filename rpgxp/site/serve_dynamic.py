@@ -1,14 +1,16 @@
 from dataclasses import dataclass
 import functools as ft
 import mimetypes
+from pathlib import Path
 import re
 import traceback
-from typing import Iterator
+from typing import Iterable, Iterator
+import urllib.parse
 from wsgiref.types import WSGIEnvironment, StartResponse
-from wsgiref.simple_server import make_server
+from wsgiref.util import FileWrapper
 
 from rpgxp import settings
-from rpgxp.route.Route import Route
+from rpgxp.route.Route import BinaryRenderer, Route
 from rpgxp.route.routes import routes
 from rpgxp.site import common as site
 
@@ -24,7 +26,10 @@ def static_file_paths() -> frozenset[str]:
 class Response:
     status: str
     headers: list[tuple[str, str]]
-    content: bytes
+    content: bytes | Path | Iterator[bytes]
+    """The content of the response, the path to a file whose content is the
+    content of the response (which will be streamed from the file), or an
+    iterator over the chunks of the content."""
 
 class UnidentifiableMimeTypeError(Exception):
     pass
@@ -47,14 +52,7 @@ def respond_static(path: str, *, head_only: bool) -> Response:
     fs_path = site.static_root() / path.lstrip('/')
     size = fs_path.stat().st_size
     headers.append(('Content-Length', str(size)))
-
-    if head_only:
-        content = b''
-    else:
-        with fs_path.open('rb') as f:
-            content = f.read()
-
-    return Response('200 OK', headers, content)    
+    return Response('200 OK', headers, b'' if head_only else fs_path)
 
 class NoMatchingRouteError(Exception):
     pass
@@ -82,7 +80,30 @@ def match_route(path: str) -> tuple[Route, dict[str, str]]:
 
     raise NoMatchingRouteError
 
-def respond_dynamic(path: str, *, head_only: bool=False) -> Response:
+def error_response(
+    e: Exception, path: str, *, head_only: bool=False
+) -> Response:
+
+    content = site.render_template('error.j2', {
+        'url': path,
+        'traceback': "\n".join(traceback.format_exception(e))
+    }).encode('utf-8')
+
+    headers = [
+        ('Content-Type', 'text/html; charset=utf-8'),
+        ('Content-Length', str(len(content))),
+    ]
+
+    return Response(
+        '500 Internal Server Error', headers, b'' if head_only else content
+    )
+
+def respond_dynamic(
+    path: str, query_string: str='', *, head_only: bool=False
+) -> Response:
+
+    template: str | BinaryRenderer
+
     try:
         route, url_args = match_route(path.lstrip('/'))
     except NoMatchingRouteError:
@@ -90,71 +111,60 @@ def respond_dynamic(path: str, *, head_only: bool=False) -> Response:
         headers = [('Content-Type', 'text/html; charset=utf-8')]
         template = 'not_found.j2'
         template_args = {'url': path}
-        binary = False
+        url_args = {}
     else:
-        content_type = route.content_type
-
         status = '200 OK'
-        headers = [*content_type.headers(path)]
+        headers = [*route.content_type.headers(path)]
         template = route.template
+        query_args = urllib.parse.parse_qs(query_string)
+
+        for param in route.query_params:
+            url_args[param] = query_args.get(param, [''])[0]
 
         try:
             template_args = route.get_template_args(url_args)
         except Exception as e:
             e.add_note(
-                f'Occured when determing template arguments for "{template}"'
+                f'Occured when determing template arguments for '
+                f'"{route.template_name}"'
             )
             
             e.add_note(f'URL arguments: {url_args}')
+            return error_response(e, path, head_only=head_only)
 
-            status = '500 Internal Server Error'
-            headers = [('Content-Type', 'text/html; charset=utf-8')]
-            template = 'error.j2'
-            
-            template_args = {
-                'url': path,
-                'traceback': "\n".join(traceback.format_exception(e))
-            }
-            
-            binary = False
-        else:
-            binary = content_type.binary
+    content: bytes | Path | Iterator[bytes]
 
     try:
-        content = site.render_template(template, template_args)
+        if isinstance(template, str):
+            content = site.render_template(
+                template, template_args
+            ).encode('utf-8')
+        else:
+            content = template(**template_args)
     except Exception as e:
         e.add_note(f'Occured when rendering template "{template}"')
         e.add_note(f'Template arguments: {template_args}')
         e.add_note(f'URL arguments: {url_args}')
+        return error_response(e, path, head_only=head_only)
 
-        status = '500 Internal Server Error'
-        headers = [('Content-Type', 'text/html; charset=utf-8')]
-        template = 'error.j2'
-        
-        template_args = {
-            'url': path,
-            'traceback': "\n".join(traceback.format_exception(e))
-        }
-        
-        binary = False
-
-        content = site.render_template(template, template_args)
-
-    encoding = ('utf-8', 'surrogateescape') if binary else ('utf-8',)
-    encoded_content = content.encode(*encoding)
-
-    headers.append(('Content-Length', str(len(encoded_content))))
+    # the length of streamed content isn't known until it's all been sent
+    if isinstance(content, Path):
+        headers.append(('Content-Length', str(content.stat().st_size)))
+    elif isinstance(content, bytes):
+        headers.append(('Content-Length', str(len(content))))
 
     if head_only:
-        content = ''
+        content = b''
 
-    return Response(status, headers, encoded_content)
+    return Response(status, headers, content)
 
 ACCEPTED_METHODS = ('GET', 'HEAD')
 
+FILE_BLOCK_SIZE = 64 * 1024
+
 def wsgi_app(
     environ: WSGIEnvironment, start_response: StartResponse
-) -> list[bytes]:
+) -> Iterable[bytes]:
     method = environ['REQUEST_METHOD']
 
     if method not in ACCEPTED_METHODS:
@@ -171,12 +181,28 @@ def wsgi_app(
         if path.lstrip('/') in static_file_paths():
             response = respond_static(path, head_only=head_only)
         else:
-            response = respond_dynamic(path, head_only=head_only)
+            response = respond_dynamic(
+                path, query_string, head_only=head_only
+            )
 
     start_response(response.status, response.headers)
-    return [response.content]
+    content = response.content
+
+    if isinstance(content, Path):
+        # let the server send the file itself if it can (e.g. with sendfile)
+        file_wrapper = environ.get('wsgi.file_wrapper', FileWrapper)
+        return file_wrapper(content.open('rb'), FILE_BLOCK_SIZE)
+
+    if isinstance(content, bytes):
+        return [content]
+
+    return content
 
 def run() -> None:
+    # imported here since it pulls in http.server, which respond_dynamic (as
+    # used by the benchmarks) doesn't need
+    from wsgiref.simple_server import make_server
+
     with make_server('', 8000, wsgi_app) as httpd:
         httpd.serve_forever()
 
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Iterator, Self
+import hashlib
+from typing import Any, Iterable, Iterator, Self
 
 class SQLType(Enum):
 	NULL = 0
@@ -233,6 +234,54 @@ class TableSchema:
 		# pragma doesn't identify the rows that failed the check by any means
 		# other than their rowids
 
+	def foreign_key_indexes(
+		self, existing: Iterable[list[str]]=()
+	) -> list['IndexSchema']:
+		"""Return an index for each set of columns which is a foreign key,
+		unless the primary key or one of the `existing` indexes (given as lists
+		of columns) already starts with those columns. The rest of the primary
+		key columns are added at the end of each index, so that finding the
+		rows which refer to a given row doesn't require looking at the table
+		itself."""
+
+		pk = [column for column in self.columns() if column.pk]
+		pk_names = [column.name for column in pk]
+
+		# an INTEGER PRIMARY KEY column is the rowid, which every index
+		# includes anyway
+		if len(pk) == 1 and pk[0].type_ == 'INTEGER':
+			included_names = []
+		else:
+			included_names = pk_names
+
+		result: list[IndexSchema] = []
+		covered = [pk_names, *existing]
+
+		for constraint in self.constraints():
+			if not isinstance(constraint, ForeignKeyConstraint):
+				continue
+
+			columns = constraint.columns
+
+			if any(
+				index_columns[:len(columns)] == columns
+				for index_columns in covered
+			):
+				continue
+
+			covered.append(columns)
+
+			result.append(IndexSchema(
+				self.name,
+				[
+					*columns,
+					*(name for name in included_names if name not in columns)
+				],
+				name='__'.join([self.name, *columns])
+			))
+
+		return result
+
 	def __add__(self, other: Self) -> Self:
 		if other.name != self.name:
 			raise ValueError(
@@ -250,6 +299,29 @@ class TableSchema:
 		self.members = combined.members
 		return self
 
+@dataclass
+class IndexSchema:
+	table_name: str
+	columns: list[str]
+	unique: bool=False
+	name: str=''
+
+	def __post_init__(self) -> None:
+		if not self.name:
+			self.name = '__'.join([self.table_name, *self.columns])
+
+	def drop_string(self) -> str:
+		return f'DROP INDEX IF EXISTS "{self.name}";'
+
+	def __str__(self) -> str:
+		columns_csv = ', '.join(f'"{column}"' for column in self.columns)
+		unique = 'UNIQUE ' if self.unique else ''
+
+		return (
+			f'CREATE {unique}INDEX IF NOT EXISTS "{self.name}" '
+			f'ON "{self.table_name}" ({columns_csv});'
+		)
+
 def format_sql_value(value: Any, type_: str) -> str:
 	if value is None:
 		return 'NULL'
@@ -309,6 +381,37 @@ class Script:
 	def __str__(self) -> str:
 		return '\n\n'.join(map(str, self.statements))
 
+	def render_with_digests(self) -> tuple[str, dict[str, str]]:
+		"""Return the script as a string, together with a digest for each table
+		of the statements affecting it. If a table's digest is unchanged
+		between two scripts, running either script leaves the table with the
+		same contents."""
+
+		statement_strings: list[str] = []
+		hashers: dict[str, Any] = {}
+
+		for statement in self.statements:
+			statement_string = str(statement)
+			statement_strings.append(statement_string)
+
+			match statement:
+				case (
+					TableSchema(name) | InsertStatement(name)
+					| DeleteStatement(name)
+				):
+					if name not in hashers:
+						hashers[name] = hashlib.sha256()
+
+					hashers[name].update(statement_string.encode('utf-8'))
+				case _:
+					assert False, statement
+
+		digests = {
+			name: hasher.hexdigest() for name, hasher in hashers.items()
+		}
+
+		return '\n\n'.join(statement_strings), digests
+
 	def __add__(self, other: Self) -> Self:
 		return self.__class__(self.statements + other.statements)
 
@@ -1,8 +1,8 @@
 from collections.abc import Mapping
 from contextlib import contextmanager
 from enum import Enum
-import io
 import itertools as it
+import math
 from pathlib import Path
 from typing import assert_never, Iterator
 from warnings import warn
@@ -123,9 +123,26 @@ def get_autotile_configuration(
     ], 2)
 
 def map_data_from_id(map_id: int) -> np.ndarray:
-    data = db.fetch_value('SELECT data FROM map WHERE id = ?', [map_id])
-    assert isinstance(data, bytes)
-    return np.load(io.BytesIO(data))
+    dbh = db.connect()
+
+    xsize, ysize, zsize = db.fetch_row(
+        'SELECT data_xsize, data_ysize, data_zsize FROM map WHERE id = ?',
+        [map_id], dbh=dbh
+    )
+
+    assert isinstance(xsize, int)
+    assert isinstance(ysize, int)
+    assert isinstance(zsize, int)
+    shape = (xsize, ysize, zsize)
+    map_data = np.empty(math.prod(shape), dtype='<i2')
+
+    # the blob is read straight into the array's memory, rather than being
+    # fetched as a bytes object and then copied
+    with dbh.blob_open('main', 'map', 'data', map_id, False) as blob:
+        assert blob.length() == map_data.nbytes
+        blob.read_into(memoryview(map_data).cast('B'))
+
+    return map_data.reshape(shape, order='F')
 
 @contextmanager
 def tileset_from_map_id(map_id: int) -> Iterator[Image]:
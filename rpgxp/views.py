@@ -0,0 +1,306 @@
+from dataclasses import dataclass, field
+import hashlib
+import json
+import re
+import apsw
+from rpgxp import db, settings
+
+MATERIALIZED_VIEW_SCHEMA = '''CREATE TABLE IF NOT EXISTS materialized_view (
+    name TEXT PRIMARY KEY,
+    definition TEXT NOT NULL,
+    source_versions TEXT
+) STRICT;'''
+"""Keeps track of the materialized views. For each view, this records the
+statement it was created from, and the versions (from the table_version table)
+of the tables it reads from as of the last time it was refreshed (NULL if it
+hasn't been refreshed yet)."""
+
+MATERIALIZE_DIRECTIVE = re.compile(r'^\s*--\s*materialize\b(.*)$', re.MULTILINE)
+INDEX_DIRECTIVE = re.compile(r'index\s*\(([^)]*)\)')
+
+CREATE_VIEW = re.compile(
+    r'\bCREATE\s+VIEW\s+(?:IF\s+NOT\s+EXISTS\s+)?"?(\w+)"?', re.IGNORECASE
+)
+
+def definition_view_name(name: str) -> str:
+    """Return the name of the view which keeps the original definition of a
+    materialized view."""
+    return f'{name}__definition'
+
+def materialized_table_name(name: str) -> str:
+    """Return the name of the table which stores the contents of a
+    materialized view."""
+    return f'{name}__materialized'
+
+@dataclass
+class Statement:
+    sql: str
+
+@dataclass
+class MaterializedView(Statement):
+    """A view which is declared as materialized, by preceding its CREATE VIEW
+    statement with a comment of the form
+
+        -- materialize: index (col1, col2), index (col3)
+
+    The contents of the view are stored in a table named <name>__materialized,
+    with an index on each list of columns given, and the view itself just
+    selects everything from that table. The original definition of the view is
+    kept as a view named <name>__definition."""
+
+    name: str
+    indexes: list[list[str]] = field(default_factory=lambda: [])
+
+    @property
+    def definition_name(self) -> str:
+        return definition_view_name(self.name)
+
+    @property
+    def table_name(self) -> str:
+        return materialized_table_name(self.name)
+
+    def definition_sql(self) -> str:
+        return CREATE_VIEW.sub(
+            f'CREATE VIEW "{self.definition_name}"', self.sql, count=1
+        )
+
+def split_statements(script: str) -> list[str]:
+    statements: list[str] = []
+    lines: list[str] = []
+
+    for line in script.splitlines(keepends=True):
+        lines.append(line)
+        statement = ''.join(lines)
+
+        if apsw.complete(statement):
+            statements.append(statement.strip())
+            lines.clear()
+
+    if ''.join(lines).strip():
+        statements.append(''.join(lines).strip())
+
+    return statements
+
+def parse_views(script: str) -> list[Statement]:
+    result: list[Statement] = []
+
+    for statement in split_statements(script):
+        directive = MATERIALIZE_DIRECTIVE.search(statement)
+        create_view = CREATE_VIEW.search(statement)
+
+        if directive is None or create_view is None:
+            result.append(Statement(statement))
+            continue
+
+        indexes = [
+            [column.strip().strip('"') for column in columns.split(',')]
+            for columns in INDEX_DIRECTIVE.findall(directive.group(1))
+        ]
+
+        result.append(MaterializedView(
+            statement, create_view.group(1), indexes
+        ))
+
+    return result
+
+def source_tables(dbh: apsw.Connection, view_name: str) -> set[str]:
+    """Return the names of the tables a view reads from, including those read
+    via other views."""
+
+    result: set[str] = set()
+
+    def authorizer(
+        action: int, param1: str | None, param2: str | None,
+        db_name: str | None, trigger_or_view: str | None
+    ) -> int:
+
+        if action == apsw.SQLITE_READ and param1 is not None:
+            if not param1.startswith('sqlite_'):
+                result.add(param1)
+
+        return apsw.SQLITE_OK
+
+    previous_authorizer = dbh.authorizer
+    dbh.authorizer = authorizer
+
+    try:
+        # the statement mustn't come from the cache, as the authorizer is only
+        # called when a statement is prepared
+        dbh.execute(
+            f'SELECT * FROM "{view_name}" WHERE 0', can_cache=False
+        ).fetchall()
+    finally:
+        dbh.authorizer = previous_authorizer
+
+    # reads are also reported for the views themselves, which have no versions
+    tables = {
+        name for name, in dbh.execute(
+            "SELECT name FROM sqlite_schema WHERE type = 'table'"
+        )
+    }
+
+    return result & tables
+
+def create_materialized_view(
+    dbh: apsw.Connection, view: MaterializedView
+) -> None:
+
+    dbh.execute(f'DROP VIEW IF EXISTS "{view.name}"')
+    dbh.execute(f'DROP VIEW IF EXISTS "{view.definition_name}"')
+    dbh.execute(view.definition_sql())
+
+    stored_definition = db.fetch_rows(
+        'SELECT definition FROM materialized_view WHERE name = ?',
+        [view.name], dbh=dbh
+    )
+
+    table_exists = db.fetch_rows(
+        "SELECT 1 FROM sqlite_schema WHERE type = 'table' AND name = ?",
+        [view.table_name], dbh=dbh
+    )
+
+    # the table is kept from the previous build if the view is the same, so
+    # that it only needs to be refreshed if its source tables have changed
+    if stored_definition != [(view.sql,)] or not table_exists:
+        dbh.execute(f'DROP TABLE IF EXISTS "{view.table_name}"')
+
+        dbh.execute(
+            f'CREATE TABLE "{view.table_name}" AS '
+            f'SELECT * FROM "{view.definition_name}" WHERE 0'
+        )
+
+        for columns in view.indexes:
+            columns_csv = ', '.join(f'"{column}"' for column in columns)
+            index_name = '__'.join([view.table_name, *columns])
+
+            dbh.execute(
+                f'CREATE INDEX "{index_name}" '
+                f'ON "{view.table_name}" ({columns_csv})'
+            )
+
+        dbh.execute(
+            'INSERT OR REPLACE INTO materialized_view '
+            '(name, definition, source_versions) VALUES (?, ?, NULL)',
+            (view.name, view.sql)
+        )
+
+    dbh.execute(
+        f'CREATE VIEW "{view.name}" AS SELECT * FROM "{view.table_name}"'
+    )
+
+def refresh(dbh: apsw.Connection, name: str, *, force: bool=False) -> bool:
+    """Refresh a materialized view, unless none of the tables it reads from
+    have changed since it was last refreshed. Return whether it was
+    refreshed."""
+
+    definition_name = definition_view_name(name)
+    table_name = materialized_table_name(name)
+    sources = sorted(source_tables(dbh, definition_name))
+    versions = db.table_versions(dbh, sources)
+
+    definition, stored_versions = db.fetch_row(
+        'SELECT definition, source_versions FROM materialized_view '
+        'WHERE name = ?', [name], dbh=dbh
+    )
+
+    assert isinstance(definition, str)
+    assert stored_versions is None or isinstance(stored_versions, str)
+
+    if (
+        not force and stored_versions is not None
+        and None not in versions.values()
+        and json.loads(stored_versions) == versions
+    ):
+        return False
+
+    with dbh:
+        dbh.execute(f'DELETE FROM "{table_name}"')
+
+        dbh.execute(
+            f'INSERT INTO "{table_name}" SELECT * FROM "{definition_name}"'
+        )
+
+        dbh.execute(
+            'UPDATE materialized_view SET source_versions = ? WHERE name = ?',
+            (json.dumps(versions), name)
+        )
+
+    # views which read from this one only need to be refreshed if its
+    # definition or sources have changed
+    digest = hashlib.sha256(
+        json.dumps([definition, versions]).encode('utf-8')
+    ).hexdigest()
+
+    db.record_table_digests(dbh, {table_name: digest})
+    return True
+
+def refresh_all(dbh: apsw.Connection, *, force: bool=False) -> None:
+    """Refresh every existing materialized view whose source tables have
+    changed, in the order they were created."""
+
+    dbh.execute(MATERIALIZED_VIEW_SCHEMA)
+
+    for name, in dbh.execute(
+        'SELECT name FROM materialized_view ORDER BY rowid'
+    ).fetchall():
+        assert isinstance(name, str)
+
+        if refresh(dbh, name, force=force):
+            print(f'Refreshed materialized view {name}')
+        else:
+            print(f'Materialized view {name} is up to date')
+
+def run(*, force: bool=False) -> None:
+    """Create the views in sql/views.sql, and populate the materialized ones."""
+
+    dbh = db.connect()
+    dbh.execute(MATERIALIZED_VIEW_SCHEMA)
+    script_path = settings.project_root / 'sql/views.sql'
+
+    with script_path.open() as script_file:
+        statements = parse_views(script_file.read())
+
+    materialized_names = {
+        statement.name for statement in statements
+        if isinstance(statement, MaterializedView)
+    }
+
+    # forget about views which are no longer materialized
+    for name, in dbh.execute('SELECT name FROM materialized_view').fetchall():
+        assert isinstance(name, str)
+
+        if name not in materialized_names:
+            dbh.execute(f'DROP VIEW IF EXISTS "{definition_view_name(name)}"')
+
+            dbh.execute(
+                f'DROP TABLE IF EXISTS "{materialized_table_name(name)}"'
+            )
+
+            dbh.execute('DELETE FROM materialized_view WHERE name = ?', (name,))
+
+    for statement in statements:
+        if isinstance(statement, MaterializedView):
+            create_materialized_view(dbh, statement)
+        else:
+            dbh.execute(statement.sql)
+
+    # views are refreshed in the order they're defined, so that any
+    # materialized views a view reads from are refreshed first
+    for statement in statements:
+        if isinstance(statement, MaterializedView):
+            if refresh(dbh, statement.name, force=force):
+                print(f'Refreshed materialized view {statement.name}')
+            else:
+                print(f'Materialized view {statement.name} is up to date')
+
+if __name__ == '__main__':
+    import argparse
+
+    arg_parser = argparse.ArgumentParser()
+
+    arg_parser.add_argument('-f', '--force', action='store_true', help=(
+        'refresh every materialized view, even if its sources are unchanged'
+    ))
+
+    parsed_args = arg_parser.parse_args()
+    run(force=parsed_args.force)
@@ -0,0 +1,193 @@
+from dataclasses import dataclass
+import hashlib
+import json
+import re
+from rpgxp import db, sql
+from rpgxp.generate_db_schema import DBSchema, generate_schema
+
+SCHEMA = '''DROP TABLE IF EXISTS xref;
+CREATE TABLE xref (
+    kind TEXT NOT NULL,
+    target_id INTEGER NOT NULL,
+    source_kind TEXT NOT NULL,
+    source_table TEXT NOT NULL,
+    source_column TEXT NOT NULL,
+    source_key TEXT NOT NULL
+) STRICT;'''
+"""Records every place where a switch, variable or common event is used.
+
+Columns:
+  kind
+    What's being used: 'switch', 'variable' or 'common_event'.
+  target_id
+    The ID of the switch, variable or common event.
+  source_kind
+    The kind of thing it's used by, e.g. 'event_page' for map event pages and
+    the commands within them, or 'troop_page' for troop pages and the commands
+    within them.
+  source_table
+    The table of the row which uses it.
+  source_column
+    The column of that row which refers to it (for ranges of IDs, this is the
+    column giving the start of the range).
+  source_key
+    The primary key of that row, as a JSON object."""
+
+INDEXES = '''CREATE INDEX xref__kind__target_id
+ON xref (kind, target_id, source_table);'''
+
+TARGET_TABLES = ('switch', 'variable', 'common_event')
+"""The tables whose rows are indexed. The kind of each row is the table name."""
+
+OWNER_SUFFIX = re.compile(r'_(?:move_)?command(?:_.*)?$')
+"""Matches the part of a command table's name after the name of the table for
+the thing the commands belong to (e.g. the event page for
+event_page_command_control_switches or event_page_move_command_switch_on)."""
+
+@dataclass
+class ExtraReference:
+    """A reference which isn't a foreign key in the schema, in every table
+    whose name ends with `table_suffix`."""
+
+    table_suffix: str
+    kind: str
+    lo_column: str
+    hi_column: str=''
+    """If given, the row refers to every ID from the value of `lo_column` to
+    the value of this column, inclusive."""
+    condition: str=''
+
+EXTRA_REFERENCES = [
+    ExtraReference(
+        '_command_control_switches', 'switch', 'switch_id_lo', 'switch_id_hi'
+    ),
+    ExtraReference(
+        '_command_control_variables', 'variable',
+        'variable_id_lo', 'variable_id_hi'
+    ),
+    ExtraReference(
+        '_command_conditional_branch_variable', 'variable', 'variable_id'
+    ),
+    ExtraReference(
+        '_command_conditional_branch_variable', 'variable', 'value',
+        condition='"value_is_variable"'
+    ),
+]
+
+CONDITIONS = {
+    ('common_event', 'switch_id'): '"trigger" != 0',
+}
+"""Conditions under which a foreign key column counts as a reference, for
+columns that don't follow the convention of having a boolean column named
+after them to say whether they're used (like condition_switch1_id and
+condition_switch1_valid)."""
+
+@dataclass
+class Reference:
+    table: sql.TableSchema
+    kind: str
+    lo_column: str
+    hi_column: str=''
+    condition: str=''
+
+    def select_sql(self) -> str:
+        key_args = ', '.join(
+            f"'{column.name}', s.\"{column.name}\""
+            for column in self.table.pk()
+        )
+
+        if self.hi_column:
+            join_condition = (
+                f't.id BETWEEN s."{self.lo_column}" AND s."{self.hi_column}"'
+            )
+        else:
+            join_condition = f't.id = s."{self.lo_column}"'
+
+        source_kind = OWNER_SUFFIX.sub('', self.table.name)
+
+        return '\n'.join([
+            f"SELECT '{self.kind}', t.id, '{source_kind}', "
+            f"'{self.table.name}', '{self.lo_column}', "
+            f'json_object({key_args})',
+            f'FROM "{self.table.name}" s',
+            f'JOIN "{self.kind}" t ON {join_condition}',
+            f'WHERE {self.condition or 1}',
+        ])
+
+def references(db_schema: DBSchema) -> list[Reference]:
+    """Find every column in the schema which refers to a switch, variable or
+    common event. Foreign keys which are part of a primary key are left out,
+    as these just say what a row belongs to (e.g. a common event command's
+    common_event_id)."""
+
+    result: list[Reference] = []
+
+    for table in db_schema.tables():
+        column_names = {column.name for column in table.columns()}
+        pk_names = {column.name for column in table.pk()}
+
+        for constraint in table.constraints():
+            if not (
+                isinstance(constraint, sql.ForeignKeyConstraint)
+                and constraint.referenced_table in TARGET_TABLES
+                and len(constraint.columns) == 1
+                and constraint.columns[0] not in pk_names
+            ):
+                continue
+
+            column, = constraint.columns
+            condition = CONDITIONS.get((table.name, column), '')
+            valid_column = column.removesuffix('_id') + '_valid'
+
+            if not condition and valid_column in column_names:
+                condition = f'"{valid_column}"'
+
+            result.append(Reference(
+                table, constraint.referenced_table, column, condition=condition
+            ))
+
+        for extra in EXTRA_REFERENCES:
+            if table.name.endswith(extra.table_suffix):
+                result.append(Reference(
+                    table, extra.kind, extra.lo_column, extra.hi_column,
+                    extra.condition
+                ))
+
+    return result
+
+def build_script(db_schema: DBSchema) -> str:
+    inserts = [
+        '\n'.join([
+            'INSERT INTO xref (',
+            '    kind, target_id, source_kind, source_table, source_column, '
+            'source_key',
+            ')',
+            f'{reference.select_sql()};'
+        ])
+        for reference in references(db_schema)
+    ]
+
+    return '\n\n'.join([SCHEMA, *inserts, INDEXES])
+
+def run() -> None:
+    db_schema = generate_schema()
+    script = build_script(db_schema)
+    dbh = db.connect()
+
+    with dbh:
+        dbh.execute(script)
+
+    # the digest is of the table's contents, so that anything derived from
+    # the table is only rebuilt if the references have actually changed
+    hasher = hashlib.sha256()
+    count = 0
+
+    for row in dbh.execute('SELECT * FROM xref ORDER BY rowid'):
+        hasher.update(json.dumps(row).encode('utf-8'))
+        count += 1
+
+    db.record_table_digests(dbh, {'xref': hasher.hexdigest()})
+    print(f'Indexed {count} references')
+
+if __name__ == '__main__':
+    run()
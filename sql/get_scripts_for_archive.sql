@@ -1,4 +1 @@
-SELECT JSON_GROUP_ARRAY(JSON_OBJECT(
-	'name', name || '.rb',
-	'content', content
-)) scripts FROM script
\ No newline at end of file
+SELECT name || '.rb' name, content FROM script ORDER BY id
\ No newline at end of file
@@ -1,2 +1,2 @@
-SELECT subtype, full_name as name FROM material_best_file
+SELECT lower(subtype) subtype, full_name as name FROM material_best_file
 WHERE type = 'Graphics';
\ No newline at end of file
@@ -0,0 +1,350 @@
+CREATE INDEX IF NOT EXISTS "script__name" ON "script" ("name");
+CREATE INDEX IF NOT EXISTS "map_info__parent_id__order" ON "map_info" ("parent_id", "order");
+CREATE INDEX IF NOT EXISTS "actor__class_id" ON "actor" ("class_id");
+CREATE INDEX IF NOT EXISTS "actor__character_name___character_name__type___character_name__subtype" ON "actor" ("character_name", "_character_name__type", "_character_name__subtype");
+CREATE INDEX IF NOT EXISTS "actor__battler_name___battler_name__type___battler_name__subtype" ON "actor" ("battler_name", "_battler_name__type", "_battler_name__subtype");
+CREATE INDEX IF NOT EXISTS "actor__weapon_id" ON "actor" ("weapon_id");
+CREATE INDEX IF NOT EXISTS "actor__armor1_id" ON "actor" ("armor1_id");
+CREATE INDEX IF NOT EXISTS "actor__armor2_id" ON "actor" ("armor2_id");
+CREATE INDEX IF NOT EXISTS "actor__armor3_id" ON "actor" ("armor3_id");
+CREATE INDEX IF NOT EXISTS "actor__armor4_id" ON "actor" ("armor4_id");
+CREATE INDEX IF NOT EXISTS "animation__animation_name___animation_name__type___animation_name__subtype" ON "animation" ("animation_name", "_animation_name__type", "_animation_name__subtype");
+CREATE INDEX IF NOT EXISTS "animation__position" ON "animation" ("position");
+CREATE INDEX IF NOT EXISTS "animation_timing__se_name___se_name__type___se_name__subtype" ON "animation_timing" ("se_name", "_se_name__type", "_se_name__subtype", "animation_id", "index");
+CREATE INDEX IF NOT EXISTS "animation_timing__flash_scope" ON "animation_timing" ("flash_scope", "animation_id", "index");
+CREATE INDEX IF NOT EXISTS "animation_timing__condition" ON "animation_timing" ("condition", "animation_id", "index");
+CREATE INDEX IF NOT EXISTS "armor__icon_name___icon_name__type___icon_name__subtype" ON "armor" ("icon_name", "_icon_name__type", "_icon_name__subtype");
+CREATE INDEX IF NOT EXISTS "armor__kind" ON "armor" ("kind");
+CREATE INDEX IF NOT EXISTS "armor__auto_state_id" ON "armor" ("auto_state_id");
+CREATE INDEX IF NOT EXISTS "armor_guard_element__element_id" ON "armor_guard_element" ("element_id", "armor_id");
+CREATE INDEX IF NOT EXISTS "armor_guard_state__state_id" ON "armor_guard_state" ("state_id", "armor_id");
+CREATE INDEX IF NOT EXISTS "class__position" ON "class" ("position");
+CREATE INDEX IF NOT EXISTS "class_weapon__weapon_id" ON "class_weapon" ("weapon_id", "class_id");
+CREATE INDEX IF NOT EXISTS "class_armor__armor_id" ON "class_armor" ("armor_id", "class_id");
+CREATE INDEX IF NOT EXISTS "class_learning__skill_id" ON "class_learning" ("skill_id", "class_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event__trigger" ON "common_event" ("trigger");
+CREATE INDEX IF NOT EXISTS "common_event__switch_id" ON "common_event" ("switch_id");
+CREATE INDEX IF NOT EXISTS "common_event_command_show_choices__cancel_type" ON "common_event_command_show_choices" ("cancel_type", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_input_number__variable_id" ON "common_event_command_input_number" ("variable_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_change_text_options__position" ON "common_event_command_change_text_options" ("position", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_button_input_processing__variable_id" ON "common_event_command_button_input_processing" ("variable_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_conditional_branch_switch__switch_id" ON "common_event_command_conditional_branch_switch" ("switch_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_conditional_branch_switch__state" ON "common_event_command_conditional_branch_switch" ("state", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_conditional_branch_variable__comparison" ON "common_event_command_conditional_branch_variable" ("comparison", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_conditional_branch_self_switch__self_switch_ch" ON "common_event_command_conditional_branch_self_switch" ("self_switch_ch", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_conditional_branch_self_switch__state" ON "common_event_command_conditional_branch_self_switch" ("state", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_conditional_branch_timer__bound_type" ON "common_event_command_conditional_branch_timer" ("bound_type", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_conditional_branch_actor_skill__skill_id" ON "common_event_command_conditional_branch_actor_skill" ("skill_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_conditional_branch_actor_weapon__weapon_id" ON "common_event_command_conditional_branch_actor_weapon" ("weapon_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_conditional_branch_actor_armor__armor_id" ON "common_event_command_conditional_branch_actor_armor" ("armor_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_conditional_branch_actor_state__state_id" ON "common_event_command_conditional_branch_actor_state" ("state_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_conditional_branch_actor__actor_id" ON "common_event_command_conditional_branch_actor" ("actor_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_conditional_branch_enemy_state__state_id" ON "common_event_command_conditional_branch_enemy_state" ("state_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_conditional_branch_enemy__enemy_id" ON "common_event_command_conditional_branch_enemy" ("enemy_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_conditional_branch_character__direction" ON "common_event_command_conditional_branch_character" ("direction", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_conditional_branch_gold__bound_type" ON "common_event_command_conditional_branch_gold" ("bound_type", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_conditional_branch_item__item_id" ON "common_event_command_conditional_branch_item" ("item_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_conditional_branch_weapon__weapon_id" ON "common_event_command_conditional_branch_weapon" ("weapon_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_conditional_branch_armor__armor_id" ON "common_event_command_conditional_branch_armor" ("armor_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_call_common_event__called_event_id" ON "common_event_command_call_common_event" ("called_event_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_control_switches__state" ON "common_event_command_control_switches" ("state", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_control_variables_variable__variable_id" ON "common_event_command_control_variables_variable" ("variable_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_control_variables_other__other_operand_type" ON "common_event_command_control_variables_other" ("other_operand_type", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_control_variables__assign_type" ON "common_event_command_control_variables" ("assign_type", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_control_self_switch__self_switch_ch" ON "common_event_command_control_self_switch" ("self_switch_ch", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_control_self_switch__state" ON "common_event_command_control_self_switch" ("state", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_change_gold__diff_type" ON "common_event_command_change_gold" ("diff_type", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_change_items__item_id" ON "common_event_command_change_items" ("item_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_change_items__operation" ON "common_event_command_change_items" ("operation", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_change_items__operand_type" ON "common_event_command_change_items" ("operand_type", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_change_weapons__weapon_id" ON "common_event_command_change_weapons" ("weapon_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_change_weapons__operation" ON "common_event_command_change_weapons" ("operation", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_change_weapons__operand_type" ON "common_event_command_change_weapons" ("operand_type", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_change_armor__armor_id" ON "common_event_command_change_armor" ("armor_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_change_armor__operation" ON "common_event_command_change_armor" ("operation", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_change_armor__operand_type" ON "common_event_command_change_armor" ("operand_type", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_change_party_member__actor_id" ON "common_event_command_change_party_member" ("actor_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_change_party_member__add_or_remove" ON "common_event_command_change_party_member" ("add_or_remove", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_change_battle_bgm__audio_name___audio_name__type___audio_name__subtype" ON "common_event_command_change_battle_bgm" ("audio_name", "_audio_name__type", "_audio_name__subtype", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_change_battle_end_me__audio_name___audio_name__type___audio_name__subtype" ON "common_event_command_change_battle_end_me" ("audio_name", "_audio_name__type", "_audio_name__subtype", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_transfer_player__direction" ON "common_event_command_transfer_player" ("direction", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_set_event_location__appoint_type" ON "common_event_command_set_event_location" ("appoint_type", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_set_event_location__direction" ON "common_event_command_set_event_location" ("direction", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_scroll_map__direction" ON "common_event_command_scroll_map" ("direction", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_change_map_settings_panorama__name___name__type___name__subtype" ON "common_event_command_change_map_settings_panorama" ("name", "_name__type", "_name__subtype", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_change_map_settings_fog__name___name__type___name__subtype" ON "common_event_command_change_map_settings_fog" ("name", "_name__type", "_name__subtype", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_change_map_settings_battle_back__name___name__type___name__subtype" ON "common_event_command_change_map_settings_battle_back" ("name", "_name__type", "_name__subtype", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_set_move_route_move_command_switch_on__switch_id" ON "common_event_command_set_move_route_move_command_switch_on" ("switch_id", "common_event_id", "common_event_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_set_move_route_move_command_switch_off__switch_id" ON "common_event_command_set_move_route_move_command_switch_off" ("switch_id", "common_event_id", "common_event_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_set_move_route_move_command_change_speed__speed" ON "common_event_command_set_move_route_move_command_change_speed" ("speed", "common_event_id", "common_event_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_set_move_route_move_command_change_freq__freq" ON "common_event_command_set_move_route_move_command_change_freq" ("freq", "common_event_id", "common_event_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_set_move_route_move_command_graphic__character_name___character_name__type___character_name__subtype" ON "common_event_command_set_move_route_move_command_graphic" ("character_name", "_character_name__type", "_character_name__subtype", "common_event_id", "common_event_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_set_move_route_move_command_graphic__direction" ON "common_event_command_set_move_route_move_command_graphic" ("direction", "common_event_id", "common_event_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_set_move_route_move_command_play_se__audio_name___audio_name__type___audio_name__subtype" ON "common_event_command_set_move_route_move_command_play_se" ("audio_name", "_audio_name__type", "_audio_name__subtype", "common_event_id", "common_event_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_show_picture__name___name__type___name__subtype" ON "common_event_command_show_picture" ("name", "_name__type", "_name__subtype", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_set_weather_effects__type" ON "common_event_command_set_weather_effects" ("type", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_play_bgm__audio_name___audio_name__type___audio_name__subtype" ON "common_event_command_play_bgm" ("audio_name", "_audio_name__type", "_audio_name__subtype", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_play_bgs__audio_name___audio_name__type___audio_name__subtype" ON "common_event_command_play_bgs" ("audio_name", "_audio_name__type", "_audio_name__subtype", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_play_me__audio_name___audio_name__type___audio_name__subtype" ON "common_event_command_play_me" ("audio_name", "_audio_name__type", "_audio_name__subtype", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_play_se__audio_name___audio_name__type___audio_name__subtype" ON "common_event_command_play_se" ("audio_name", "_audio_name__type", "_audio_name__subtype", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_battle_processing__opponent_troop_id" ON "common_event_command_battle_processing" ("opponent_troop_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_name_input_processing__actor_id" ON "common_event_command_name_input_processing" ("actor_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_recover_all__actor_id" ON "common_event_command_recover_all" ("actor_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_enemy_transform__new_enemy_id" ON "common_event_command_enemy_transform" ("new_enemy_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_continue_set_move_route_switch_on__switch_id" ON "common_event_command_continue_set_move_route_switch_on" ("switch_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_continue_set_move_route_switch_off__switch_id" ON "common_event_command_continue_set_move_route_switch_off" ("switch_id", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_continue_set_move_route_change_speed__speed" ON "common_event_command_continue_set_move_route_change_speed" ("speed", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_continue_set_move_route_change_freq__freq" ON "common_event_command_continue_set_move_route_change_freq" ("freq", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_continue_set_move_route_graphic__character_name___character_name__type___character_name__subtype" ON "common_event_command_continue_set_move_route_graphic" ("character_name", "_character_name__type", "_character_name__subtype", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_continue_set_move_route_graphic__direction" ON "common_event_command_continue_set_move_route_graphic" ("direction", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "common_event_command_continue_set_move_route_play_se__audio_name___audio_name__type___audio_name__subtype" ON "common_event_command_continue_set_move_route_play_se" ("audio_name", "_audio_name__type", "_audio_name__subtype", "common_event_id", "index");
+CREATE INDEX IF NOT EXISTS "enemy__battler_name___battler_name__type___battler_name__subtype" ON "enemy" ("battler_name", "_battler_name__type", "_battler_name__subtype");
+CREATE INDEX IF NOT EXISTS "enemy__animation1_id" ON "enemy" ("animation1_id");
+CREATE INDEX IF NOT EXISTS "enemy__animation2_id" ON "enemy" ("animation2_id");
+CREATE INDEX IF NOT EXISTS "enemy__item_id" ON "enemy" ("item_id");
+CREATE INDEX IF NOT EXISTS "enemy__weapon_id" ON "enemy" ("weapon_id");
+CREATE INDEX IF NOT EXISTS "enemy__armor_id" ON "enemy" ("armor_id");
+CREATE INDEX IF NOT EXISTS "enemy_action__kind" ON "enemy_action" ("kind", "enemy_id", "index");
+CREATE INDEX IF NOT EXISTS "enemy_action__basic" ON "enemy_action" ("basic", "enemy_id", "index");
+CREATE INDEX IF NOT EXISTS "enemy_action__skill_id" ON "enemy_action" ("skill_id", "enemy_id", "index");
+CREATE INDEX IF NOT EXISTS "enemy_action__condition_switch_id" ON "enemy_action" ("condition_switch_id", "enemy_id", "index");
+CREATE INDEX IF NOT EXISTS "item__icon_name___icon_name__type___icon_name__subtype" ON "item" ("icon_name", "_icon_name__type", "_icon_name__subtype");
+CREATE INDEX IF NOT EXISTS "item__scope" ON "item" ("scope");
+CREATE INDEX IF NOT EXISTS "item__occasion" ON "item" ("occasion");
+CREATE INDEX IF NOT EXISTS "item__animation1_id" ON "item" ("animation1_id");
+CREATE INDEX IF NOT EXISTS "item__animation2_id" ON "item" ("animation2_id");
+CREATE INDEX IF NOT EXISTS "item__menu_se_name___menu_se_name__type___menu_se_name__subtype" ON "item" ("menu_se_name", "_menu_se_name__type", "_menu_se_name__subtype");
+CREATE INDEX IF NOT EXISTS "item__common_event_id" ON "item" ("common_event_id");
+CREATE INDEX IF NOT EXISTS "item__parameter_type" ON "item" ("parameter_type");
+CREATE INDEX IF NOT EXISTS "item_element__element_id" ON "item_element" ("element_id", "item_id");
+CREATE INDEX IF NOT EXISTS "item_plus_state__state_id" ON "item_plus_state" ("state_id", "item_id");
+CREATE INDEX IF NOT EXISTS "item_minus_state__state_id" ON "item_minus_state" ("state_id", "item_id");
+CREATE INDEX IF NOT EXISTS "encounter__troop_id" ON "encounter" ("troop_id", "map_id", "index");
+CREATE INDEX IF NOT EXISTS "event_page__condition_switch1_id" ON "event_page" ("condition_switch1_id", "map_id", "event_id", "index");
+CREATE INDEX IF NOT EXISTS "event_page__condition_switch2_id" ON "event_page" ("condition_switch2_id", "map_id", "event_id", "index");
+CREATE INDEX IF NOT EXISTS "event_page__condition_variable_id" ON "event_page" ("condition_variable_id", "map_id", "event_id", "index");
+CREATE INDEX IF NOT EXISTS "event_page__condition_self_switch_ch" ON "event_page" ("condition_self_switch_ch", "map_id", "event_id", "index");
+CREATE INDEX IF NOT EXISTS "event_page__graphic_character_name___graphic_character_name__type___graphic_character_name__subtype" ON "event_page" ("graphic_character_name", "_graphic_character_name__type", "_graphic_character_name__subtype", "map_id", "event_id", "index");
+CREATE INDEX IF NOT EXISTS "event_page__graphic_direction" ON "event_page" ("graphic_direction", "map_id", "event_id", "index");
+CREATE INDEX IF NOT EXISTS "event_page__move_type" ON "event_page" ("move_type", "map_id", "event_id", "index");
+CREATE INDEX IF NOT EXISTS "event_page__move_frequency" ON "event_page" ("move_frequency", "map_id", "event_id", "index");
+CREATE INDEX IF NOT EXISTS "event_page__move_speed" ON "event_page" ("move_speed", "map_id", "event_id", "index");
+CREATE INDEX IF NOT EXISTS "event_page__trigger" ON "event_page" ("trigger", "map_id", "event_id", "index");
+CREATE INDEX IF NOT EXISTS "event_page_move_command_switch_on__switch_id" ON "event_page_move_command_switch_on" ("switch_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_move_command_switch_off__switch_id" ON "event_page_move_command_switch_off" ("switch_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_move_command_change_speed__speed" ON "event_page_move_command_change_speed" ("speed", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_move_command_change_freq__freq" ON "event_page_move_command_change_freq" ("freq", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_move_command_graphic__character_name___character_name__type___character_name__subtype" ON "event_page_move_command_graphic" ("character_name", "_character_name__type", "_character_name__subtype", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_move_command_graphic__direction" ON "event_page_move_command_graphic" ("direction", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_move_command_play_se__audio_name___audio_name__type___audio_name__subtype" ON "event_page_move_command_play_se" ("audio_name", "_audio_name__type", "_audio_name__subtype", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_show_choices__cancel_type" ON "event_page_command_show_choices" ("cancel_type", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_input_number__variable_id" ON "event_page_command_input_number" ("variable_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_change_text_options__position" ON "event_page_command_change_text_options" ("position", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_button_input_processing__variable_id" ON "event_page_command_button_input_processing" ("variable_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_conditional_branch_switch__switch_id" ON "event_page_command_conditional_branch_switch" ("switch_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_conditional_branch_switch__state" ON "event_page_command_conditional_branch_switch" ("state", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_conditional_branch_variable__comparison" ON "event_page_command_conditional_branch_variable" ("comparison", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_conditional_branch_self_switch__self_switch_ch" ON "event_page_command_conditional_branch_self_switch" ("self_switch_ch", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_conditional_branch_self_switch__state" ON "event_page_command_conditional_branch_self_switch" ("state", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_conditional_branch_timer__bound_type" ON "event_page_command_conditional_branch_timer" ("bound_type", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_conditional_branch_actor_skill__skill_id" ON "event_page_command_conditional_branch_actor_skill" ("skill_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_conditional_branch_actor_weapon__weapon_id" ON "event_page_command_conditional_branch_actor_weapon" ("weapon_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_conditional_branch_actor_armor__armor_id" ON "event_page_command_conditional_branch_actor_armor" ("armor_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_conditional_branch_actor_state__state_id" ON "event_page_command_conditional_branch_actor_state" ("state_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_conditional_branch_actor__actor_id" ON "event_page_command_conditional_branch_actor" ("actor_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_conditional_branch_enemy_state__state_id" ON "event_page_command_conditional_branch_enemy_state" ("state_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_conditional_branch_enemy__enemy_id" ON "event_page_command_conditional_branch_enemy" ("enemy_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_conditional_branch_character__direction" ON "event_page_command_conditional_branch_character" ("direction", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_conditional_branch_gold__bound_type" ON "event_page_command_conditional_branch_gold" ("bound_type", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_conditional_branch_item__item_id" ON "event_page_command_conditional_branch_item" ("item_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_conditional_branch_weapon__weapon_id" ON "event_page_command_conditional_branch_weapon" ("weapon_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_conditional_branch_armor__armor_id" ON "event_page_command_conditional_branch_armor" ("armor_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_call_common_event__called_event_id" ON "event_page_command_call_common_event" ("called_event_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_control_switches__state" ON "event_page_command_control_switches" ("state", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_control_variables_variable__variable_id" ON "event_page_command_control_variables_variable" ("variable_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_control_variables_other__other_operand_type" ON "event_page_command_control_variables_other" ("other_operand_type", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_control_variables__assign_type" ON "event_page_command_control_variables" ("assign_type", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_control_self_switch__self_switch_ch" ON "event_page_command_control_self_switch" ("self_switch_ch", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_control_self_switch__state" ON "event_page_command_control_self_switch" ("state", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_change_gold__diff_type" ON "event_page_command_change_gold" ("diff_type", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_change_items__item_id" ON "event_page_command_change_items" ("item_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_change_items__operation" ON "event_page_command_change_items" ("operation", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_change_items__operand_type" ON "event_page_command_change_items" ("operand_type", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_change_weapons__weapon_id" ON "event_page_command_change_weapons" ("weapon_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_change_weapons__operation" ON "event_page_command_change_weapons" ("operation", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_change_weapons__operand_type" ON "event_page_command_change_weapons" ("operand_type", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_change_armor__armor_id" ON "event_page_command_change_armor" ("armor_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_change_armor__operation" ON "event_page_command_change_armor" ("operation", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_change_armor__operand_type" ON "event_page_command_change_armor" ("operand_type", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_change_party_member__actor_id" ON "event_page_command_change_party_member" ("actor_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_change_party_member__add_or_remove" ON "event_page_command_change_party_member" ("add_or_remove", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_change_battle_bgm__audio_name___audio_name__type___audio_name__subtype" ON "event_page_command_change_battle_bgm" ("audio_name", "_audio_name__type", "_audio_name__subtype", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_change_battle_end_me__audio_name___audio_name__type___audio_name__subtype" ON "event_page_command_change_battle_end_me" ("audio_name", "_audio_name__type", "_audio_name__subtype", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_transfer_player__direction" ON "event_page_command_transfer_player" ("direction", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_set_event_location__appoint_type" ON "event_page_command_set_event_location" ("appoint_type", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_set_event_location__direction" ON "event_page_command_set_event_location" ("direction", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_scroll_map__direction" ON "event_page_command_scroll_map" ("direction", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_change_map_settings_panorama__name___name__type___name__subtype" ON "event_page_command_change_map_settings_panorama" ("name", "_name__type", "_name__subtype", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_change_map_settings_fog__name___name__type___name__subtype" ON "event_page_command_change_map_settings_fog" ("name", "_name__type", "_name__subtype", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_change_map_settings_battle_back__name___name__type___name__subtype" ON "event_page_command_change_map_settings_battle_back" ("name", "_name__type", "_name__subtype", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_set_move_route_move_command_switch_on__switch_id" ON "event_page_command_set_move_route_move_command_switch_on" ("switch_id", "map_id", "event_id", "event_page_index", "event_page_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_set_move_route_move_command_switch_off__switch_id" ON "event_page_command_set_move_route_move_command_switch_off" ("switch_id", "map_id", "event_id", "event_page_index", "event_page_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_set_move_route_move_command_change_speed__speed" ON "event_page_command_set_move_route_move_command_change_speed" ("speed", "map_id", "event_id", "event_page_index", "event_page_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_set_move_route_move_command_change_freq__freq" ON "event_page_command_set_move_route_move_command_change_freq" ("freq", "map_id", "event_id", "event_page_index", "event_page_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_set_move_route_move_command_graphic__character_name___character_name__type___character_name__subtype" ON "event_page_command_set_move_route_move_command_graphic" ("character_name", "_character_name__type", "_character_name__subtype", "map_id", "event_id", "event_page_index", "event_page_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_set_move_route_move_command_graphic__direction" ON "event_page_command_set_move_route_move_command_graphic" ("direction", "map_id", "event_id", "event_page_index", "event_page_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_set_move_route_move_command_play_se__audio_name___audio_name__type___audio_name__subtype" ON "event_page_command_set_move_route_move_command_play_se" ("audio_name", "_audio_name__type", "_audio_name__subtype", "map_id", "event_id", "event_page_index", "event_page_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_show_picture__name___name__type___name__subtype" ON "event_page_command_show_picture" ("name", "_name__type", "_name__subtype", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_set_weather_effects__type" ON "event_page_command_set_weather_effects" ("type", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_play_bgm__audio_name___audio_name__type___audio_name__subtype" ON "event_page_command_play_bgm" ("audio_name", "_audio_name__type", "_audio_name__subtype", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_play_bgs__audio_name___audio_name__type___audio_name__subtype" ON "event_page_command_play_bgs" ("audio_name", "_audio_name__type", "_audio_name__subtype", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_play_me__audio_name___audio_name__type___audio_name__subtype" ON "event_page_command_play_me" ("audio_name", "_audio_name__type", "_audio_name__subtype", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_play_se__audio_name___audio_name__type___audio_name__subtype" ON "event_page_command_play_se" ("audio_name", "_audio_name__type", "_audio_name__subtype", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_battle_processing__opponent_troop_id" ON "event_page_command_battle_processing" ("opponent_troop_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_name_input_processing__actor_id" ON "event_page_command_name_input_processing" ("actor_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_recover_all__actor_id" ON "event_page_command_recover_all" ("actor_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_enemy_transform__new_enemy_id" ON "event_page_command_enemy_transform" ("new_enemy_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_continue_set_move_route_switch_on__switch_id" ON "event_page_command_continue_set_move_route_switch_on" ("switch_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_continue_set_move_route_switch_off__switch_id" ON "event_page_command_continue_set_move_route_switch_off" ("switch_id", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_continue_set_move_route_change_speed__speed" ON "event_page_command_continue_set_move_route_change_speed" ("speed", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_continue_set_move_route_change_freq__freq" ON "event_page_command_continue_set_move_route_change_freq" ("freq", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_continue_set_move_route_graphic__character_name___character_name__type___character_name__subtype" ON "event_page_command_continue_set_move_route_graphic" ("character_name", "_character_name__type", "_character_name__subtype", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_continue_set_move_route_graphic__direction" ON "event_page_command_continue_set_move_route_graphic" ("direction", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "event_page_command_continue_set_move_route_play_se__audio_name___audio_name__type___audio_name__subtype" ON "event_page_command_continue_set_move_route_play_se" ("audio_name", "_audio_name__type", "_audio_name__subtype", "map_id", "event_id", "event_page_index", "index");
+CREATE INDEX IF NOT EXISTS "map__tileset_id" ON "map" ("tileset_id");
+CREATE INDEX IF NOT EXISTS "skill__icon_name___icon_name__type___icon_name__subtype" ON "skill" ("icon_name", "_icon_name__type", "_icon_name__subtype");
+CREATE INDEX IF NOT EXISTS "skill__scope" ON "skill" ("scope");
+CREATE INDEX IF NOT EXISTS "skill__occasion" ON "skill" ("occasion");
+CREATE INDEX IF NOT EXISTS "skill__animation1_id" ON "skill" ("animation1_id");
+CREATE INDEX IF NOT EXISTS "skill__animation2_id" ON "skill" ("animation2_id");
+CREATE INDEX IF NOT EXISTS "skill__menu_se_name___menu_se_name__type___menu_se_name__subtype" ON "skill" ("menu_se_name", "_menu_se_name__type", "_menu_se_name__subtype");
+CREATE INDEX IF NOT EXISTS "skill__common_event_id" ON "skill" ("common_event_id");
+CREATE INDEX IF NOT EXISTS "skill_element__element_id" ON "skill_element" ("element_id", "skill_id");
+CREATE INDEX IF NOT EXISTS "skill_plus_state__state_id" ON "skill_plus_state" ("state_id", "skill_id");
+CREATE INDEX IF NOT EXISTS "skill_minus_state__state_id" ON "skill_minus_state" ("state_id", "skill_id");
+CREATE INDEX IF NOT EXISTS "state__animation_id" ON "state" ("animation_id");
+CREATE INDEX IF NOT EXISTS "state__restriction" ON "state" ("restriction");
+CREATE INDEX IF NOT EXISTS "state_guard_element__element_id" ON "state_guard_element" ("element_id", "state_id");
+CREATE INDEX IF NOT EXISTS "state_plus_state__plus_state_id" ON "state_plus_state" ("plus_state_id", "state_id");
+CREATE INDEX IF NOT EXISTS "state_minus_state__minus_state_id" ON "state_minus_state" ("minus_state_id", "state_id");
+CREATE INDEX IF NOT EXISTS "system__windowskin_name___windowskin_name__type___windowskin_name__subtype" ON "system" ("windowskin_name", "_windowskin_name__type", "_windowskin_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__title_name___title_name__type___title_name__subtype" ON "system" ("title_name", "_title_name__type", "_title_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__gameover_name___gameover_name__type___gameover_name__subtype" ON "system" ("gameover_name", "_gameover_name__type", "_gameover_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__battle_transition___battle_transition__type___battle_transition__subtype" ON "system" ("battle_transition", "_battle_transition__type", "_battle_transition__subtype");
+CREATE INDEX IF NOT EXISTS "system__title_bgm_name___title_bgm_name__type___title_bgm_name__subtype" ON "system" ("title_bgm_name", "_title_bgm_name__type", "_title_bgm_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__battle_bgm_name___battle_bgm_name__type___battle_bgm_name__subtype" ON "system" ("battle_bgm_name", "_battle_bgm_name__type", "_battle_bgm_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__battle_end_me_name___battle_end_me_name__type___battle_end_me_name__subtype" ON "system" ("battle_end_me_name", "_battle_end_me_name__type", "_battle_end_me_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__gameover_me_name___gameover_me_name__type___gameover_me_name__subtype" ON "system" ("gameover_me_name", "_gameover_me_name__type", "_gameover_me_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__cursor_se_name___cursor_se_name__type___cursor_se_name__subtype" ON "system" ("cursor_se_name", "_cursor_se_name__type", "_cursor_se_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__decision_se_name___decision_se_name__type___decision_se_name__subtype" ON "system" ("decision_se_name", "_decision_se_name__type", "_decision_se_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__cancel_se_name___cancel_se_name__type___cancel_se_name__subtype" ON "system" ("cancel_se_name", "_cancel_se_name__type", "_cancel_se_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__buzzer_se_name___buzzer_se_name__type___buzzer_se_name__subtype" ON "system" ("buzzer_se_name", "_buzzer_se_name__type", "_buzzer_se_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__equip_se_name___equip_se_name__type___equip_se_name__subtype" ON "system" ("equip_se_name", "_equip_se_name__type", "_equip_se_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__shop_se_name___shop_se_name__type___shop_se_name__subtype" ON "system" ("shop_se_name", "_shop_se_name__type", "_shop_se_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__save_se_name___save_se_name__type___save_se_name__subtype" ON "system" ("save_se_name", "_save_se_name__type", "_save_se_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__load_se_name___load_se_name__type___load_se_name__subtype" ON "system" ("load_se_name", "_load_se_name__type", "_load_se_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__battle_start_se_name___battle_start_se_name__type___battle_start_se_name__subtype" ON "system" ("battle_start_se_name", "_battle_start_se_name__type", "_battle_start_se_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__escape_se_name___escape_se_name__type___escape_se_name__subtype" ON "system" ("escape_se_name", "_escape_se_name__type", "_escape_se_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__actor_collapse_se_name___actor_collapse_se_name__type___actor_collapse_se_name__subtype" ON "system" ("actor_collapse_se_name", "_actor_collapse_se_name__type", "_actor_collapse_se_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__enemy_collapse_se_name___enemy_collapse_se_name__type___enemy_collapse_se_name__subtype" ON "system" ("enemy_collapse_se_name", "_enemy_collapse_se_name__type", "_enemy_collapse_se_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__start_map_id" ON "system" ("start_map_id");
+CREATE INDEX IF NOT EXISTS "system__test_troop_id" ON "system" ("test_troop_id");
+CREATE INDEX IF NOT EXISTS "system__battleback_name___battleback_name__type___battleback_name__subtype" ON "system" ("battleback_name", "_battleback_name__type", "_battleback_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__battler_name___battler_name__type___battler_name__subtype" ON "system" ("battler_name", "_battler_name__type", "_battler_name__subtype");
+CREATE INDEX IF NOT EXISTS "system__edit_map_id" ON "system" ("edit_map_id");
+CREATE INDEX IF NOT EXISTS "party_member__actor_id" ON "party_member" ("actor_id");
+CREATE INDEX IF NOT EXISTS "test_battler__actor_id" ON "test_battler" ("actor_id");
+CREATE INDEX IF NOT EXISTS "test_battler__weapon_id" ON "test_battler" ("weapon_id");
+CREATE INDEX IF NOT EXISTS "test_battler__armor1_id" ON "test_battler" ("armor1_id");
+CREATE INDEX IF NOT EXISTS "test_battler__armor2_id" ON "test_battler" ("armor2_id");
+CREATE INDEX IF NOT EXISTS "test_battler__armor3_id" ON "test_battler" ("armor3_id");
+CREATE INDEX IF NOT EXISTS "test_battler__armor4_id" ON "test_battler" ("armor4_id");
+CREATE INDEX IF NOT EXISTS "tileset__tileset_name___tileset_name__type___tileset_name__subtype" ON "tileset" ("tileset_name", "_tileset_name__type", "_tileset_name__subtype");
+CREATE INDEX IF NOT EXISTS "tileset__panorama_name___panorama_name__type___panorama_name__subtype" ON "tileset" ("panorama_name", "_panorama_name__type", "_panorama_name__subtype");
+CREATE INDEX IF NOT EXISTS "tileset__fog_name___fog_name__type___fog_name__subtype" ON "tileset" ("fog_name", "_fog_name__type", "_fog_name__subtype");
+CREATE INDEX IF NOT EXISTS "tileset__battleback_name___battleback_name__type___battleback_name__subtype" ON "tileset" ("battleback_name", "_battleback_name__type", "_battleback_name__subtype");
+CREATE INDEX IF NOT EXISTS "tileset_autotile__autotile_name___autotile_name__type___autotile_name__subtype" ON "tileset_autotile" ("autotile_name", "_autotile_name__type", "_autotile_name__subtype", "tileset_id", "index");
+CREATE INDEX IF NOT EXISTS "troop_member__enemy_id" ON "troop_member" ("enemy_id", "troop_id", "index");
+CREATE INDEX IF NOT EXISTS "troop_page__condition_actor_id" ON "troop_page" ("condition_actor_id", "troop_id", "index");
+CREATE INDEX IF NOT EXISTS "troop_page__condition_switch_id" ON "troop_page" ("condition_switch_id", "troop_id", "index");
+CREATE INDEX IF NOT EXISTS "troop_page__span" ON "troop_page" ("span", "troop_id", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_show_choices__cancel_type" ON "troop_page_command_show_choices" ("cancel_type", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_input_number__variable_id" ON "troop_page_command_input_number" ("variable_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_change_text_options__position" ON "troop_page_command_change_text_options" ("position", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_button_input_processing__variable_id" ON "troop_page_command_button_input_processing" ("variable_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_conditional_branch_switch__switch_id" ON "troop_page_command_conditional_branch_switch" ("switch_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_conditional_branch_switch__state" ON "troop_page_command_conditional_branch_switch" ("state", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_conditional_branch_variable__comparison" ON "troop_page_command_conditional_branch_variable" ("comparison", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_conditional_branch_self_switch__self_switch_ch" ON "troop_page_command_conditional_branch_self_switch" ("self_switch_ch", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_conditional_branch_self_switch__state" ON "troop_page_command_conditional_branch_self_switch" ("state", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_conditional_branch_timer__bound_type" ON "troop_page_command_conditional_branch_timer" ("bound_type", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_conditional_branch_actor_skill__skill_id" ON "troop_page_command_conditional_branch_actor_skill" ("skill_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_conditional_branch_actor_weapon__weapon_id" ON "troop_page_command_conditional_branch_actor_weapon" ("weapon_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_conditional_branch_actor_armor__armor_id" ON "troop_page_command_conditional_branch_actor_armor" ("armor_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_conditional_branch_actor_state__state_id" ON "troop_page_command_conditional_branch_actor_state" ("state_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_conditional_branch_actor__actor_id" ON "troop_page_command_conditional_branch_actor" ("actor_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_conditional_branch_enemy_state__state_id" ON "troop_page_command_conditional_branch_enemy_state" ("state_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_conditional_branch_enemy__enemy_id" ON "troop_page_command_conditional_branch_enemy" ("enemy_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_conditional_branch_character__direction" ON "troop_page_command_conditional_branch_character" ("direction", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_conditional_branch_gold__bound_type" ON "troop_page_command_conditional_branch_gold" ("bound_type", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_conditional_branch_item__item_id" ON "troop_page_command_conditional_branch_item" ("item_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_conditional_branch_weapon__weapon_id" ON "troop_page_command_conditional_branch_weapon" ("weapon_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_conditional_branch_armor__armor_id" ON "troop_page_command_conditional_branch_armor" ("armor_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_call_common_event__called_event_id" ON "troop_page_command_call_common_event" ("called_event_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_control_switches__state" ON "troop_page_command_control_switches" ("state", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_control_variables_variable__variable_id" ON "troop_page_command_control_variables_variable" ("variable_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_control_variables_other__other_operand_type" ON "troop_page_command_control_variables_other" ("other_operand_type", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_control_variables__assign_type" ON "troop_page_command_control_variables" ("assign_type", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_control_self_switch__self_switch_ch" ON "troop_page_command_control_self_switch" ("self_switch_ch", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_control_self_switch__state" ON "troop_page_command_control_self_switch" ("state", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_change_gold__diff_type" ON "troop_page_command_change_gold" ("diff_type", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_change_items__item_id" ON "troop_page_command_change_items" ("item_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_change_items__operation" ON "troop_page_command_change_items" ("operation", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_change_items__operand_type" ON "troop_page_command_change_items" ("operand_type", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_change_weapons__weapon_id" ON "troop_page_command_change_weapons" ("weapon_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_change_weapons__operation" ON "troop_page_command_change_weapons" ("operation", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_change_weapons__operand_type" ON "troop_page_command_change_weapons" ("operand_type", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_change_armor__armor_id" ON "troop_page_command_change_armor" ("armor_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_change_armor__operation" ON "troop_page_command_change_armor" ("operation", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_change_armor__operand_type" ON "troop_page_command_change_armor" ("operand_type", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_change_party_member__actor_id" ON "troop_page_command_change_party_member" ("actor_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_change_party_member__add_or_remove" ON "troop_page_command_change_party_member" ("add_or_remove", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_change_battle_bgm__audio_name___audio_name__type___audio_name__subtype" ON "troop_page_command_change_battle_bgm" ("audio_name", "_audio_name__type", "_audio_name__subtype", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_change_battle_end_me__audio_name___audio_name__type___audio_name__subtype" ON "troop_page_command_change_battle_end_me" ("audio_name", "_audio_name__type", "_audio_name__subtype", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_transfer_player__direction" ON "troop_page_command_transfer_player" ("direction", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_set_event_location__appoint_type" ON "troop_page_command_set_event_location" ("appoint_type", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_set_event_location__direction" ON "troop_page_command_set_event_location" ("direction", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_scroll_map__direction" ON "troop_page_command_scroll_map" ("direction", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_change_map_settings_panorama__name___name__type___name__subtype" ON "troop_page_command_change_map_settings_panorama" ("name", "_name__type", "_name__subtype", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_change_map_settings_fog__name___name__type___name__subtype" ON "troop_page_command_change_map_settings_fog" ("name", "_name__type", "_name__subtype", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_change_map_settings_battle_back__name___name__type___name__subtype" ON "troop_page_command_change_map_settings_battle_back" ("name", "_name__type", "_name__subtype", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_set_move_route_move_command_switch_on__switch_id" ON "troop_page_command_set_move_route_move_command_switch_on" ("switch_id", "troop_id", "troop_page_index", "troop_page_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_set_move_route_move_command_switch_off__switch_id" ON "troop_page_command_set_move_route_move_command_switch_off" ("switch_id", "troop_id", "troop_page_index", "troop_page_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_set_move_route_move_command_change_speed__speed" ON "troop_page_command_set_move_route_move_command_change_speed" ("speed", "troop_id", "troop_page_index", "troop_page_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_set_move_route_move_command_change_freq__freq" ON "troop_page_command_set_move_route_move_command_change_freq" ("freq", "troop_id", "troop_page_index", "troop_page_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_set_move_route_move_command_graphic__character_name___character_name__type___character_name__subtype" ON "troop_page_command_set_move_route_move_command_graphic" ("character_name", "_character_name__type", "_character_name__subtype", "troop_id", "troop_page_index", "troop_page_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_set_move_route_move_command_graphic__direction" ON "troop_page_command_set_move_route_move_command_graphic" ("direction", "troop_id", "troop_page_index", "troop_page_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_set_move_route_move_command_play_se__audio_name___audio_name__type___audio_name__subtype" ON "troop_page_command_set_move_route_move_command_play_se" ("audio_name", "_audio_name__type", "_audio_name__subtype", "troop_id", "troop_page_index", "troop_page_command_set_move_route_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_show_picture__name___name__type___name__subtype" ON "troop_page_command_show_picture" ("name", "_name__type", "_name__subtype", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_set_weather_effects__type" ON "troop_page_command_set_weather_effects" ("type", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_play_bgm__audio_name___audio_name__type___audio_name__subtype" ON "troop_page_command_play_bgm" ("audio_name", "_audio_name__type", "_audio_name__subtype", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_play_bgs__audio_name___audio_name__type___audio_name__subtype" ON "troop_page_command_play_bgs" ("audio_name", "_audio_name__type", "_audio_name__subtype", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_play_me__audio_name___audio_name__type___audio_name__subtype" ON "troop_page_command_play_me" ("audio_name", "_audio_name__type", "_audio_name__subtype", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_play_se__audio_name___audio_name__type___audio_name__subtype" ON "troop_page_command_play_se" ("audio_name", "_audio_name__type", "_audio_name__subtype", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_battle_processing__opponent_troop_id" ON "troop_page_command_battle_processing" ("opponent_troop_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_name_input_processing__actor_id" ON "troop_page_command_name_input_processing" ("actor_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_recover_all__actor_id" ON "troop_page_command_recover_all" ("actor_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_enemy_transform__new_enemy_id" ON "troop_page_command_enemy_transform" ("new_enemy_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_continue_set_move_route_switch_on__switch_id" ON "troop_page_command_continue_set_move_route_switch_on" ("switch_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_continue_set_move_route_switch_off__switch_id" ON "troop_page_command_continue_set_move_route_switch_off" ("switch_id", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_continue_set_move_route_change_speed__speed" ON "troop_page_command_continue_set_move_route_change_speed" ("speed", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_continue_set_move_route_change_freq__freq" ON "troop_page_command_continue_set_move_route_change_freq" ("freq", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_continue_set_move_route_graphic__character_name___character_name__type___character_name__subtype" ON "troop_page_command_continue_set_move_route_graphic" ("character_name", "_character_name__type", "_character_name__subtype", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_continue_set_move_route_graphic__direction" ON "troop_page_command_continue_set_move_route_graphic" ("direction", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "troop_page_command_continue_set_move_route_play_se__audio_name___audio_name__type___audio_name__subtype" ON "troop_page_command_continue_set_move_route_play_se" ("audio_name", "_audio_name__type", "_audio_name__subtype", "troop_id", "troop_page_index", "index");
+CREATE INDEX IF NOT EXISTS "weapon__icon_name___icon_name__type___icon_name__subtype" ON "weapon" ("icon_name", "_icon_name__type", "_icon_name__subtype");
+CREATE INDEX IF NOT EXISTS "weapon__animation1_id" ON "weapon" ("animation1_id");
+CREATE INDEX IF NOT EXISTS "weapon__animation2_id" ON "weapon" ("animation2_id");
+CREATE INDEX IF NOT EXISTS "weapon_element__element_id" ON "weapon_element" ("element_id", "weapon_id");
+CREATE INDEX IF NOT EXISTS "weapon_plus_state__state_id" ON "weapon_plus_state" ("state_id", "weapon_id");
+CREATE INDEX IF NOT EXISTS "weapon_minus_state__state_id" ON "weapon_minus_state" ("state_id", "weapon_id");
\ No newline at end of file
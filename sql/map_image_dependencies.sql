@@ -0,0 +1,15 @@
+SELECT
+    m.id, sha256(m.data) data, NULL source, NULL type, NULL subtype, NULL name
+FROM map m
+UNION ALL
+SELECT m.id, NULL, f.source, f.type, f.subtype, f.full_name
+FROM material_best_file f
+JOIN tileset t ON f.type = 'Graphics' AND f.subtype = 'Tilesets'
+    AND f.name = t.tileset_name
+JOIN map m ON t.id = m.tileset_id
+UNION ALL
+SELECT m.id, NULL, f.source, f.type, f.subtype, f.full_name
+FROM material_best_file f
+JOIN tileset_autotile a ON f.type = 'Graphics' AND f.subtype = 'Autotiles'
+    AND f.name = a.autotile_name
+JOIN map m ON a.tileset_id = m.tileset_id
\ No newline at end of file
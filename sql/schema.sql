@@ -16,6 +16,8 @@ CREATE TABLE "actor" (
     "_battler_name__subtype" TEXT NOT NULL GENERATED ALWAYS AS ('Battlers'),
     "battler_hue" INTEGER NOT NULL CHECK ("battler_hue" BETWEEN 0 AND 360),
     "parameters" BLOB NOT NULL,
+    "parameters_xsize" INTEGER NOT NULL,
+    "parameters_ysize" INTEGER NOT NULL CHECK (length("parameters") = 2 * "parameters_xsize" * "parameters_ysize"),
     "weapon_id" INTEGER REFERENCES "weapon" ("id"),
     "armor1_id" INTEGER REFERENCES "armor" ("id"),
     "armor2_id" INTEGER REFERENCES "armor" ("id"),
@@ -61,6 +63,8 @@ CREATE TABLE "animation_frame" (
     "index" INTEGER NOT NULL CHECK ("index" >= 0),
     "cell_max" INTEGER NOT NULL,
     "cell_data" BLOB NOT NULL,
+    "cell_data_xsize" INTEGER NOT NULL,
+    "cell_data_ysize" INTEGER NOT NULL CHECK (length("cell_data") = 2 * "cell_data_xsize" * "cell_data_ysize"),
     PRIMARY KEY ("animation_id", "index")
 ) STRICT;
 
@@ -161,7 +165,9 @@ CREATE TABLE "class" (
     "name" TEXT NOT NULL,
     "position" INTEGER NOT NULL REFERENCES "class_position" ("id"),
     "element_ranks" BLOB NOT NULL,
-    "state_ranks" BLOB NOT NULL
+    "element_ranks_xsize" INTEGER NOT NULL CHECK (length("element_ranks") = 2 * "element_ranks_xsize"),
+    "state_ranks" BLOB NOT NULL,
+    "state_ranks_xsize" INTEGER NOT NULL CHECK (length("state_ranks") = 2 * "state_ranks_xsize")
 ) STRICT;
 
 DROP TABLE IF EXISTS "class_position";
@@ -2304,7 +2310,9 @@ CREATE TABLE "enemy" (
     "animation1_id" INTEGER REFERENCES "animation" ("id"),
     "animation2_id" INTEGER REFERENCES "animation" ("id"),
     "element_ranks" BLOB NOT NULL,
+    "element_ranks_xsize" INTEGER NOT NULL CHECK (length("element_ranks") = 2 * "element_ranks_xsize"),
     "state_ranks" BLOB NOT NULL,
+    "state_ranks_xsize" INTEGER NOT NULL CHECK (length("state_ranks") = 2 * "state_ranks_xsize"),
     "exp" INTEGER NOT NULL,
     "gold" INTEGER NOT NULL,
     "item_id" INTEGER REFERENCES "item" ("id"),
@@ -5504,7 +5512,10 @@ CREATE TABLE "map" (
     "bgs_volume" INTEGER NOT NULL,
     "bgs_pitch" INTEGER NOT NULL,
     "encounter_step" INTEGER NOT NULL,
-    "data" BLOB NOT NULL
+    "data" BLOB NOT NULL,
+    "data_xsize" INTEGER NOT NULL,
+    "data_ysize" INTEGER NOT NULL,
+    "data_zsize" INTEGER NOT NULL CHECK (length("data") = 2 * "data_xsize" * "data_ysize" * "data_zsize")
 ) STRICT;
 
 DROP TABLE IF EXISTS "map_info";
@@ -5857,8 +5868,11 @@ CREATE TABLE "tileset" (
     "_battleback_name__type" TEXT NOT NULL GENERATED ALWAYS AS ('Graphics'),
     "_battleback_name__subtype" TEXT NOT NULL GENERATED ALWAYS AS ('Battlebacks'),
     "passages" BLOB NOT NULL,
+    "passages_xsize" INTEGER NOT NULL CHECK (length("passages") = 2 * "passages_xsize"),
     "priorities" BLOB NOT NULL,
+    "priorities_xsize" INTEGER NOT NULL CHECK (length("priorities") = 2 * "priorities_xsize"),
     "terrain_tags" BLOB NOT NULL,
+    "terrain_tags_xsize" INTEGER NOT NULL CHECK (length("terrain_tags") = 2 * "terrain_tags_xsize"),
     FOREIGN KEY ("tileset_name", "_tileset_name__type", "_tileset_name__subtype") REFERENCES "material" ("name", "type", "subtype"),
     FOREIGN KEY ("panorama_name", "_panorama_name__type", "_panorama_name__subtype") REFERENCES "material" ("name", "type", "subtype"),
     FOREIGN KEY ("fog_name", "_fog_name__type", "_fog_name__subtype") REFERENCES "material" ("name", "type", "subtype"),
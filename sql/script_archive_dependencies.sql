@@ -0,0 +1 @@
+SELECT digest FROM table_version WHERE name = 'script'
\ No newline at end of file
@@ -0,0 +1,209 @@
+DROP TABLE IF EXISTS search_index;
+
+-- kind: the kind of thing the row is about, which is also the name of its table
+--   (except for map, whose table is map_info)
+-- key: the primary key of the thing, as a JSON object
+-- label: a description of the thing, for displaying in the search results
+-- title: the thing's name
+-- content: the text of the thing (a script, or a message or set of choices in
+--   an event)
+CREATE VIRTUAL TABLE search_index USING fts5(
+    kind UNINDEXED, key UNINDEXED, label UNINDEXED, title, content,
+    tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+);
+
+-- matches in names count for much more than matches in text
+INSERT INTO search_index (search_index, rank)
+VALUES ('rank', 'bm25(0.0, 0.0, 0.0, 10.0, 1.0)');
+
+-- scripts
+
+INSERT INTO search_index (kind, key, label, title, content)
+SELECT 'script', json_object('name', name), 'Script', name, content
+FROM script;
+
+-- names
+
+INSERT INTO search_index (kind, key, label, title, content)
+SELECT
+    'actor', json_object('id', id), format('Actor %d', id), name, ''
+FROM actor
+UNION ALL SELECT
+    'armor', json_object('id', id), format('Armor %d', id), name, ''
+FROM armor
+UNION ALL SELECT
+    'class', json_object('id', id), format('Class %d', id), name, ''
+FROM class
+UNION ALL SELECT
+    'common_event', json_object('id', id), format('Common event %d', id),
+    name, ''
+FROM common_event
+UNION ALL SELECT
+    'enemy', json_object('id', id), format('Enemy %d', id), name, ''
+FROM enemy
+UNION ALL SELECT
+    'item', json_object('id', id), format('Item %d', id), name, ''
+FROM item
+UNION ALL SELECT
+    'map', json_object('id', id), format('Map %d', id), name, ''
+FROM map_info
+UNION ALL SELECT
+    'skill', json_object('id', id), format('Skill %d', id), name, ''
+FROM skill
+UNION ALL SELECT
+    'state', json_object('id', id), format('State %d', id), name, ''
+FROM state
+UNION ALL SELECT
+    'switch', json_object('id', id), format('Switch %d', id), name, ''
+FROM switch
+UNION ALL SELECT
+    'tileset', json_object('id', id), format('Tileset %d', id), name, ''
+FROM tileset
+UNION ALL SELECT
+    'troop', json_object('id', id), format('Troop %d', id), name, ''
+FROM troop
+UNION ALL SELECT
+    'variable', json_object('id', id), format('Variable %d', id), name, ''
+FROM variable
+UNION ALL SELECT
+    'weapon', json_object('id', id), format('Weapon %d', id), name, ''
+FROM weapon
+UNION ALL SELECT
+    'event', json_object('map_id', e.map_id, 'id', e.id),
+    format('Map %d (%s), event %d', m.id, m.name, e.id), e.name, ''
+FROM event e
+JOIN map_info m ON m.id = e.map_id;
+
+-- messages (each made up of a "show text" command and the "continue show
+-- text" commands following it)
+
+INSERT INTO search_index (kind, key, label, title, content)
+SELECT
+    'event',
+    json_object(
+        'map_id', t.map_id, 'id', t.event_id, 'page_index', t.event_page_index,
+        'index', min(t."index")
+    ),
+    format(
+        'Map %d (%s), event %d (%s), page %d',
+        m.id, m.name, e.id, e.name, t.event_page_index + 1
+    ),
+    '',
+    group_concat(t.text, char(10) ORDER BY t."index")
+FROM (
+    SELECT *, sum(is_start) OVER (
+        PARTITION BY map_id, event_id, event_page_index ORDER BY "index"
+    ) AS message
+    FROM (
+        SELECT map_id, event_id, event_page_index, "index", text, 1 AS is_start
+        FROM event_page_command_show_text
+        UNION ALL SELECT map_id, event_id, event_page_index, "index", text, 0
+        FROM event_page_command_continue_show_text
+    )
+) t
+JOIN event e ON e.map_id = t.map_id AND e.id = t.event_id
+JOIN map_info m ON m.id = t.map_id
+GROUP BY t.map_id, t.event_id, t.event_page_index, t.message;
+
+INSERT INTO search_index (kind, key, label, title, content)
+SELECT
+    'common_event',
+    json_object('id', t.common_event_id, 'index', min(t."index")),
+    format('Common event %d (%s)', c.id, c.name),
+    '',
+    group_concat(t.text, char(10) ORDER BY t."index")
+FROM (
+    SELECT *, sum(is_start) OVER (
+        PARTITION BY common_event_id ORDER BY "index"
+    ) AS message
+    FROM (
+        SELECT common_event_id, "index", text, 1 AS is_start
+        FROM common_event_command_show_text
+        UNION ALL SELECT common_event_id, "index", text, 0
+        FROM common_event_command_continue_show_text
+    )
+) t
+JOIN common_event c ON c.id = t.common_event_id
+GROUP BY t.common_event_id, t.message;
+
+INSERT INTO search_index (kind, key, label, title, content)
+SELECT
+    'troop',
+    json_object(
+        'id', t.troop_id, 'page_index', t.troop_page_index,
+        'index', min(t."index")
+    ),
+    format(
+        'Troop %d (%s), page %d', tr.id, tr.name, t.troop_page_index + 1
+    ),
+    '',
+    group_concat(t.text, char(10) ORDER BY t."index")
+FROM (
+    SELECT *, sum(is_start) OVER (
+        PARTITION BY troop_id, troop_page_index ORDER BY "index"
+    ) AS message
+    FROM (
+        SELECT troop_id, troop_page_index, "index", text, 1 AS is_start
+        FROM troop_page_command_show_text
+        UNION ALL SELECT troop_id, troop_page_index, "index", text, 0
+        FROM troop_page_command_continue_show_text
+    )
+) t
+JOIN troop tr ON tr.id = t.troop_id
+GROUP BY t.troop_id, t.troop_page_index, t.message;
+
+-- choices (one row for each "show choices" command)
+
+INSERT INTO search_index (kind, key, label, title, content)
+SELECT
+    'event',
+    json_object(
+        'map_id', c.map_id, 'id', c.event_id, 'page_index', c.event_page_index,
+        'index', c.event_page_command_show_choices_index
+    ),
+    format(
+        'Map %d (%s), event %d (%s), page %d',
+        m.id, m.name, e.id, e.name, c.event_page_index + 1
+    ),
+    '',
+    group_concat(c.choice, char(10) ORDER BY c."index")
+FROM event_page_command_show_choices_choice c
+JOIN event e ON e.map_id = c.map_id AND e.id = c.event_id
+JOIN map_info m ON m.id = c.map_id
+GROUP BY
+    c.map_id, c.event_id, c.event_page_index,
+    c.event_page_command_show_choices_index;
+
+INSERT INTO search_index (kind, key, label, title, content)
+SELECT
+    'common_event',
+    json_object(
+        'id', c.common_event_id,
+        'index', c.common_event_command_show_choices_index
+    ),
+    format('Common event %d (%s)', ce.id, ce.name),
+    '',
+    group_concat(c.choice, char(10) ORDER BY c."index")
+FROM common_event_command_show_choices_choice c
+JOIN common_event ce ON ce.id = c.common_event_id
+GROUP BY c.common_event_id, c.common_event_command_show_choices_index;
+
+INSERT INTO search_index (kind, key, label, title, content)
+SELECT
+    'troop',
+    json_object(
+        'id', c.troop_id, 'page_index', c.troop_page_index,
+        'index', c.troop_page_command_show_choices_index
+    ),
+    format(
+        'Troop %d (%s), page %d', tr.id, tr.name, c.troop_page_index + 1
+    ),
+    '',
+    group_concat(c.choice, char(10) ORDER BY c."index")
+FROM troop_page_command_show_choices_choice c
+JOIN troop tr ON tr.id = c.troop_id
+GROUP BY
+    c.troop_id, c.troop_page_index, c.troop_page_command_show_choices_index;
+
+-- merge the b-trees built up by the inserts, for quicker queries
+INSERT INTO search_index (search_index) VALUES ('optimize');
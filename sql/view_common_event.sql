@@ -11,4 +11,4 @@ select
 from common_event e
 join common_event_trigger t on t.id = e.trigger
 left join switch s on t.name in ('AUTORUN', 'PARALLEL') and s.id = e.switch_id
-where e.id = :id
\ No newline at end of file
+order by e.id
\ No newline at end of file
@@ -1,6 +1,6 @@
-SELECT 
-    'id', e.id,
-    'name', e.name,
+SELECT
+    e.id,
+    e.name,
     JSON_OBJECT(
         'file_stem', e.battler_name,        
         'filename', m.full_name,
@@ -93,4 +93,4 @@ LEFT JOIN material_best_file m ON m.type = 'Graphics' AND m.subtype = 'Battlers'
     AND m.name = e.battler_name
 LEFT JOIN animation a1 ON a1.id = e.animation1_id
 LEFT JOIN animation a2 ON a2.id = e.animation2_id
-WHERE e.id = :id
\ No newline at end of file
+ORDER BY e.id
\ No newline at end of file
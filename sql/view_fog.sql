@@ -1,7 +1,9 @@
 SELECT
+    id,
     fog_source source,
     'Graphics' type,
     'Fogs' subtype,
     fog_filename name,
     fog_hue hue
-FROM tileset_v WHERE id = :id
\ No newline at end of file
+FROM tileset_v WHERE fog_filename IS NOT NULL
+ORDER BY id
\ No newline at end of file
@@ -1,4 +1,3 @@
-SELECT f.source, f.type, f.subtype, f.full_name as name
-FROM material_best_file f WHERE f.type = 'Graphics'
-AND f.subtype = upper(substr(:subtype, 1, 1)) || substr(:subtype, 2)
-AND f.full_name = :name
\ No newline at end of file
+-- the subtype is lowercased in URLs
+SELECT f.source, f.type, lower(f.subtype) subtype, f.full_name as name
+FROM material_best_file f WHERE f.type = 'Graphics'
\ No newline at end of file
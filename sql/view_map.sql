@@ -58,4 +58,4 @@ from map m
 join map_info mi on mi.id = m.id
 left join map_info parent on parent.id = mi.parent_id
 join tileset on tileset.id = m.tileset_id
-where m.id = :id
+order by m.id
\ No newline at end of file
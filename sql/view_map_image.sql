@@ -1 +0,0 @@
-select cast(:id as integer) as id
\ No newline at end of file
@@ -1,7 +1,9 @@
 SELECT
+    id,
     panorama_source source,
     'Graphics' type,
     'Panoramas' subtype,
     panorama_filename name,
     panorama_hue hue
-FROM tileset_v WHERE id = :id
\ No newline at end of file
+FROM tileset_v WHERE panorama_filename IS NOT NULL
+ORDER BY id
\ No newline at end of file
@@ -1 +1 @@
-SELECT s.content FROM script s WHERE s.name = :name
\ No newline at end of file
+SELECT s.name, s.content FROM script s ORDER BY s.id
\ No newline at end of file
@@ -0,0 +1,20 @@
+SELECT :q AS q, (
+    SELECT json_group_array(json_object(
+        'kind', r.kind,
+        'key', json(r.key),
+        'label', r.label,
+        'title', r.title,
+        'snippet', r.snippet
+    )) FROM (
+        -- the highlighted terms are delimited by the STX and ETX characters,
+        -- so that they can be told apart from text which looks like HTML
+        SELECT
+            kind, key, label,
+            highlight(search_index, 3, char(2), char(3)) AS title,
+            snippet(search_index, 4, char(2), char(3), '…', 24) AS snippet
+        FROM search_index
+        WHERE search_index MATCH fts_query(:q)
+        ORDER BY rank
+        LIMIT 100
+    ) r
+) AS results
@@ -1,13 +1,14 @@
-select json_object(
+select s.id, json_object(
 	'id', s.id,
 	'name', s.name,
 	'common_events', (
 		select json_group_array(json_object(
 			'id', e.id,
 			'name', e.name
-		)) from common_event e
-		join common_event_trigger t on t.id = e.trigger
-		where t.name in ('AUTORUN', 'PARALLEL') and e.switch_id = s.id
+		)) from xref x
+		join common_event e on e.id = json_extract(x.source_key, '$.id')
+		where x.kind = 'switch' and x.target_id = s.id
+		and x.source_table = 'common_event'
 	),
 	'event_pages', (
 		select json_group_array(json_object(
@@ -19,13 +20,55 @@ select json_object(
 				'id', e.id,
 				'name', e.name
 			),
-			'number', p."index" + 1
-		)) from event_page p
-		join event e on e.map_id = p.map_id and e.id = p.event_id
+			'number', json_extract(x.source_key, '$.index') + 1
+		)) from (
+			-- a page can use the same switch for both of its switch conditions
+			select distinct x.source_key from xref x
+			where x.kind = 'switch' and x.target_id = s.id
+			and x.source_table = 'event_page'
+		) x
+		join event e on e.map_id = json_extract(x.source_key, '$.map_id')
+			and e.id = json_extract(x.source_key, '$.event_id')
 		join map_info m on m.id = e.map_id
-		where (p.condition_switch1_valid and p.condition_switch1_id = s.id)
-		or (p.condition_switch2_valid and p.condition_switch2_id = s.id)
+	),
+	'commands', (
+		select json_group_array(json_object(
+			'kind', x.source_kind,
+			'command', substr(
+				x.source_table, instr(x.source_table, 'command_') + 8
+			),
+			'map', json_object(
+				'id', m.id,
+				'name', m.name
+			),
+			'event', json_object(
+				'id', e.id,
+				'name', e.name
+			),
+			'common_event', json_object(
+				'id', c.id,
+				'name', c.name
+			),
+			'troop', json_object(
+				'id', t.id,
+				'name', t.name
+			),
+			'page_number', coalesce(
+				json_extract(x.source_key, '$.event_page_index'),
+				json_extract(x.source_key, '$.troop_page_index')
+			) + 1
+		)) from xref x
+		left join event e on x.source_kind = 'event_page'
+			and e.map_id = json_extract(x.source_key, '$.map_id')
+			and e.id = json_extract(x.source_key, '$.event_id')
+		left join map_info m on m.id = e.map_id
+		left join common_event c on x.source_kind = 'common_event'
+			and c.id = json_extract(x.source_key, '$.common_event_id')
+		left join troop t on x.source_kind = 'troop_page'
+			and t.id = json_extract(x.source_key, '$.troop_id')
+		where x.kind = 'switch' and x.target_id = s.id
+		and x.source_table != x.source_kind
 	)
 ) as switch
 from switch s
-where s.id = :id
\ No newline at end of file
+order by s.id
\ No newline at end of file
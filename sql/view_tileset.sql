@@ -48,4 +48,5 @@ SELECT
 			ORDER BY mi."order", m.id
 		) m
 	) maps
-FROM tileset_v t WHERE t.id = :id
+FROM tileset_v t
+ORDER BY t.id
\ No newline at end of file
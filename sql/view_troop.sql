@@ -28,4 +28,5 @@ SELECT
             ORDER BY m."order", m.id
         ) m
     ) maps
-FROM troop t WHERE t.id = :id
\ No newline at end of file
+FROM troop t
+ORDER BY t.id
\ No newline at end of file
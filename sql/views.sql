@@ -1,4 +1,5 @@
 DROP VIEW IF EXISTS tileset_v;
+-- materialize: index (id)
 CREATE VIEW tileset_v (
 	id, name,
 	file_source, filename, file_stem, 
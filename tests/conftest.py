@@ -1,6 +1,35 @@
-from pytest import register_assert_rewrite
+from collections.abc import Iterator
+from pathlib import Path
+from pytest import fixture, MonkeyPatch, register_assert_rewrite
 from _pytest.fixtures import Parser
 import golden
+import rpgxp
 
 def pytest_addoption(parser: Parser):
 	golden.add_options(parser)
+
+def _clear_settings_cache() -> None:
+	rpgxp._settings_path.cache_clear()
+	rpgxp._settings_dict.cache_clear()
+
+@fixture
+def tmp_settings(
+	tmp_path: Path, monkeypatch: MonkeyPatch
+) -> Iterator[rpgxp._Settings]:
+	"""Point the settings at a game, RTP, database and site under the
+	temporary directory (none of which exist to begin with)."""
+
+	settings_path = tmp_path / 'settings.ini'
+
+	settings_path.write_text('\n'.join([
+		'game_name = Test',
+		f'game_root = {tmp_path / "game"}',
+		f'rtp_root = {tmp_path / "rtp"}',
+		f'db_root = {tmp_path / "db"}',
+		f'site_root = {tmp_path / "site"}',
+	]))
+
+	monkeypatch.setenv('RPGXP_SETTINGS', str(settings_path))
+	_clear_settings_cache()
+	yield rpgxp.settings
+	_clear_settings_cache()
@@ -0,0 +1,82 @@
+import json
+import apsw
+from rpgxp.db import (
+	FlatTreeAgg, foreign_key_report_json, fts_query, TreeAgg
+)
+
+ROWS: list[tuple[apsw.SQLiteValue, ...]] = [
+	(1, 112, '"Department Store 5F"'),
+	(2, 112, '"Department Store 6F"'),
+	(24, None, '"Reborn"'),
+	(28, 24, '"Reborn City"'),
+	(36, 28, '"Obsidia Ward"'),
+	(51, None, '{"id": 51, "name": "Intro"}'),
+	(112, 36, '"Department Store"'),
+	(667, 689, '"Intro Train"'),
+	(689, 51, '"Tourmaline Desert"'),
+	(700, 999, '"Orphan"'),
+]
+
+def aggregate(agg: TreeAgg | FlatTreeAgg) -> object:
+	for row in ROWS:
+		agg.step(*row)
+
+	return json.loads(agg.final())
+
+def test_flat_tree_agg() -> None:
+	assert aggregate(FlatTreeAgg()) == aggregate(TreeAgg())
+
+def test_flat_tree_agg_empty() -> None:
+	assert FlatTreeAgg().final() == TreeAgg().final() == '[]'
+
+def test_fts_query() -> None:
+	assert fts_query('pokemon cent') == '"pokemon" "cent"*'
+	assert fts_query('') == fts_query('  ?! ') == fts_query(None) == '""'
+
+def test_fts_query_ignores_fts_syntax() -> None:
+	assert fts_query('a AND b OR NOT c') == '"a" "AND" "b" "OR" "NOT" "c"*'
+	assert fts_query('"quoted" -minus ^caret col:x* NEAR(y)') == (
+		'"quoted" "minus" "caret" "col" "x" "NEAR" "y"*'
+	)
+
+def test_fts_query_matches() -> None:
+	connection = apsw.Connection(':memory:')
+	connection.create_scalar_function('fts_query', fts_query, numargs=1)
+	connection.execute('CREATE VIRTUAL TABLE doc USING fts5(text)')
+
+	connection.executemany('INSERT INTO doc VALUES (?)', [
+		('Welcome to the Pokemon Center',),
+		('NOT a center',),
+		('"Quoted" (text)',),
+	])
+
+	def search(text: str) -> list[str]:
+		return [text for text, in connection.execute(
+			'SELECT text FROM doc WHERE doc MATCH fts_query(?) ORDER BY rowid',
+			(text,)
+		)]
+
+	assert search('center') == [
+		'Welcome to the Pokemon Center', 'NOT a center'
+	]
+
+	assert search('pokemon cent') == ['Welcome to the Pokemon Center']
+	assert search('NOT center') == ['NOT a center']
+	assert search('"quoted') == ['"Quoted" (text)']
+	assert search('(') == []
+
+def test_foreign_key_report_json_blobs() -> None:
+	connection = apsw.Connection(':memory:')
+
+	connection.execute('''
+		CREATE TABLE parent (key BLOB PRIMARY KEY);
+		CREATE TABLE child (
+			id BLOB PRIMARY KEY, key BLOB REFERENCES parent (key)
+		);
+
+		INSERT INTO child VALUES (x'01ff', x'abcd');
+	''')
+
+	[violation] = json.loads(foreign_key_report_json(connection))
+	assert violation['pk_values'] == ['01ff']
+	assert violation['fk_values'] == ['abcd']
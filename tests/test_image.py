@@ -0,0 +1,25 @@
+import numpy as np
+from PIL import Image as image
+from rpgxp.image import adjust_hue
+
+def random_image() -> image.Image:
+	rng = np.random.default_rng(0)
+	pixels = rng.integers(0, 256, (64, 64, 4), dtype=np.uint8)
+	return image.fromarray(pixels, 'RGBA')
+
+def test_adjust_hue_rotates_pillow_hue() -> None:
+	img = random_image()
+
+	for hue in (60, 120, 180, 240, 300, 500):
+		hsv = np.array(img.convert('HSV'))
+		shift = int(((hue / 360) * 256) % 256)
+		hsv[:, :, 0] = (hsv[:, :, 0].astype(int) + shift) % 256
+		expected = image.fromarray(hsv, 'HSV').convert('RGBA')
+		expected.putalpha(img.getchannel('A'))
+		assert adjust_hue(img, hue).tobytes() == expected.tobytes()
+
+def test_adjust_hue_zero_is_unchanged() -> None:
+	img = random_image()
+
+	for hue in (0, 360):
+		assert adjust_hue(img, hue).tobytes() == img.tobytes()
@@ -0,0 +1,86 @@
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+from typing import Any
+import numpy as np
+import pytest
+from rpgxp.bench.synthetic import Scale, write_game
+
+pytest.importorskip('ruby_marshal_parser')
+
+from rpgxp import parse
+from rpgxp.lazy import (
+	lazy_filename, LazyDict, LazyList, LazyObject, lookup
+)
+
+SCALE = Scale(
+	maps=2, map_width=8, map_height=6, events=2, pages=2, commands=5,
+	records=5, items=2
+)
+
+@pytest.fixture(scope='module')
+def data_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+	game_root = tmp_path_factory.mktemp('game')
+	write_game(game_root, SCALE)
+	return game_root / 'Data'
+
+def assert_same(lazy_value: Any, parsed_value: Any) -> None:
+	match lazy_value:
+		case LazyObject():
+			assert is_dataclass(parsed_value)
+
+			# dir() sorts the names
+			assert dir(lazy_value) == sorted(
+				field.name for field in fields(parsed_value)
+			)
+
+			for name in dir(lazy_value):
+				assert_same(
+					getattr(lazy_value, name), getattr(parsed_value, name)
+				)
+		case LazyList():
+			assert len(lazy_value) == len(parsed_value)
+
+			for lazy_item, parsed_item in zip(lazy_value, parsed_value):
+				assert_same(lazy_item, parsed_item)
+		case LazyDict():
+			assert list(lazy_value) == list(parsed_value)
+
+			for key, parsed_item in parsed_value.items():
+				assert_same(lazy_value[key], parsed_item)
+		case np.ndarray():
+			assert np.array_equal(lazy_value, parsed_value)
+		case _:
+			assert lazy_value == parsed_value
+
+def test_lazy_matches_parse(data_root: Path) -> None:
+	filenames = sorted(path.name for path in data_root.iterdir())
+	assert 'Map001.rxdata' in filenames
+
+	for filename in filenames:
+		assert_same(
+			lazy_filename(filename, data_root),
+			parse.parse_filename(filename, data_root, use_cache=False)
+		)
+
+def test_lookup(data_root: Path) -> None:
+	actors = lazy_filename('Actors.rxdata', data_root)
+	parsed_actors = parse.parse_filename(
+		'Actors.rxdata', data_root, use_cache=False
+	)
+
+	assert isinstance(actors, LazyList)
+	assert lookup(actors, ['0', 'name']) == parsed_actors[0].name
+
+	map_infos = lazy_filename('MapInfos.rxdata', data_root)
+	assert isinstance(map_infos, LazyDict)
+	assert lookup(map_infos, ['2', 'name']) == (
+		parse.parse_filename(
+			'MapInfos.rxdata', data_root, use_cache=False
+		)[2].name
+	)
+
+	with pytest.raises(TypeError, match='list index'):
+		lookup(actors, ['name'])
+
+	with pytest.raises(TypeError, match='attribute name'):
+		lookup(actors, ['1', '0'])
@@ -0,0 +1,132 @@
+from pathlib import Path
+from typing import Any
+import jinja2
+import pytest
+import rpgxp
+from rpgxp import settings
+from rpgxp.encode import ImagePolicy
+from rpgxp.site import binary, generate
+from rpgxp.site.manifest import page_digest, renderer_digest
+
+TEMPLATES = {
+	'base.j2': '<title>{% block title %}{% endblock %}</title>',
+	'map.j2': (
+		'{% extends "base.j2" %}{% block title %}{{ name }}{% endblock %}'
+	),
+}
+
+def env(templates: dict[str, str]=TEMPLATES) -> jinja2.Environment:
+	return jinja2.Environment(loader=jinja2.DictLoader(templates))
+
+ARGS: dict[str, Any] = {'name': 'Intro', 'tileset': None}
+DEPENDENCIES: list[dict[str, Any]] = [{'id': 1, 'data': b'\x00\x01'}]
+
+def test_digest_is_stable() -> None:
+	assert page_digest(env(), 'map.j2', ARGS, DEPENDENCIES) == page_digest(
+		env(), 'map.j2', dict(ARGS), [dict(row) for row in DEPENDENCIES]
+	)
+
+def test_digest_changes_with_template() -> None:
+	digest = page_digest(env(), 'map.j2', ARGS, DEPENDENCIES)
+
+	# a change to a template which the page's template extends counts too
+	changed_env = env({
+		**TEMPLATES, 'base.j2': '<h1>{% block title %}{% endblock %}</h1>'
+	})
+
+	assert page_digest(changed_env, 'map.j2', ARGS, DEPENDENCIES) != digest
+
+def test_digest_changes_with_arguments() -> None:
+	digest = page_digest(env(), 'map.j2', ARGS, DEPENDENCIES)
+
+	assert page_digest(
+		env(), 'map.j2', {**ARGS, 'name': 'Reborn'}, DEPENDENCIES
+	) != digest
+
+def test_digest_changes_with_dependencies() -> None:
+	digest = page_digest(env(), 'map.j2', ARGS, DEPENDENCIES)
+
+	changed_dependencies: list[list[dict[str, Any]]] = [
+		[{'id': 1, 'data': b'\x00\x02'}],
+		[{'id': 2, 'data': b'\x00\x01'}],
+		[*DEPENDENCIES, {'id': 2, 'data': None}],
+		[],
+	]
+
+	for dependencies in changed_dependencies:
+		assert page_digest(env(), 'map.j2', ARGS, dependencies) != digest
+
+@pytest.mark.usefixtures('tmp_settings')
+def test_digest_changes_with_material_file() -> None:
+	material_path = settings.game_root / 'Graphics/Tilesets/Town.png'
+	material_path.parent.mkdir(parents=True)
+	material_path.write_bytes(b'version 1')
+
+	args = {**ARGS, 'tileset': {
+		'source': 'game', 'type': 'graphics', 'subtype': 'tilesets',
+		'name': 'Town.png',
+	}}
+
+	digest = page_digest(env(), 'map.j2', args, DEPENDENCIES)
+	assert page_digest(env(), 'map.j2', args, DEPENDENCIES) == digest
+	material_path.write_bytes(b'version 2, which is longer')
+	assert page_digest(env(), 'map.j2', args, DEPENDENCIES) != digest
+
+def make_pages(urls: list[str]) -> list[Path]:
+	paths = [settings.site_root / url for url in urls]
+
+	for path in paths:
+		path.parent.mkdir(parents=True, exist_ok=True)
+		path.write_text(path.name)
+
+	return paths
+
+@pytest.mark.usefixtures('tmp_settings')
+def test_delete_stale_pages() -> None:
+	kept, stale = make_pages(['map/1.html', 'map/2.html'])
+
+	previous_manifest = {
+		'map/1.html': 'a', 'map/2.html': 'b', 'map/3.html': 'c'
+	}
+
+	deleted = generate.delete_stale_pages(
+		previous_manifest, {'map/1.html': 'a', 'map/4.html': 'd'}
+	)
+
+	# map/3.html was in the manifest but had already gone
+	assert deleted == 1
+	assert kept.exists()
+	assert not stale.exists()
+
+def render() -> bytes:
+	return b''
+
+def test_renderer_digest_changes_with_sources(
+	tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+	helper_path = tmp_path / 'helper' / 'module.py'
+	helper_path.parent.mkdir()
+	helper_path.write_text('x = 1')
+	monkeypatch.setattr(rpgxp, '_package_root', lambda: tmp_path)
+	monkeypatch.setitem(binary.RENDERER_SOURCES, render, ('helper',))
+	renderer_digest.cache_clear()
+	digest = renderer_digest(render)
+
+	helper_path.write_text('x = 2')
+	renderer_digest.cache_clear()
+	assert renderer_digest(render) != digest
+
+	helper_path.write_text('x = 1')
+	renderer_digest.cache_clear()
+	assert renderer_digest(render) == digest
+	renderer_digest.cache_clear()
+
+def test_binary_digest_changes_with_image_policy(
+	monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+	monkeypatch.setattr(binary, 'image_policy', ImagePolicy.DEV)
+	digest = page_digest(env(), render, ARGS, DEPENDENCIES)
+	monkeypatch.setattr(binary, 'image_policy', ImagePolicy.PUBLISH)
+	assert page_digest(env(), render, ARGS, DEPENDENCIES) != digest
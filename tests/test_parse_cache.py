@@ -0,0 +1,185 @@
+from collections.abc import Iterator
+import hashlib
+from pathlib import Path
+import shutil
+from typing import Any
+import numpy as np
+import pytest
+import rpgxp
+from rpgxp import parse_cache
+from rpgxp.parse_cache import cached, dump, Entry, HEADER, load
+
+FILE_DIGEST = bytes(range(32))
+
+def content() -> dict[str, Any]:
+	return {
+		'name': 'Intro',
+		'ids': [1, None, 3],
+		'data': np.arange(24, dtype='<i2').reshape((2, 3, 4), order='F'),
+	}
+
+def test_round_trip() -> None:
+	data = b''.join(dump(Entry(
+		FILE_DIGEST, parse_cache.schema_digest(), content()
+	)))
+
+	entry = load(data, FILE_DIGEST)
+	assert entry is not None
+	assert entry.file_digest == FILE_DIGEST
+	assert entry.content['name'] == 'Intro'
+	assert entry.content['ids'] == [1, None, 3]
+	assert np.array_equal(entry.content['data'], content()['data'])
+	assert entry.content['data'].flags.f_contiguous
+
+def test_arrays_are_out_of_band() -> None:
+	array = content()['data']
+	parts = dump(Entry(FILE_DIGEST, parse_cache.schema_digest(), array))
+	data = b''.join(parts)
+	_, _, _, buffer_count, _ = HEADER.unpack_from(data)
+	assert buffer_count == 1
+
+	# the array's bytes come after the pickle, rather than inside it
+	assert data.endswith(array.tobytes(order='A'))
+
+	entry = load(data, FILE_DIGEST)
+	assert entry is not None
+	assert np.shares_memory(entry.content, np.frombuffer(data, np.uint8))
+
+def test_load_rejects_other_entries() -> None:
+	data = b''.join(dump(Entry(
+		FILE_DIGEST, parse_cache.schema_digest(), content()
+	)))
+
+	assert load(data, bytes(32)) is None
+	assert load(b'RPGXPPC0' + data[8:], FILE_DIGEST) is None
+	assert load(data[:HEADER.size - 1], FILE_DIGEST) is None
+
+	other_schema = b''.join(dump(Entry(FILE_DIGEST, bytes(32), content())))
+	assert load(other_schema, FILE_DIGEST) is None
+
+@pytest.fixture
+def package_root(
+	tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[Path]:
+	"""Copy the schema sources into a temporary package root, so that they can
+	be changed."""
+
+	package_root = tmp_path / 'package'
+
+	for source in parse_cache.SCHEMA_SOURCES:
+		path = package_root / source
+		path.parent.mkdir(parents=True, exist_ok=True)
+		shutil.copyfile(rpgxp.settings.package_root / source, path)
+
+	monkeypatch.setattr(rpgxp, '_package_root', lambda: package_root)
+	parse_cache.schema_digest.cache_clear()
+	yield package_root
+	parse_cache.schema_digest.cache_clear()
+
+@pytest.mark.usefixtures('tmp_settings')
+def test_cached(tmp_path: Path, package_root: Path) -> None:
+	data_path = tmp_path / 'Actors.rxdata'
+	data_path.write_bytes(b'version 1')
+	parsed: list[bytes] = []
+
+	def parse_path(path: Path) -> dict[str, Any]:
+		parsed.append(path.read_bytes())
+		return content()
+
+	first = cached(data_path, parse_path)
+	second = cached(data_path, parse_path)
+	assert parsed == [b'version 1']
+	assert np.array_equal(first['data'], second['data'])
+
+	data_path.write_bytes(b'version 2')
+	cached(data_path, parse_path)
+	cached(data_path, parse_path)
+	assert parsed == [b'version 1', b'version 2']
+
+	for source in parse_cache.SCHEMA_SOURCES:
+		with (package_root / source).open('a') as f:
+			f.write('\n# changed\n')
+
+		parse_cache.schema_digest.cache_clear()
+		cached(data_path, parse_path)
+		cached(data_path, parse_path)
+
+	assert len(parsed) == 2 + len(parse_cache.SCHEMA_SOURCES)
+
+@pytest.mark.usefixtures('tmp_settings')
+def test_cached_ignores_corrupt_entries(tmp_path: Path) -> None:
+	data_path = tmp_path / 'Actors.rxdata'
+	data_path.write_bytes(b'version 1')
+	cached(data_path, lambda path: content())
+
+	entry_path = parse_cache.entry_path(
+		data_path, hashlib.sha256(b'version 1').digest()
+	)
+
+	entry_path.write_bytes(entry_path.read_bytes()[:-10])
+	assert cached(data_path, lambda path: 'reparsed') == 'reparsed'
+	assert cached(data_path, lambda path: 'not used') == 'reparsed'
+
+@pytest.mark.usefixtures('tmp_settings')
+def test_cached_keeps_files_with_the_same_name_apart(tmp_path: Path) -> None:
+	paths = [tmp_path / game / 'Actors.rxdata' for game in ('a', 'b')]
+	parsed: list[Path] = []
+
+	def parse_path(path: Path) -> str:
+		parsed.append(path)
+		return path.parent.name
+
+	for path in paths:
+		path.parent.mkdir()
+		path.write_bytes(path.parent.name.encode('utf-8'))
+
+	for _ in range(2):
+		assert [cached(path, parse_path) for path in paths] == ['a', 'b']
+
+	assert parsed == paths
+
+@pytest.mark.usefixtures('tmp_settings')
+def test_cached_prunes_stale_entries(tmp_path: Path) -> None:
+	actors_path = tmp_path / 'Actors.rxdata'
+	items_path = tmp_path / 'Items.rxdata'
+	items_path.write_bytes(b'items')
+	cached(items_path, lambda path: 'items')
+
+	for version in range(3):
+		actors_path.write_bytes(b'version %d' % version)
+		cached(actors_path, lambda path: version)
+
+	assert sorted(parse_cache.cache_root().iterdir()) == sorted([
+		parse_cache.entry_path(items_path, hashlib.sha256(b'items').digest()),
+		parse_cache.entry_path(
+			actors_path, hashlib.sha256(b'version 2').digest()
+		),
+	])
+
+@pytest.mark.usefixtures('package_root')
+def test_schema_digest_covers_modules(
+	tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+	module_root = tmp_path / 'modules'
+	module_root.mkdir()
+	monkeypatch.syspath_prepend(module_root)
+	monkeypatch.setattr(parse_cache, 'SCHEMA_MODULES', ('fake_parser',))
+	module_path = module_root / 'fake_parser.py'
+	module_path.write_text('VERSION = 1\n')
+	digest = parse_cache.schema_digest()
+	module_path.write_text('VERSION = 2\n')
+	parse_cache.schema_digest.cache_clear()
+	assert parse_cache.schema_digest() != digest
+	digest = parse_cache.schema_digest()
+
+	# a package is covered by every file in it
+	module_path.unlink()
+	(module_root / 'fake_parser').mkdir()
+	(module_root / 'fake_parser' / '__init__.py').write_text('VERSION = 2\n')
+	parse_cache.schema_digest.cache_clear()
+	assert parse_cache.schema_digest() != digest
+	digest = parse_cache.schema_digest()
+	(module_root / 'fake_parser' / 'nodes.py').write_text('')
+	parse_cache.schema_digest.cache_clear()
+	assert parse_cache.schema_digest() != digest
@@ -0,0 +1,106 @@
+import os
+from pathlib import Path
+import pytest
+from rpgxp import publish
+from rpgxp.publish import (
+	publish_file, publish_files, PublishAction, PublishMode
+)
+
+def make_source(tmp_path: Path, content: bytes=b'source') -> Path:
+	src_path = tmp_path / 'src' / 'file.png'
+	src_path.parent.mkdir(exist_ok=True)
+	src_path.write_bytes(content)
+	return src_path
+
+def test_publish_copy(tmp_path: Path) -> None:
+	src_path = make_source(tmp_path)
+	dst_path = tmp_path / 'dst' / 'file.png'
+
+	assert publish_file(src_path, dst_path, PublishMode.COPY) == (
+		PublishAction.COPIED, 6
+	)
+
+	assert dst_path.read_bytes() == b'source'
+	assert not dst_path.samefile(src_path)
+	assert dst_path.stat().st_mtime_ns == src_path.stat().st_mtime_ns
+
+def test_publish_skips_unchanged(tmp_path: Path) -> None:
+	src_path = make_source(tmp_path)
+	dst_path = tmp_path / 'dst' / 'file.png'
+	publish_file(src_path, dst_path, PublishMode.COPY)
+
+	for mode in PublishMode:
+		action, _ = publish_file(src_path, dst_path, mode)
+		assert action == PublishAction.SKIPPED
+
+	# a change in the modification time alone is enough to republish
+	os.utime(src_path, ns=(0, 0))
+	action, _ = publish_file(src_path, dst_path, PublishMode.COPY)
+	assert action == PublishAction.COPIED
+
+def test_publish_link(tmp_path: Path) -> None:
+	src_path = make_source(tmp_path)
+	dst_path = tmp_path / 'dst' / 'file.png'
+	action, _ = publish_file(src_path, dst_path, PublishMode.LINK)
+	assert action == PublishAction.LINKED
+	assert dst_path.samefile(src_path)
+
+def test_publish_link_falls_back_to_copy(
+	tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+	def fail(*args: object) -> None:
+		raise OSError('links not supported')
+
+	monkeypatch.setattr(publish.os, 'link', fail)
+	src_path = make_source(tmp_path)
+	dst_path = tmp_path / 'dst' / 'file.png'
+	action, _ = publish_file(src_path, dst_path, PublishMode.LINK)
+	assert action == PublishAction.COPIED
+	assert dst_path.read_bytes() == b'source'
+
+def test_publish_reflink_falls_back_to_copy(
+	tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+	def fail(*args: object) -> None:
+		raise OSError('reflinks not supported')
+
+	monkeypatch.setattr(publish, 'reflink', fail)
+	src_path = make_source(tmp_path)
+	dst_path = tmp_path / 'dst' / 'file.png'
+	action, _ = publish_file(src_path, dst_path, PublishMode.REFLINK)
+	assert action == PublishAction.COPIED
+	assert not dst_path.samefile(src_path)
+
+def test_publish_replaces_linked_destination(tmp_path: Path) -> None:
+	# the destination is a hard link to an old version of the source, which
+	# mustn't be overwritten by the new version
+	old_path = tmp_path / 'old.png'
+	old_path.write_bytes(b'old')
+	dst_path = tmp_path / 'dst' / 'file.png'
+	dst_path.parent.mkdir()
+	os.link(old_path, dst_path)
+
+	src_path = make_source(tmp_path, b'new source')
+	action, _ = publish_file(src_path, dst_path, PublishMode.COPY)
+	assert action == PublishAction.COPIED
+	assert dst_path.read_bytes() == b'new source'
+	assert old_path.read_bytes() == b'old'
+
+def test_publish_files(tmp_path: Path) -> None:
+	src_root = tmp_path / 'src'
+	src_root.mkdir()
+	paths = []
+
+	for i in range(5):
+		src_path = src_root / f'{i}.png'
+		src_path.write_bytes(b'x' * i)
+		paths.append((src_path, tmp_path / 'dst' / f'{i}.png'))
+
+	summary = publish_files(paths, mode=PublishMode.COPY, jobs=2)
+	assert summary.files[PublishAction.COPIED] == 5
+	assert summary.sizes[PublishAction.COPIED] == 10
+
+	summary = publish_files(paths, mode=PublishMode.COPY, jobs=2)
+	assert summary.files[PublishAction.SKIPPED] == 5
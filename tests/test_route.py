@@ -0,0 +1,75 @@
+import apsw
+import pytest
+from rpgxp import db
+from rpgxp.route.Route import int_param, Route, str_param
+
+@pytest.fixture
+def dbh(monkeypatch: pytest.MonkeyPatch) -> apsw.Connection:
+	dbh = apsw.Connection(':memory:')
+
+	dbh.execute('''
+		CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT);
+		INSERT INTO item VALUES (1, 'Potion'), (2, 'Ether'), (10, 'Elixir');
+	''')
+
+	queries = {
+		'view_item': (
+			'SELECT i.id, i.name, upper(i.name) upper_name FROM item i\n'
+			'ORDER BY i.id -- the last line is a comment'
+		),
+		'item_dependencies': (
+			"SELECT i.id, 'name' kind, i.name value FROM item i\n"
+			"UNION ALL SELECT i.id, 'extra', x'00' FROM item i WHERE i.id = 1"
+		),
+	}
+
+	monkeypatch.setattr(db, 'named_query', queries.__getitem__)
+	return dbh
+
+def item_route() -> Route:
+	return Route('item/{id}.html', 'item.j2', 'view_item', {
+		'id': int_param(),
+		'upper_name': str_param(),
+	}, batched=True, dependency_query='item_dependencies')
+
+def test_batched_route_pages(dbh: apsw.Connection) -> None:
+	route = item_route()
+	pages = list(route.iter_batch_args(dbh=dbh))
+	assert [url_args for url_args, _ in pages] == [
+		{'id': '1'}, {'id': '2'}, {'id': '10'}
+	]
+
+	# a single page gets the same arguments as it does from the whole batch
+	for url_args, raw_template_args in pages:
+		assert route.get_template_args(url_args, dbh=dbh) == (
+			route.format_template_args(raw_template_args)
+		)
+
+	assert route.get_template_args({'id': '10'}, dbh=dbh) == {
+		'id': 10, 'upper_name': 'ELIXIR'
+	}
+
+def test_batched_route_missing_page(dbh: apsw.Connection) -> None:
+	with pytest.raises(apsw.ExecutionCompleteError):
+		item_route().get_template_args({'id': '3'}, dbh=dbh)
+
+def test_batched_dependencies(dbh: apsw.Connection) -> None:
+	route = item_route()
+	dependencies = route.batch_dependencies(dbh=dbh)
+
+	assert dependencies == {
+		('1',): [
+			{'kind': 'name', 'value': 'Potion'},
+			{'kind': 'extra', 'value': b'\0'},
+		],
+		('2',): [{'kind': 'name', 'value': 'Ether'}],
+		('10',): [{'kind': 'name', 'value': 'Elixir'}],
+	}
+
+	# a single page gets the same dependencies as it does from the whole batch
+	for (id_,), page_dependencies in dependencies.items():
+		assert route.get_dependencies({'id': id_}, dbh=dbh) == (
+			page_dependencies
+		)
+
+	assert route.get_dependencies({'id': '3'}, dbh=dbh) == []
@@ -0,0 +1,11 @@
+from rpgxp.site.common import highlight
+
+def test_highlight() -> None:
+	assert highlight('the \x02Pokemon\x03 Center') == (
+		'the <mark>Pokemon</mark> Center'
+	)
+
+def test_highlight_escapes() -> None:
+	assert highlight('<b>\x02"Tom & Jerry"\x03</b>') == (
+		'&lt;b&gt;<mark>&#34;Tom &amp; Jerry&#34;</mark>&lt;/b&gt;'
+	)
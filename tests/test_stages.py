@@ -0,0 +1,188 @@
+from pathlib import Path
+import time
+import pytest
+import rpgxp
+from rpgxp.encode import ImagePolicy
+from rpgxp.publish import PublishMode
+from rpgxp.script import run, stages
+from rpgxp.script.stages import (
+	ancestors, RunOptions, Runner, selected_stages, Stage, STAGES_BY_NAME,
+	stage_key, StageError
+)
+
+def names(stages_: list[Stage]) -> list[str]:
+	return [stage.name for stage in stages_]
+
+def test_selected_stages() -> None:
+	assert names(selected_stages({'schema', 'data'})) == [
+		'schema', 'data', 'views.refresh'
+	]
+
+	# views.refresh is implied by data, but views does everything it does
+	assert names(selected_stages({'data', 'views'})) == ['data', 'views']
+	assert names(selected_stages({'maps'})) == ['maps']
+
+	assert names(selected_stages({'static', 'material.static', 'maps'})) == [
+		'static', 'maps'
+	]
+
+	assert names(selected_stages({'site', 'static', 'maps', 'serve'})) == [
+		'site', 'serve'
+	]
+
+def test_ancestors() -> None:
+	assert ancestors(STAGES_BY_NAME['class']) == []
+
+	assert {'data', 'material.data', 'xref', 'search', 'type'} <= set(
+		ancestors(STAGES_BY_NAME['site'])
+	)
+
+def options(image_policy: ImagePolicy=ImagePolicy.PUBLISH) -> RunOptions:
+	return RunOptions(
+		quick=False, jobs=1, publish_mode=PublishMode.AUTO,
+		image_policy=image_policy
+	)
+
+class Graph:
+	"""A chain of fake stages a -> b -> c, together with d, which doesn't
+	come after any of them, recording the order they run in."""
+
+	root: Path
+	calls: list[str]
+	failing: set[str]
+	stages: dict[str, Stage]
+
+	def __init__(self, root: Path) -> None:
+		self.root = root
+		self.calls = []
+		self.failing = set()
+
+		self.stages = {
+			'a': self.stage('a'),
+			'b': self.stage('b', ('a',)),
+			'c': self.stage('c', ('b',)),
+			'd': self.stage('d'),
+		}
+
+	def stage(self, name: str, after: tuple[str, ...]=()) -> Stage:
+		def function(options: RunOptions) -> None:
+			# give a stage which doesn't wait for this one a chance to run
+			time.sleep(0.05)
+
+			if name in self.failing:
+				raise StageError(f'{name} failed')
+
+			self.calls.append(name)
+			self.output_path(name).write_text(name)
+
+		return Stage(
+			name, f'Running {name}...', function, after,
+			inputs=lambda: [self.input_path(name)],
+			outputs=lambda: [self.output_path(name)],
+			options=('image_policy',),
+		)
+
+	def input_path(self, name: str) -> Path:
+		return self.root / f'{name}.in'
+
+	def output_path(self, name: str) -> Path:
+		return self.root / f'{name}.out'
+
+	def run(
+		self, *names: str, force: bool=False,
+		run_options: RunOptions | None=None
+	) -> list[str]:
+
+		self.calls.clear()
+		runner = Runner(
+			run_options or options(), force=force, profile_root=None
+		)
+
+		runner.run_all(
+			[self.stages[name] for name in names], max_workers=len(names)
+		)
+
+		return self.calls
+
+@pytest.fixture
+def graph(
+	tmp_settings: rpgxp._Settings, tmp_path: Path,
+	monkeypatch: pytest.MonkeyPatch
+) -> Graph:
+
+	graph = Graph(tmp_path)
+	monkeypatch.setattr(stages, 'STAGES_BY_NAME', graph.stages)
+
+	for name in graph.stages:
+		graph.input_path(name).write_text(name)
+
+	return graph
+
+def test_stage_key(graph: Graph) -> None:
+	stage = graph.stages['c']
+	key = stage_key(stage, options(), {})
+	assert stage_key(stage, options(), {'d': 'x'}) == key
+	assert stage_key(stage, options(), {'b': 'x'}) != key
+
+	# a stage which c only comes after through b
+	assert stage_key(stage, options(), {'a': 'x'}) != key
+
+	assert stage_key(
+		stage, options(image_policy=ImagePolicy.DEV), {}
+	) != key
+
+	graph.input_path('c').write_text('changed')
+	assert stage_key(stage, options(), {}) != key
+
+def test_runner_skips_up_to_date(graph: Graph) -> None:
+	assert graph.run('a', 'b', 'c') == ['a', 'b', 'c']
+	assert graph.run('a', 'b', 'c') == []
+	assert graph.run('a', 'b', 'c', force=True) == ['a', 'b', 'c']
+
+	graph.output_path('b').unlink()
+	assert graph.run('a', 'b', 'c') == ['b']
+
+	graph.input_path('b').write_text('changed')
+	assert graph.run('a', 'b', 'c') == ['b', 'c']
+
+	run_options = options(image_policy=ImagePolicy.DEV)
+	assert graph.run('a', 'b', 'c', run_options=run_options) == ['a', 'b', 'c']
+
+def test_runner_follows_skipped_stages(graph: Graph) -> None:
+	graph.run('a', 'b', 'c')
+	graph.input_path('a').write_text('changed')
+
+	# c comes after a through b, which isn't being run, so it has to wait for a
+	# and can't be up to date any more
+	assert graph.run('a', 'c') == ['a', 'c']
+	assert graph.run('a', 'c') == []
+
+def test_run_all_failure(graph: Graph) -> None:
+	graph.failing.add('a')
+
+	with pytest.raises(StageError, match='a failed'):
+		graph.run('a', 'b', 'c', 'd')
+
+	# d had already started, so it's allowed to finish
+	assert graph.calls == ['d']
+
+	# a failed, so it's still out of date
+	graph.failing.clear()
+	assert graph.run('a', 'b', 'c', 'd') == ['a', 'b', 'c']
+
+def test_run_exits_on_failure(
+	graph: Graph, monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+	graph.failing.add('a')
+	report_path = graph.root / 'report.json'
+
+	monkeypatch.setattr(
+		stages, 'selected_stages', lambda names: [graph.stages['a']]
+	)
+
+	with pytest.raises(SystemExit) as exc_info:
+		run.run(modules_list=['fk'], quick=False, report_path=report_path)
+
+	assert exc_info.value.code == 1
+	assert report_path.exists()
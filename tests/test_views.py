@@ -0,0 +1,115 @@
+import apsw
+from rpgxp import db
+from rpgxp.views import (
+	create_materialized_view, MATERIALIZED_VIEW_SCHEMA, MaterializedView,
+	parse_views, refresh, source_tables, split_statements, Statement
+)
+
+SCRIPT = '''CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT);
+
+-- materialize: index (id), index ("name", id)
+CREATE VIEW IF NOT EXISTS item_name AS
+SELECT id, name FROM item
+WHERE name != ';';
+
+CREATE VIEW item_count AS SELECT count(*) AS n FROM item_name
+'''
+
+def test_split_statements() -> None:
+	statements = split_statements(SCRIPT)
+	assert len(statements) == 3
+	assert statements[0].startswith('CREATE TABLE item')
+	assert statements[1].startswith('-- materialize:')
+	assert statements[1].endswith("WHERE name != ';';")
+	assert statements[2] == (
+		'CREATE VIEW item_count AS SELECT count(*) AS n FROM item_name'
+	)
+
+def test_split_statements_empty() -> None:
+	assert split_statements('') == split_statements('\n  \n') == []
+
+def test_parse_views() -> None:
+	table, item_name, item_count = parse_views(SCRIPT)
+	assert type(table) is Statement
+	assert type(item_count) is Statement
+	assert isinstance(item_name, MaterializedView)
+	assert item_name.name == 'item_name'
+	assert item_name.indexes == [['id'], ['name', 'id']]
+	assert item_name.table_name == 'item_name__materialized'
+
+	assert item_name.definition_sql().startswith(
+		'-- materialize: index (id), index ("name", id)\n'
+		'CREATE VIEW "item_name__definition" AS\n'
+	)
+
+def test_parse_views_without_indexes() -> None:
+	view, = parse_views('--materialize\nCREATE VIEW v AS SELECT 1;')
+	assert isinstance(view, MaterializedView)
+	assert view.name == 'v'
+	assert view.indexes == []
+
+def test_parse_views_ignores_directive_without_view() -> None:
+	statement, = parse_views('-- materialize\nCREATE TABLE t (x);')
+	assert type(statement) is Statement
+
+def create_views(dbh: apsw.Connection) -> None:
+	dbh.execute(MATERIALIZED_VIEW_SCHEMA)
+
+	for statement in parse_views(SCRIPT):
+		if isinstance(statement, MaterializedView):
+			create_materialized_view(dbh, statement)
+		else:
+			dbh.execute(statement.sql)
+
+def item_names(dbh: apsw.Connection) -> list[tuple[apsw.SQLiteValue, ...]]:
+	return db.fetch_rows('SELECT * FROM item_name ORDER BY id', dbh=dbh)
+
+def test_refresh() -> None:
+	dbh = apsw.Connection(':memory:')
+	create_views(dbh)
+	dbh.execute("INSERT INTO item (id, name) VALUES (1, 'Potion')")
+	db.record_table_digests(dbh, {'item': 'a'})
+	assert refresh(dbh, 'item_name')
+	assert item_names(dbh) == [(1, 'Potion')]
+
+	# the table's contents changed, but not its recorded version
+	dbh.execute("INSERT INTO item (id, name) VALUES (2, 'Ether')")
+	db.record_table_digests(dbh, {'item': 'a'})
+	assert not refresh(dbh, 'item_name')
+	assert item_names(dbh) == [(1, 'Potion')]
+
+	assert refresh(dbh, 'item_name', force=True)
+	assert item_names(dbh) == [(1, 'Potion'), (2, 'Ether')]
+
+	dbh.execute('DELETE FROM item WHERE id = 1')
+	db.record_table_digests(dbh, {'item': 'b'})
+	assert refresh(dbh, 'item_name')
+	assert item_names(dbh) == [(2, 'Ether')]
+
+def test_refresh_without_recorded_version() -> None:
+	dbh = apsw.Connection(':memory:')
+	create_views(dbh)
+	assert refresh(dbh, 'item_name')
+	assert refresh(dbh, 'item_name')
+
+def test_refresh_records_digest() -> None:
+	dbh = apsw.Connection(':memory:')
+	create_views(dbh)
+	db.record_table_digests(dbh, {'item': 'a'})
+	refresh(dbh, 'item_name')
+	table_name = 'item_name__materialized'
+	assert db.table_versions(dbh, [table_name]) == {table_name: 1}
+
+	# refreshing with the same sources leaves the version alone
+	refresh(dbh, 'item_name', force=True)
+	assert db.table_versions(dbh, [table_name]) == {table_name: 1}
+
+	db.record_table_digests(dbh, {'item': 'b'})
+	refresh(dbh, 'item_name')
+	assert db.table_versions(dbh, [table_name]) == {table_name: 2}
+
+def test_source_tables() -> None:
+	dbh = apsw.Connection(':memory:')
+	create_views(dbh)
+	assert source_tables(dbh, 'item_name__definition') == {'item'}
+	assert source_tables(dbh, 'item_count') == {'item_name__materialized'}